@@ -0,0 +1,222 @@
+"""장면을 구간(phase)별로 화면 없이 렌더하며 비용을 측정한다.
+
+    python bench_render.py                                  # 폴더의 모든 장면
+    python bench_render.py 운동량보존.py 가속도법칙.py:NewtonsSecondLaw -q l
+    python bench_render.py -o media/bench/baseline.json     # 기준선 저장
+    python bench_render.py --baseline media/bench/baseline.json --threshold 0.15
+    python bench_render.py 운동량보존.py --set GAS_PHASE=True  # 확장 구간까지 (상수가 있는 장면에만 적용)
+
+구간마다 새 프로세스(spawn)에서 영상 파일을 쓰지 않고 프레임만 그려
+벽시계 시간, 프레임 수, 초당 프레임, 최대 RSS, 최대 mobject 수, 최대 updater 수를 기록한다.
+--baseline을 주면 같은 구간끼리 비교해 느려지거나 메모리가 늘어난 구간을 표시하고
+하나라도 있으면 종료 코드 1을 돌려준다.
+"""
+import argparse
+import ast
+import json
+import multiprocessing
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from manim import config, tempconfig
+
+from phase_render import (QUALITY_FLAGS, load_scene, parse_overrides, phase_label, phase_scene,
+                          quality_signature, scene_phases)
+
+DEFAULT_BENCH_DIR = Path("media") / "bench"
+COMPARED_METRICS = ("wall_s", "peak_rss_mb")
+# 프레임은 그리되 영상·이미지 파일은 쓰지 않는 설정
+HEADLESS_CONFIG = {
+    "write_to_movie": False,
+    "save_last_frame": False,
+    "disable_caching": True,
+    "preview": False,
+    "progress_bar": "none",
+}
+
+
+# ═══════════ 장면 찾기 ═══════════
+
+def find_scenes(scene_file):
+    """파일에서 Scene을 상속한 클래스 이름 (import 없이 AST로)"""
+    tree = ast.parse(Path(scene_file).read_text(encoding="utf-8"))
+    return [
+        node.name for node in tree.body
+        if isinstance(node, ast.ClassDef) and any(
+            isinstance(base, ast.Name) and base.id.endswith("Scene") for base in node.bases)
+    ]
+
+
+def resolve_targets(targets):
+    """["파일.py", "파일.py:Scene", ...] → [(파일, 장면 이름), ...] (비어 있으면 폴더 전체)"""
+    if not targets:
+        here = Path(__file__).resolve().parent
+        targets = [str(p) for p in sorted(here.glob("*.py"))]
+    pairs = []
+    for target in targets:
+        scene_file, _, scene_name = target.partition(":")
+        names = [scene_name] if scene_name else find_scenes(scene_file)
+        pairs.extend((scene_file, name) for name in names)
+    return pairs
+
+
+# ═══════════ 측정 ═══════════
+
+def _peak_rss_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _counting_scene(scene_cls, peaks):
+    """play 앞뒤로 장면의 mobject·updater 수를 재서 peaks에 최댓값을 남기는 서브클래스"""
+
+    def sample(scene):
+        family = scene.get_mobject_family_members()
+        peaks["mobjects"] = max(peaks["mobjects"], len(family))
+        n_updaters = len(scene.updaters) + sum(len(m.updaters) for m in family)
+        peaks["updaters"] = max(peaks["updaters"], n_updaters)
+
+    class CountingScene(scene_cls):
+        def play(self, *args, **kwargs):
+            sample(self)
+            super().play(*args, **kwargs)
+            sample(self)
+
+    CountingScene.__name__ = CountingScene.__qualname__ = scene_cls.__name__
+    return CountingScene
+
+
+def bench_phase(scene_file, scene_name, index, quality="low_quality", overrides=None):
+    """구간 하나를 영상 출력 없이 렌더하고 측정값 dict 반환 (새 프로세스에서 부른다)"""
+    scene_cls = load_scene(scene_file, scene_name, overrides)
+    phase = scene_phases(scene_cls)[index]
+    peaks = {"mobjects": 0, "updaters": 0}
+
+    with tempconfig({"quality": quality, **HEADLESS_CONFIG}):
+        scene = _counting_scene(phase_scene(scene_cls, index), peaks)()
+        start = time.perf_counter()
+        scene.render()
+        wall = time.perf_counter() - start
+        frames = round(scene.renderer.time * config.frame_rate)
+
+    return {
+        "scene": scene_name,
+        "file": Path(scene_file).name,
+        "index": index,
+        "phase": phase_label(phase),
+        "wall_s": round(wall, 3),
+        "frames": frames,
+        "fps": round(frames / wall, 2) if wall > 0 else 0.0,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "mobjects": peaks["mobjects"],
+        "updaters": peaks["updaters"],
+    }
+
+
+def run_benchmark(pairs, quality="low_quality", overrides=None):
+    """모든 (파일, 장면)의 구간을 하나씩 측정 → 결과 dict
+
+    최대 RSS가 구간끼리 섞이지 않도록 구간마다 새 프로세스를 띄우고,
+    시간이 서로 간섭하지 않도록 한 번에 하나씩만 렌더한다.
+    overrides의 클래스 상수는 그 상수가 있는 장면에만 적용한다.
+    """
+    overrides = overrides or {}
+    with tempconfig({"quality": quality}):
+        signature = quality_signature()
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "quality": quality,
+        "signature": signature,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "overrides": overrides,
+        "phases": {},
+    }
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=1, maxtasksperchild=1) as pool:
+        for scene_file, scene_name in pairs:
+            scene_cls = load_scene(scene_file, scene_name)
+            applied = {name: value for name, value in overrides.items() if hasattr(scene_cls, name)}
+            phases = scene_phases(load_scene(scene_file, scene_name, applied))
+            for index, phase in enumerate(phases):
+                row = pool.apply(bench_phase, (str(scene_file), scene_name, index, quality, applied))
+                results["phases"][f"{scene_name}:{phase_label(phase)}"] = row
+                print(f"{scene_name:<30} {index:02d} {row['phase']:<40} "
+                      f"{row['wall_s']:>8.2f}s {row['frames']:>6}f {row['fps']:>7.1f}fps "
+                      f"{row['peak_rss_mb']:>7.1f}MB {row['mobjects']:>5}mob {row['updaters']:>4}upd")
+    return results
+
+
+# ═══════════ 기준선 비교 ═══════════
+
+def compare(results, baseline, threshold=0.10):
+    """baseline보다 threshold 비율 넘게 나빠진 (구간, 지표, 기준값, 현재값) 목록"""
+    regressions = []
+    for key, row in results["phases"].items():
+        base = baseline["phases"].get(key)
+        if base is None:
+            continue
+        for metric in COMPARED_METRICS:
+            if base[metric] > 0 and row[metric] > base[metric] * (1 + threshold):
+                regressions.append((key, metric, base[metric], row[metric]))
+    return regressions
+
+
+def print_comparison(results, baseline, regressions):
+    if baseline.get("signature") != results["signature"]:
+        print(f"[warn] 품질 설정이 다름: {baseline.get('signature')} ↔ {results['signature']}")
+    if baseline.get("overrides", {}) != results["overrides"]:
+        print(f"[warn] --set 상수가 다름: {baseline.get('overrides', {})} ↔ {results['overrides']}")
+    missing = sorted(set(baseline["phases"]) - set(results["phases"]))
+    added = sorted(set(results["phases"]) - set(baseline["phases"]))
+    for key in missing:
+        print(f"[gone] {key}")
+    for key in added:
+        print(f"[new]  {key}")
+    for key in sorted(set(results["phases"]) & set(baseline["phases"])):
+        base, row = baseline["phases"][key], results["phases"][key]
+        if base["frames"] != row["frames"]:
+            print(f"[frames] {key}: {base['frames']} → {row['frames']}")
+    for key, metric, before, after in regressions:
+        print(f"[REGRESSION] {key} {metric}: {before} → {after} (+{(after / before - 1) * 100:.0f}%)")
+    if not regressions:
+        print("회귀 없음")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="장면 구간별 렌더 벤치마크")
+    parser.add_argument("targets", nargs="*", help="파일.py 또는 파일.py:장면이름 (기본: 폴더 전체)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default="l")
+    parser.add_argument("-o", "--output", default=None,
+                        help="결과 JSON 경로 (기본: media/bench/<quality>-<시각>.json)")
+    parser.add_argument("--baseline", default=None, help="비교할 기준선 JSON")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="회귀로 볼 증가 비율 (기본 0.10 = 10%%)")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="장면 클래스 상수 바꾸기 (예: --set GAS_PHASE=True)")
+    args = parser.parse_args(argv)
+
+    quality = QUALITY_FLAGS[args.quality]
+    results = run_benchmark(resolve_targets(args.targets), quality, parse_overrides(args.set))
+
+    output = Path(args.output) if args.output else \
+        DEFAULT_BENCH_DIR / f"{quality}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(output)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        print_comparison(results, baseline, regressions)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
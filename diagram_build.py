@@ -0,0 +1,384 @@
+"""matplotlib 블로그 도식의 그림 등록부와 빌드 CLI
+
+    python diagram_build.py fbd_03_incline torque_05_seesaw
+    python diagram_build.py --list
+    python FBD_그리기.py                    # 그 파일의 그림 전체
+    python 돌림힘_그리기.py torque_05_seesaw
+    python diagram_build.py -j 8 -o build/img   # 전체를 프로세스 풀에서
+    python diagram_build.py --force             # 바뀌지 않은 그림도 다시
+    python diagram_build.py --variants srcset   # PNG 1x/2x/3x + 무손실 WebP + SVG
+
+도식 스크립트는 그림마다 @registry.figure("id", "파일.png")로 빌더 함수를 등록만 하고
+import할 때는 아무것도 그리지 않는다. 요청한 ID의 접두어로 필요한 스크립트만 import해
+그 빌더만 실행하므로, 그림 하나를 다시 만들 때 나머지 그림과 streamlit을 거치지 않는다.
+
+그림이 여러 개면 spawn 프로세스 풀에 하나씩 나눠 Agg 백엔드로 그린다. 파일은 임시 이름으로
+쓴 뒤 os.replace로 바꿔 넣으므로 중간에 멈춰도 반쯤 쓰인 PNG가 남지 않는다.
+출력 폴더는 -o 또는 환경 변수 DIAGRAM_OUTPUT_DIR로 정한다.
+
+빌더 소스, 빌더가 부르는 같은 파일의 보조 함수와 읽는 상수(BLUE, RED 등), rcParams,
+DPI·저장 옵션으로 만든 키를 출력 폴더의 .diagram_manifest.json에 남겨 두고,
+키가 같고 파일이 있는 그림은 그리지도 쓰지도 않는다 (mtime 그대로).
+
+여러 형식·배율을 내보낼 때도 빌더(레이아웃)는 그림마다 한 번만 실행하고, tight 경계 상자도
+한 번 계산해 모든 파일에 그대로 넘긴다. 파일마다 남는 일은 래스터화(또는 SVG 쓰기)뿐이다.
+"""
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import matplotlib
+import matplotlib.pyplot as plt
+
+# 그림 ID 접두어 → 도식 스크립트 모듈
+DIAGRAM_MODULES = {
+    "fbd": "FBD_그리기",
+    "torque": "돌림힘_그리기",
+    "force": "힘과운동_그리기",
+}
+DEFAULT_OUTPUT_DIR = Path(os.environ.get("DIAGRAM_OUTPUT_DIR", Path("media") / "diagrams"))
+MANIFEST_NAME = ".diagram_manifest.json"
+# 내보낼 형식: "형식" 또는 "형식@배율x" (배율은 등록부 DPI의 배수, 1x는 원래 파일 이름)
+DEFAULT_VARIANTS = ("png",)
+SRCSET_VARIANTS = ("png", "png@2x", "png@3x", "webp", "svg")
+
+
+# ═══════════ 형식 ═══════════
+
+def parse_variant(spec):
+    """"png@2x" → ("png", 2)"""
+    fmt, _, scale = spec.partition("@")
+    scale = int(scale.rstrip("x")) if scale else 1
+    if fmt == "svg" and scale != 1:
+        raise ValueError(f"벡터 형식에는 배율을 붙일 수 없음: {spec}")
+    return fmt, scale
+
+
+def variant_filename(filename, spec):
+    """등록된 파일 이름 + 형식 → "이름.png", "이름@2x.png", "이름.webp" ..."""
+    fmt, scale = parse_variant(spec)
+    stem = Path(filename).stem
+    return f"{stem}@{scale}x.{fmt}" if scale != 1 else f"{stem}.{fmt}"
+
+
+def _save_atomic(fig, path, fmt, **kwargs):
+    """임시 이름으로 저장한 뒤 os.replace (중간에 멈춰도 반쯤 쓰인 파일이 남지 않음)"""
+    staged = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        fig.savefig(staged, format=fmt, **kwargs)
+        os.replace(staged, path)
+    finally:
+        staged.unlink(missing_ok=True)
+
+
+# ═══════════ 등록부 ═══════════
+
+class FigureRegistry:
+    """도식 스크립트 하나의 그림 빌더 목록과 공통 스타일
+
+    rc_params는 빌더를 실행하는 동안만 적용하므로 여러 스크립트를 한 프로세스에서 불러도
+    서로의 스타일이 섞이지 않는다. savefig_kw는 그 스크립트의 모든 그림 저장에 쓰인다.
+    """
+
+    def __init__(self, rc_params, dpi=150, **savefig_kw):
+        self.rc_params = dict(rc_params)
+        self.dpi = dpi
+        self.savefig_kw = {"bbox_inches": "tight", **savefig_kw}
+        self.figures = {}
+
+    def figure(self, fig_id, filename=None):
+        """빌더 등록 데코레이터 (빌더는 인자 없이 Figure를 돌려준다)"""
+        def register(builder):
+            self.figures[fig_id] = (builder, filename or f"{fig_id}.png")
+            return builder
+        return register
+
+    def render(self, fig_id):
+        """스타일을 적용한 채로 빌더 실행 → Figure"""
+        builder, _ = self.figures[fig_id]
+        with plt.rc_context(self.rc_params):
+            return builder()
+
+    def files(self, fig_id, variants=DEFAULT_VARIANTS):
+        _, filename = self.figures[fig_id]
+        return [variant_filename(filename, spec) for spec in variants]
+
+    def build(self, fig_id, output_dir=DEFAULT_OUTPUT_DIR, keep=False, variants=DEFAULT_VARIANTS):
+        """그림을 한 번 배치해 variants 형식으로 모두 저장 → (경로 목록, Figure 또는 None)"""
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        kwargs = dict(self.savefig_kw)
+        paths = []
+        with plt.rc_context(self.rc_params):
+            fig = self.render(fig_id)
+            if kwargs.get("bbox_inches") == "tight":
+                # savefig가 파일마다 다시 하는 tight 계산을 기본 DPI에서 한 번만
+                pad = kwargs.pop("pad_inches", plt.rcParams["savefig.pad_inches"])
+                dpi, fig.dpi = fig.dpi, self.dpi
+                kwargs["bbox_inches"] = fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad)
+                fig.dpi = dpi
+            for spec, filename in zip(variants, self.files(fig_id, variants)):
+                fmt, scale = parse_variant(spec)
+                extra = {"pil_kwargs": {"lossless": True}} if fmt == "webp" else {}
+                path = output_dir / filename
+                _save_atomic(fig, path, fmt, dpi=self.dpi * scale, **kwargs, **extra)
+                paths.append(path)
+        if not keep:
+            plt.close(fig)
+            fig = None
+        return paths, fig
+
+
+# ═══════════ 그림 찾기 ═══════════
+
+def load_registry(prefix):
+    """접두어의 도식 스크립트를 import해 등록부 반환 (스크립트 폴더를 sys.path에 추가)"""
+    here = str(Path(__file__).resolve().parent)
+    if here not in sys.path:
+        sys.path.insert(0, here)
+    main_module = sys.modules.get("__main__")
+    registry = getattr(main_module, "registry", None)
+    # 도식 스크립트를 직접 실행한 경우 같은 파일을 한 번 더 import하지 않는다
+    if isinstance(registry, FigureRegistry) and \
+            Path(getattr(main_module, "__file__", "")).stem == DIAGRAM_MODULES[prefix]:
+        return registry
+    return importlib.import_module(DIAGRAM_MODULES[prefix]).registry
+
+
+def resolve_figures(ids=None, registry=None):
+    """["fbd_03_incline", ...] → [(등록부, ID), ...] (비어 있으면 전체 또는 registry 전체)"""
+    if registry is not None:
+        unknown = [fig_id for fig_id in ids or [] if fig_id not in registry.figures]
+        if unknown:
+            raise SystemExit(f"이 스크립트에 없는 그림: {', '.join(unknown)}")
+        return [(registry, fig_id) for fig_id in ids or registry.figures]
+
+    if not ids:
+        return [(reg, fig_id) for reg in map(load_registry, DIAGRAM_MODULES) for fig_id in reg.figures]
+    pairs = []
+    for fig_id in ids:
+        prefix = fig_id.split("_", 1)[0]
+        if prefix not in DIAGRAM_MODULES:
+            raise SystemExit(f"알 수 없는 그림 ID 접두어: {fig_id} (가능: {', '.join(DIAGRAM_MODULES)})")
+        reg = load_registry(prefix)
+        if fig_id not in reg.figures:
+            raise SystemExit(f"등록되지 않은 그림: {fig_id}")
+        pairs.append((reg, fig_id))
+    return pairs
+
+
+# ═══════════ 캐시 키 ═══════════
+
+def _code_names(code):
+    """함수 코드(안쪽 lambda·comprehension 포함)가 전역에서 읽는 이름들"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _code_names(const)
+    return names
+
+
+def _builder_dependencies(builder):
+    """빌더가 (간접적으로) 부르는 같은 모듈 함수와 읽는 모듈 상수 → (함수 목록, {이름: 값})"""
+    module_globals = builder.__globals__
+    functions, constants = [], {}
+    pending = [builder]
+    while pending:
+        func = pending.pop()
+        if func in functions:
+            continue
+        functions.append(func)
+        for name in sorted(_code_names(func.__code__)):
+            if name not in module_globals:
+                continue
+            value = module_globals[name]
+            if inspect.isfunction(value) and value.__module__ == builder.__module__:
+                pending.append(value)
+            elif not (inspect.ismodule(value) or callable(value)):
+                constants[name] = value
+    return functions, constants
+
+
+def figure_key(registry, fig_id, variants=DEFAULT_VARIANTS):
+    """빌더·보조 함수 소스 + 상수 + rcParams + 저장 설정·형식 + matplotlib 버전으로 만든 키"""
+    builder, filename = registry.figures[fig_id]
+    functions, constants = _builder_dependencies(builder)
+    h = hashlib.sha256()
+    h.update(f"{filename}|{matplotlib.__version__}|dpi={registry.dpi}|{','.join(variants)}".encode())
+    h.update(repr(sorted(registry.savefig_kw.items())).encode())
+    h.update(repr(sorted(registry.rc_params.items())).encode())
+    for func in sorted(functions, key=lambda f: f.__name__):
+        h.update(inspect.getsource(func).encode())
+    for name in sorted(constants):
+        h.update(f"{name}={constants[name]!r}".encode())
+    return h.hexdigest()[:16]
+
+
+# ═══════════ 증분 빌드 ═══════════
+
+def load_manifest(output_dir):
+    """출력 폴더의 {그림 ID: {"files", "key"}} (없거나 깨졌으면 빈 dict)"""
+    path = Path(output_dir) / MANIFEST_NAME
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir, manifest):
+    path = Path(output_dir) / MANIFEST_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staged = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    staged.write_text(json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(staged, path)
+
+
+def plan_build(pairs, output_dir, manifest, force=False, variants=DEFAULT_VARIANTS):
+    """키를 비교해 → (다시 그릴 ID, 건너뛸 ID, 새 키 {ID: 항목}, 등록이 사라진 ID)"""
+    todo, skipped, entries = [], [], {}
+    for reg, fig_id in pairs:
+        entry = {"files": reg.files(fig_id, variants), "key": figure_key(reg, fig_id, variants)}
+        entries[fig_id] = entry
+        old = manifest.get(fig_id)
+        if not force and old == entry and all((Path(output_dir) / f).exists() for f in entry["files"]):
+            skipped.append(fig_id)
+        else:
+            todo.append(fig_id)
+
+    # 이번에 본 스크립트에 속하지만 더 이상 등록되지 않은 그림
+    registries = {id(reg): reg for reg, _ in pairs}.values()
+    prefixes = {fig_id.split("_", 1)[0] for reg in registries for fig_id in reg.figures}
+    known = {fig_id for reg in registries for fig_id in reg.figures}
+    stale = sorted(fig_id for fig_id in manifest
+                   if fig_id.split("_", 1)[0] in prefixes and fig_id not in known)
+    return todo, skipped, entries, stale
+
+
+# ═══════════ 빌드 ═══════════
+
+def _use_agg():
+    """화면 없는 래스터 백엔드로 고정 (풀 워커 시작 시)"""
+    matplotlib.use("Agg", force=True)
+
+
+def build_figure(fig_id, output_dir=DEFAULT_OUTPUT_DIR, variants=DEFAULT_VARIANTS):
+    """그림 하나를 빌드 → {"id", "paths", "seconds"} (풀 워커에서 부른다)"""
+    registry = load_registry(fig_id.split("_", 1)[0])
+    start = time.perf_counter()
+    paths, _ = registry.build(fig_id, output_dir, variants=variants)
+    return {"id": fig_id, "paths": [str(p) for p in paths], "seconds": time.perf_counter() - start}
+
+
+def export_figures(fig_ids, output_dir=DEFAULT_OUTPUT_DIR, jobs=None, report=print,
+                   variants=DEFAULT_VARIANTS):
+    """그림들을 프로세스 풀에서 빌드 → 그림별 결과 dict 목록 (요청 순서)
+
+    jobs <= 1이면 현재 프로세스에서 차례로 그린다. 워커는 spawn으로 띄워
+    도식 스크립트를 프로세스마다 새로 import하고 Agg 백엔드를 쓴다.
+    """
+    results = {}
+
+    def done(row):
+        results[row["id"]] = row
+        extra = f" (+{len(row['paths']) - 1})" if len(row["paths"]) > 1 else ""
+        report(f"[built] {row['id']:<28} {row['seconds'] * 1e3:>7.0f} ms  {row['paths'][0]}{extra}")
+
+    jobs = min(jobs or os.cpu_count() or 1, len(fig_ids))
+    if jobs <= 1:
+        for fig_id in fig_ids:
+            done(build_figure(fig_id, output_dir, variants))
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context, initializer=_use_agg) as pool:
+            futures = [pool.submit(build_figure, fig_id, str(output_dir), variants) for fig_id in fig_ids]
+            for future in as_completed(futures):
+                done(future.result())
+    return [results[fig_id] for fig_id in fig_ids]
+
+
+def print_timings(rows, wall):
+    """그림별 시간 (느린 순)과 합계 / 벽시계 시간"""
+    total = sum(row["seconds"] for row in rows)
+    for row in sorted(rows, key=lambda row: row["seconds"], reverse=True):
+        print(f"{row['id']:<28} {row['seconds'] * 1e3:>7.0f} ms {row['seconds'] / (total or 1) * 100:>5.1f}%")
+    print(f"{len(rows)}개 그림: 그림 시간 합계 {total:.2f} s, 벽시계 {wall:.2f} s "
+          f"(x{total / wall if wall > 0 else 0:.1f})")
+
+
+# ═══════════ 실행 ═══════════
+
+def show_in_streamlit(figures):
+    """streamlit run 으로 실행했을 때만 쓰는 미리보기 (streamlit은 여기서만 import)"""
+    import streamlit as st
+
+    for fig in figures:
+        st.pyplot(fig)
+
+
+def main(argv=None, registry=None):
+    parser = argparse.ArgumentParser(description="블로그 도식 빌드")
+    parser.add_argument("ids", nargs="*", help="그림 ID (기본: 전체)")
+    parser.add_argument("-o", "--output-dir", default=str(DEFAULT_OUTPUT_DIR),
+                        help="출력 폴더 (기본: $DIAGRAM_OUTPUT_DIR 또는 media/diagrams)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="동시에 그릴 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--force", action="store_true", help="키가 같은 그림도 다시 그림")
+    parser.add_argument("--variants", default=",".join(DEFAULT_VARIANTS),
+                        help="내보낼 형식 목록 (예: png,png@2x,webp,svg / srcset = "
+                             f"{','.join(SRCSET_VARIANTS)})")
+    parser.add_argument("--list", action="store_true", help="그림 ID 목록만 출력")
+    parser.add_argument("--streamlit", action="store_true",
+                        help="streamlit run ... -- --streamlit 으로 실행할 때 그림을 화면에 표시")
+    args = parser.parse_args(argv)
+
+    pairs = resolve_figures(args.ids, registry)
+    variants = SRCSET_VARIANTS if args.variants == "srcset" else tuple(args.variants.split(","))
+    for spec in variants:
+        parse_variant(spec)
+    if args.list:
+        for reg, fig_id in pairs:
+            print(f"{fig_id:<28} {reg.figures[fig_id][1]}")
+        return
+
+    if args.streamlit:
+        # 미리보기는 Figure를 화면에 넘겨야 하므로 현재 프로세스에서 그린다
+        shown = []
+        for reg, fig_id in pairs:
+            paths, fig = reg.build(fig_id, args.output_dir, keep=True, variants=variants)
+            print(f"[built] {fig_id:<28} {paths[0]}")
+            shown.append(fig)
+        show_in_streamlit(shown)
+        return
+
+    manifest = load_manifest(args.output_dir)
+    todo, skipped, entries, stale = plan_build(pairs, args.output_dir, manifest, args.force, variants)
+    for fig_id in skipped:
+        print(f"[skip]  {fig_id}")
+    for fig_id in stale:
+        print(f"[stale] {fig_id:<28} 등록되지 않은 그림 ({', '.join(manifest[fig_id].get('files', []))})")
+
+    if todo:
+        start = time.perf_counter()
+        rows = export_figures(todo, args.output_dir, args.jobs, variants=variants)
+        print_timings(rows, time.perf_counter() - start)
+
+    # 그린 그림만 새 키로 바꾸고, 사라진 그림은 목록에서 뺀다 (파일은 그대로 둔다)
+    for fig_id in todo:
+        manifest[fig_id] = entries[fig_id]
+    for fig_id in stale:
+        del manifest[fig_id]
+    if todo or stale:
+        save_manifest(args.output_dir, manifest)
+    print(f"built {len(todo)}, skipped {len(skipped)}, stale {len(stale)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""한글 글꼴 찾기 (matplotlib 도식과 manim Text 장면 공용)
+
+    python korean_font.py            # 고른 글꼴 출력
+    python korean_font.py --refresh  # 다시 찾아 저장
+
+'AppleGothic' 같은 고정 이름이나 NanumGothic 고정 경로 대신, 설치된 글꼴 중 한글을 그릴 수 있는
+글꼴을 KOREAN_FONT_CANDIDATES 순서로 한 번 찾아 작업 트리 밖의 노드별 캐시
+(~/.cache/physics_sim/korean_font.json, $XDG_CACHE_HOME 또는 환경 변수 KOREAN_FONT_CACHE로
+변경)에 (이름, 파일 경로)로 남긴다. 절대 경로가 든 노드별 결과이므로 저장소에 넣지 않는다.
+이후 실행은 그 파일이 그대로 있으면 글꼴 목록을 훑지 않고 그 파일 하나만 matplotlib에
+등록한다. 한글 글꼴이 없었다면 설치된 글꼴 파일 목록의 지문을 함께 남겨, 목록이 바뀌면
+다시 찾는다. 모든 노드에서 같은 결과를 내려면 환경 변수 KOREAN_FONT(글꼴 이름 또는 파일
+경로)로 선택을 고정한다.
+
+여기서 저장하는 것은 선택 결과뿐이다. matplotlib font manager의 글꼴 목록 자체는
+matplotlib이 import 때 자기 캐시 폴더(MPLCONFIGDIR)에 만들고 다시 읽으므로, 렌더 노드의
+첫 실행을 줄이려면 MPLCONFIGDIR을 노드 간에 유지되는 폴더로 두면 된다. 그 목록에 없는
+새로 설치된 글꼴 파일은 다시 찾을 때 font manager에 더한다.
+"""
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+
+KOREAN_FONT_CANDIDATES = (
+    "NanumGothic",
+    "Noto Sans CJK KR",
+    "Noto Sans KR",
+    "AppleGothic",
+    "Apple SD Gothic Neo",
+    "Malgun Gothic",
+    "UnDotum",
+    "Baekmuk Gulim",
+)
+FALLBACK_FAMILY = "DejaVu Sans"
+# 모든 글자에 대체 모양을 내주는 글꼴은 한글 글꼴로 치지 않는다
+EXCLUDED_PREFIXES = ("Last Resort",)
+DEFAULT_CACHE_FILE = Path(os.environ.get(
+    "KOREAN_FONT_CACHE",
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "physics_sim" / "korean_font.json"))
+
+_RESOLVED = {}
+
+
+# ═══════════ 찾기 ═══════════
+
+def _has_hangul(path):
+    """글꼴 파일에 '한' 글리프가 있는지"""
+    from matplotlib.ft2font import FT2Font
+
+    try:
+        return FT2Font(str(path)).get_char_index(ord("한")) != 0
+    except (OSError, RuntimeError):
+        return False
+
+
+def _system_fonts():
+    """설치된 글꼴 파일 경로 (정렬)"""
+    from matplotlib import font_manager
+
+    return sorted(font_manager.findSystemFonts())
+
+
+def _fingerprint(paths):
+    """글꼴 파일 목록 지문 (한글 글꼴이 없을 때 새 설치를 알아채는 용도)"""
+    return hashlib.sha256("\n".join(paths).encode()).hexdigest()[:16]
+
+
+def _search():
+    """설치된 글꼴에서 한글 글꼴 찾기 → {"family", "path"} 또는 None (느린 경로, 처음 한 번)"""
+    from matplotlib import font_manager
+
+    # matplotlib 글꼴 목록 캐시가 만들어진 뒤에 설치된 파일도 후보에 넣는다
+    known = {entry.fname for entry in font_manager.fontManager.ttflist}
+    for path in _system_fonts():
+        if path not in known:
+            try:
+                font_manager.fontManager.addfont(path)
+            except (OSError, RuntimeError, ValueError):
+                pass
+
+    override = os.environ.get("KOREAN_FONT")
+    if override and Path(override).is_file():
+        font_manager.fontManager.addfont(override)
+        return {"family": font_manager.FontProperties(fname=override).get_name(), "path": override}
+
+    by_name = {}
+    for entry in sorted(font_manager.fontManager.ttflist, key=lambda e: (e.name, e.fname)):
+        by_name.setdefault(entry.name, []).append(entry.fname)
+    candidates = [override] if override else []
+    candidates += [name for name in KOREAN_FONT_CANDIDATES if name not in candidates]
+    for name in candidates:
+        for path in by_name.get(name, []):
+            if _has_hangul(path):
+                return {"family": name, "path": path}
+    # 후보가 하나도 없으면 이름 순으로 첫 한글 글꼴 (노드마다 같은 순서)
+    for name, paths in sorted(by_name.items()):
+        if name.startswith(EXCLUDED_PREFIXES):
+            continue
+        for path in paths:
+            if _has_hangul(path):
+                return {"family": name, "path": path}
+    return None
+
+
+def resolve_korean_font(cache_file=DEFAULT_CACHE_FILE, refresh=False):
+    """한글 글꼴 {"family", "path"} (없으면 None) — 메모리 → 저장 파일 → 글꼴 목록 순
+
+    고른 글꼴 파일은 matplotlib font manager에 등록해 두므로 이름으로 바로 찾힌다.
+    """
+    cache_file = Path(cache_file)
+    key = str(cache_file.resolve())
+    if not refresh and key in _RESOLVED:
+        return _RESOLVED[key]
+
+    font = None
+    if not refresh:
+        try:
+            saved = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            saved = None
+        if not saved or saved.get("override") != os.environ.get("KOREAN_FONT"):
+            refresh = True
+        elif saved["font"] is not None and Path(saved["font"]["path"]).is_file():
+            from matplotlib import font_manager
+
+            font = saved["font"]
+            font_manager.fontManager.addfont(font["path"])
+        # 없다고 저장된 경우는 그 뒤 글꼴이 설치됐는지 목록 지문으로 확인
+        elif saved["font"] is not None or saved.get("fonts") != _fingerprint(_system_fonts()):
+            refresh = True
+    if refresh:
+        font = _search()
+        record = {"override": os.environ.get("KOREAN_FONT"), "font": font}
+        if font is None:
+            record["fonts"] = _fingerprint(_system_fonts())
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        staged = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        staged.write_text(json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(staged, cache_file)
+
+    _RESOLVED[key] = font
+    return font
+
+
+# ═══════════ 적용 ═══════════
+
+def korean_font_family():
+    """고른 한글 글꼴 이름 (없으면 None)"""
+    font = resolve_korean_font()
+    return font["family"] if font else None
+
+
+def matplotlib_font_rc():
+    """도식 스크립트 RC_PARAMS에 펼쳐 넣을 글꼴 설정 (한글 글꼴 → 없는 글리프는 DejaVu Sans)"""
+    family = korean_font_family()
+    return {"font.family": [family, FALLBACK_FAMILY] if family else [FALLBACK_FAMILY]}
+
+
+def korean_font_properties():
+    """fontproperties=로 넘길 FontProperties (한글 글꼴 파일, 없으면 기본 글꼴)"""
+    from matplotlib.font_manager import FontProperties
+
+    font = resolve_korean_font()
+    return FontProperties(fname=font["path"]) if font else FontProperties(family=FALLBACK_FAMILY)
+
+
+def use_korean_font_in_manim():
+    """manim Text / MarkupText의 기본 글꼴을 한글 글꼴로 (없으면 Pango 기본값 그대로)
+
+    KOREAN_FONT로 준 파일처럼 시스템에 설치되지 않은 글꼴도 Pango가 찾도록 고른 파일을
+    manimpango에 등록한다. 장면 모듈에서 부른다.
+    """
+    import manimpango
+    from manim import MarkupText, Text
+
+    font = resolve_korean_font()
+    family = font["family"] if font else None
+    if family:
+        manimpango.register_font(font["path"])
+        Text.set_default(font=family)
+        MarkupText.set_default(font=family)
+    return family
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="한글 글꼴 찾기")
+    parser.add_argument("--refresh", action="store_true", help="저장된 선택을 무시하고 다시 찾기")
+    parser.add_argument("--cache-file", default=str(DEFAULT_CACHE_FILE))
+    args = parser.parse_args(argv)
+
+    font = resolve_korean_font(args.cache_file, refresh=args.refresh)
+    print(f"{font['family']}  {font['path']}" if font else "한글 글꼴 없음 (DejaVu Sans 사용)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+"""장면을 clear_screen() 단위 구간(phase)으로 나눠 렌더하고 구간 영상을 캐시한다.
+
+    python phase_render.py 운동량보존.py MomentumConservation -q l -j 8
+    python phase_render.py 운동량보존.py MomentumConservation --set GAS_PHASE=True
+
+--set NAME=VALUE는 장면 클래스 상수를 이번 렌더에서만 바꾼다 (확장 구간 켜기, 일괄 시행 수 등).
+바뀐 값은 그 상수를 읽는 구간의 캐시 키에 들어간다.
+
+각 구간은 빈 화면에서 시작하므로 프로세스 풀에서 동시에 렌더할 수 있다.
+
+구간 메서드 소스, 그 메서드가 읽는 클래스 상수, 품질 설정, 장면 모듈의 나머지 코드,
+(간접적으로) import한 같은 폴더 보조 모듈이 바뀌지 않은 구간은 이전에 인코딩한 영상을
+그대로 재사용하고, 바뀐 구간만 다시 렌더한다.
+"""
+import argparse
+import ast
+import glob
+import hashlib
+import multiprocessing
+import importlib.util
+import inspect
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from korean_font import korean_font_family
+
+QUALITY_FLAGS = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+DEFAULT_CACHE_DIR = Path("media") / "phase_cache"
+DEFAULT_OUTPUT_DIR = Path("media") / "phases"
+
+
+# ═══════════ 장면 / 구간 ═══════════
+
+def parse_overrides(items):
+    """["NAME=VALUE", ...] → {NAME: 값} (값은 파이썬 리터럴, 아니면 문자열)"""
+    overrides = {}
+    for item in items or ():
+        name, sep, value = item.partition("=")
+        if not sep or not name.isupper():
+            raise ValueError(f"--set은 대문자 클래스 상수 NAME=VALUE 형식이어야 한다: {item!r}")
+        try:
+            overrides[name] = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            overrides[name] = value
+    return overrides
+
+
+def load_scene(scene_file, scene_name, overrides=None):
+    """파일 경로로 모듈을 읽어 Scene 클래스 반환 (overrides의 클래스 상수를 덮어씀)"""
+    scene_file = Path(scene_file).resolve()
+    if str(scene_file.parent) not in sys.path:
+        sys.path.insert(0, str(scene_file.parent))
+    module_name = scene_file.stem
+    if module_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(module_name, scene_file)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    scene_cls = getattr(sys.modules[module_name], scene_name)
+    for name, value in (overrides or {}).items():
+        if not hasattr(scene_cls, name):
+            raise ValueError(f"{scene_name}에 클래스 상수 {name}이 없다")
+        setattr(scene_cls, name, value)
+    return scene_cls
+
+
+def _method_tree(func):
+    return ast.parse(textwrap.dedent(inspect.getsource(func)))
+
+
+def scene_phases(scene_cls, include_disabled=False):
+    """construct의 self.xxx() 호출을 clear_screen() 기준으로 묶은 구간 목록
+
+    예) [["intro"], ["phase1_momentum_concept"], ...]
+
+    `if self.GAS_PHASE:`처럼 클래스 상수로 켜고 끄는 블록은 그 값에 따라 따라 들어간다
+    (include_disabled=True면 꺼진 쪽 구간도 포함).
+    """
+    func = _method_tree(scene_cls.construct).body[0]
+    phases, current = [], []
+    for stmt in _construct_statements(scene_cls, func.body, include_disabled):
+        if not (isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call)):
+            continue
+        target = stmt.value.func
+        if not (isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name)
+                and target.value.id == "self"):
+            continue
+        if target.attr == "clear_screen":
+            if current:
+                phases.append(current)
+            current = []
+        else:
+            current.append(target.attr)
+    if current:
+        phases.append(current)
+    return phases
+
+
+def _construct_statements(scene_cls, body, include_disabled=False):
+    """construct 문장을 순서대로 (self.상수 조건 블록은 켜진 쪽만 펼침)"""
+    for stmt in body:
+        test = getattr(stmt, "test", None)
+        if isinstance(stmt, ast.If) and isinstance(test, ast.Attribute) \
+                and isinstance(test.value, ast.Name) and test.value.id == "self":
+            if include_disabled:
+                branch = stmt.body + stmt.orelse
+            else:
+                branch = stmt.body if getattr(scene_cls, test.attr) else stmt.orelse
+            yield from _construct_statements(scene_cls, branch, include_disabled)
+        else:
+            yield stmt
+
+
+def phase_label(phase):
+    return "+".join(phase)
+
+
+def phase_scene(scene_cls, index):
+    """index번째 구간(+ 뒤따르는 clear_screen)만 렌더하는 Scene 서브클래스
+
+    다른 구간의 메서드는 no-op으로 바꾸고 construct는 원본 그대로 실행하므로,
+    construct 안의 사전 계산(self.exp_a = ... 등)은 모든 구간에서 동일하게 수행된다.
+    """
+    phases = scene_phases(scene_cls)
+    target = set(phases[index])
+    names = {name for phase in phases for name in phase}
+
+    class PhaseScene(scene_cls):
+        def construct(self):
+            state = {"active": False}
+
+            def wrap(name):
+                original = getattr(self, name)
+                if name in target:
+                    def run(*args, **kwargs):
+                        state["active"] = True
+                        return original(*args, **kwargs)
+                else:
+                    def run(*args, **kwargs):
+                        state["active"] = False
+                return run
+
+            for name in names:
+                setattr(self, name, wrap(name))
+
+            original_clear = self.clear_screen
+
+            def clear_screen():
+                if state["active"]:
+                    original_clear()
+                    state["active"] = False
+
+            self.clear_screen = clear_screen
+            scene_cls.construct(self)
+
+    PhaseScene.__name__ = PhaseScene.__qualname__ = f"{scene_cls.__name__}_{index:02d}"
+    return PhaseScene
+
+
+# ═══════════ 캐시 키 ═══════════
+
+def _self_references(func):
+    """메서드 소스에서 self.NAME 으로 참조하는 이름들"""
+    return {
+        node.attr for node in ast.walk(_method_tree(func))
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+        and node.value.id == "self"
+    }
+
+
+def _phase_dependencies(scene_cls, phase):
+    """구간이 (간접적으로) 호출하는 장면 메서드와 읽는 클래스 상수
+
+    construct도 포함하되, construct가 부르는 다른 구간의 메서드는 따라가지 않는다.
+    """
+    others = {name for p in scene_phases(scene_cls, include_disabled=True) for name in p} - set(phase)
+    methods, constants = set(), set()
+    pending = list(phase) + ["construct", "clear_screen"]
+    while pending:
+        name = pending.pop()
+        if name in methods or name in others:
+            continue
+        func = getattr(scene_cls, name, None)
+        if not inspect.isfunction(func):
+            continue
+        methods.add(name)
+        for ref in _self_references(func):
+            attr = getattr(scene_cls, ref, None)
+            if ref.isupper() and attr is not None and not callable(attr):
+                constants.add(ref)
+            elif inspect.isfunction(attr) and attr.__module__ == scene_cls.__module__:
+                pending.append(ref)
+    return sorted(methods), sorted(constants)
+
+
+def _helper_module_files(scene_cls):
+    """장면 모듈이 (간접적으로) import한 같은 폴더의 보조 모듈 파일
+
+    sim_mobjects → tex_cache, korean_font, sim_physics처럼 보조 모듈이 다시 import한
+    모듈도 따라가므로, 어느 단계에서 바뀌어도 캐시 키가 달라진다.
+    """
+    scene_file = Path(sys.modules[scene_cls.__module__].__file__).resolve()
+    scene_dir = scene_file.parent
+    files, pending = set(), [scene_file]
+    while pending:
+        tree = ast.parse(pending.pop().read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                path = scene_dir / f"{name.split('.')[0]}.py"
+                if path.is_file() and path not in files and path != scene_file:
+                    files.add(path)
+                    pending.append(path)
+    return sorted(files)
+
+
+def _scene_module_source(scene_cls, phase):
+    """장면 모듈 전체 소스 (다른 구간 메서드 본문만 비움)
+
+    모듈 수준 함수·상수·import와 클래스 본문도 키에 들어가지만, 다른 구간만 고친
+    경우에는 이 구간의 키가 그대로다.
+    """
+    module = sys.modules[scene_cls.__module__]
+    lines = Path(module.__file__).read_text(encoding="utf-8").splitlines()
+    methods, _ = _phase_dependencies(scene_cls, phase)
+    others = {name for p in scene_phases(scene_cls, include_disabled=True) for name in p} - set(methods)
+    for name in others:
+        func = getattr(scene_cls, name, None)
+        if not inspect.isfunction(func) or func.__module__ != module.__name__:
+            continue
+        body, start = inspect.getsourcelines(func)
+        lines[start - 1:start - 1 + len(body)] = [""] * len(body)
+    return "\n".join(lines)
+
+
+def quality_signature():
+    """현재 config의 출력 품질 설정 (+ Text에 쓰이는 한글 글꼴)"""
+    from manim import __version__ as MANIM_VERSION
+    from manim import config
+
+    return (f"{config.pixel_width}x{config.pixel_height}@{config.frame_rate}"
+            f"/{config.renderer}/{config.background_color}/manim-{MANIM_VERSION}"
+            f"/font-{korean_font_family()}")
+
+
+def phase_key(scene_cls, phase):
+    """구간 소스 + 사용 상수 + 품질 설정 + 장면 모듈 소스 + 보조 모듈로 만든 캐시 키"""
+    methods, constants = _phase_dependencies(scene_cls, phase)
+    h = hashlib.sha256()
+    h.update(quality_signature().encode())
+    for name in methods:
+        h.update(inspect.getsource(getattr(scene_cls, name)).encode())
+    for name in constants:
+        h.update(f"{name}={getattr(scene_cls, name)!r}".encode())
+    h.update(_scene_module_source(scene_cls, phase).encode())
+    for path in _helper_module_files(scene_cls):
+        h.update(path.read_bytes())
+    return h.hexdigest()[:16]
+
+
+# ═══════════ 렌더 / 이어 붙이기 ═══════════
+
+def segment_prefix(scene_name, quality, phase):
+    """구간 영상 파일 이름 앞부분 — 장면·품질·구간 메서드가 같은 파일끼리만 서로 대체한다
+
+    구간 번호 대신 메서드 이름을 쓰므로 구간을 끼워 넣어도 다른 구간의 영상을 지우지 않는다.
+    """
+    return f"{scene_name}.{quality}.{phase_label(phase)}"
+
+
+def remove_stale_segments(cache_dir, prefix, keep):
+    """같은 prefix의 이전 키 영상 삭제 (keep은 남김)"""
+    for stale in Path(cache_dir).glob(f"{glob.escape(prefix)}.*.mp4"):
+        if stale != keep:
+            stale.unlink()
+
+
+def render_phase(scene_file, scene_name, index, quality="low_quality", cache_dir=DEFAULT_CACHE_DIR,
+                 overrides=None):
+    """구간 하나를 렌더 (캐시 적중 시 건너뜀) → (영상 경로, 새로 렌더했는지)"""
+    from manim import tempconfig
+
+    scene_cls = load_scene(scene_file, scene_name, overrides)
+    phase = scene_phases(scene_cls)[index]
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    with tempconfig({"quality": quality}):
+        prefix = segment_prefix(scene_name, quality, phase)
+        cached = cache_dir / f"{prefix}.{phase_key(scene_cls, phase)}.mp4"
+        if cached.exists():
+            return cached, False
+
+        with tempfile.TemporaryDirectory() as tmp, tempconfig({
+            "video_dir": tmp,
+            "partial_movie_dir": str(Path(tmp) / "partial"),
+            "write_to_movie": True,
+            "disable_caching": True,
+            "preview": False,
+        }):
+            scene = phase_scene(scene_cls, index)()
+            scene.render()
+            staged = cached.with_name(f".{cached.name}.tmp")
+            shutil.move(scene.renderer.file_writer.movie_file_path, staged)
+            os.replace(staged, cached)
+
+    remove_stale_segments(cache_dir, prefix, cached)
+    return cached, True
+
+
+def concat_segments(paths, output):
+    """구간 영상들을 재인코딩 없이 하나로 이어 붙임 (concat demuxer + 패킷 remux)"""
+    import av
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    staged = output.with_name(f".{output.name}.tmp{output.suffix}")
+    with tempfile.TemporaryDirectory() as tmp:
+        listing = Path(tmp) / "segments.txt"
+        listing.write_text("".join(
+            "file '{}'\n".format(Path(p).resolve().as_posix().replace("'", r"'\''"))
+            for p in paths
+        ), encoding="utf-8")
+        with av.open(str(listing), format="concat", options={"safe": "0"}) as src, \
+                av.open(str(staged), mode="w") as dst:
+            src_stream = src.streams.video[0]
+            if hasattr(dst, "add_stream_from_template"):
+                dst_stream = dst.add_stream_from_template(src_stream)
+            else:
+                dst_stream = dst.add_stream(template=src_stream)
+            for packet in src.demux(src_stream):
+                if packet.dts is None:
+                    continue
+                packet.stream = dst_stream
+                dst.mux(packet)
+    os.replace(staged, output)
+    return output
+
+
+def render_scene(scene_file, scene_name, quality="low_quality",
+                 cache_dir=DEFAULT_CACHE_DIR, output=None, jobs=1, overrides=None):
+    """모든 구간을 (캐시를 활용해) 렌더한 뒤 하나의 영상으로 합침
+
+    jobs > 1이면 구간들을 프로세스 풀에서 동시에 렌더한다. 워커는 spawn으로 띄워
+    manim config와 장면 모듈을 프로세스마다 새로 읽는다.
+    """
+    phases = scene_phases(load_scene(scene_file, scene_name, overrides))
+    if output is None:
+        output = DEFAULT_OUTPUT_DIR / quality / f"{scene_name}.mp4"
+
+    def report(index, rendered):
+        print(f"[{'render' if rendered else 'cached'}] {index:02d} {phase_label(phases[index])}")
+
+    segments = [None] * len(phases)
+    jobs = min(jobs or os.cpu_count() or 1, len(phases))
+    if jobs <= 1:
+        for index in range(len(phases)):
+            segments[index], rendered = render_phase(scene_file, scene_name, index, quality, cache_dir,
+                                                     overrides)
+            report(index, rendered)
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+            futures = {
+                pool.submit(render_phase, str(scene_file), scene_name, index, quality, str(cache_dir),
+                            overrides): index
+                for index in range(len(phases))
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                segments[index], rendered = future.result()
+                report(index, rendered)
+    return concat_segments(segments, output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="구간 캐시를 사용하는 장면 렌더러")
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default="l")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR))
+    parser.add_argument("-o", "--output", default=None)
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="동시에 렌더할 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="장면 클래스 상수 바꾸기 (예: --set GAS_PHASE=True --set SWEEP_TRIALS=24)")
+    parser.add_argument("--list", action="store_true", help="구간 목록만 출력")
+    args = parser.parse_args(argv)
+    overrides = parse_overrides(args.set)
+
+    if args.list:
+        for index, phase in enumerate(scene_phases(load_scene(args.scene_file, args.scene_name, overrides))):
+            print(f"{index:02d} {phase_label(phase)}")
+        return
+
+    out = render_scene(args.scene_file, args.scene_name, QUALITY_FLAGS[args.quality],
+                       args.cache_dir, args.output, args.jobs, overrides)
+    print(out)
+
+
+if __name__ == "__main__":
+    main()
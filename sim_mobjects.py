@@ -0,0 +1,405 @@
+from itertools import zip_longest
+
+from manim import *
+import numpy as np
+
+from tex_cache import load_glyphs
+
+
+# ═══════════ 그래프 곡선 ═══════════
+
+class TracedCurve(VMobject):
+    """tracker 값까지 func(t)를 따라 그려지는 그래프 곡선
+
+    always_redraw(lambda: axes.plot(func, x_range=[0, t]))는 매 프레임 0부터
+    곡선 전체를 다시 샘플링한다. TracedCurve는 새로 지나간 구간의 샘플만
+    미리 잡아 둔 점 버퍼 뒤에 이어 붙이므로 프레임당 비용이 t와 무관하다.
+    """
+
+    def __init__(self, axes, func, tracker, x_range=None, dt=0.02, **kwargs):
+        super().__init__(**kwargs)
+        if x_range is None:
+            x_range = axes.x_range[:2]
+        self.axes = axes
+        self.func = func
+        self.tracker = tracker
+        self.x_min, self.x_max = float(x_range[0]), float(x_range[1])
+        self.dt = dt
+
+        n_grid = int(np.ceil((self.x_max - self.x_min) / dt)) + 1
+        nppc = self.n_points_per_cubic_curve
+        self._anchors = np.zeros((n_grid, 3))
+        # 확정 구간(n_grid - 1개) + 진행 중인 마지막 조각 1개
+        self._buffer = np.zeros((nppc * n_grid, 3))
+        self._n_done = 0   # 확정된 격자 샘플 수
+        self._alphas = np.linspace(0, 1, nppc).reshape(1, nppc, 1)
+
+        self.add_updater(lambda m: m.trace_to(m.tracker.get_value()))
+        self.trace_to(tracker.get_value())
+
+    def _point(self, t):
+        return self.axes.c2p(t, self.func(t))
+
+    def _write_segments(self, i0, i1):
+        """앵커 i0..i1 사이 직선 구간을 버퍼에 기록"""
+        nppc = self.n_points_per_cubic_curve
+        a = self._anchors[i0:i1][:, None, :]
+        b = self._anchors[i0 + 1:i1 + 1][:, None, :]
+        self._buffer[nppc * i0:nppc * i1] = (a + (b - a) * self._alphas).reshape(-1, 3)
+
+    def trace_to(self, t):
+        """곡선을 t까지 그린 상태로 맞춤 (새 샘플만 계산)"""
+        nppc = self.n_points_per_cubic_curve
+        t = min(max(t, self.x_min), self.x_max)
+        k = int((t - self.x_min) / self.dt + 1e-9)
+        n = min(k + 1, len(self._anchors))
+
+        if n > self._n_done:
+            for i in range(self._n_done, n):
+                self._anchors[i] = self._point(self.x_min + i * self.dt)
+            if n > 1:
+                self._write_segments(max(self._n_done - 1, 0), n - 1)
+        self._n_done = n
+
+        n_seg = n - 1
+        head_t = self.x_min + (n - 1) * self.dt
+        if t - head_t > 1e-9:
+            a = self._anchors[n - 1]
+            b = self._point(t)
+            self._buffer[nppc * n_seg:nppc * (n_seg + 1)] = a + (b - a) * self._alphas[0]
+            n_seg += 1
+        self.points = self._buffer[:nppc * n_seg]
+        return self
+
+    def freeze(self):
+        """x_max까지 그린 뒤 updater를 떼어 정적 곡선으로 고정 → self 반환"""
+        self.clear_updaters()
+        self.trace_to(self.x_max)
+        self.points = self.points.copy()
+        self.func = None
+        self.tracker = None
+        self._anchors = None
+        self._buffer = None
+        return self
+
+
+def sampled_graph(axes, x, y, **kwargs):
+    """미리 계산한 (x, y) 표본을 잇는 그래프 곡선 (axes.plot처럼 함수를 다시 부르지 않음)"""
+    points = [axes.c2p(a, b) for a, b in zip(x, y)]
+    return VMobject(**kwargs).set_points_as_corners(points)
+
+
+def sampled_area(axes, x, y, color=WHITE, opacity=0.3):
+    """(x, y) 표본 곡선과 x축 사이 영역 (axes.get_area와 같은 모양)"""
+    points = [axes.c2p(x[0], 0), *[axes.c2p(a, b) for a, b in zip(x, y)], axes.c2p(x[-1], 0)]
+    return Polygon(*points, color=color, fill_opacity=opacity, stroke_width=0)
+
+
+class SweptArea(VMobject):
+    """(x, y) 표본 곡선과 x축 사이를 오른쪽 끝 x까지 칠한 영역 (충격량 넓이 등)
+
+    always_redraw(lambda: axes.get_area(graph, x_range=[a, x]))는 매 프레임 곡선을
+    다시 샘플링해 다각형을 새로 만든다. SweptArea는 꼭짓점과 사다리꼴 누적 적분을
+    처음에 한 번 계산해 두고, set_right(x)에서 오른쪽 끝 세 변만 다시 쓴다.
+    넓이와 value는 같은 꺾은선에서 나오므로 sampled_graph로 그린 곡선과 정확히 맞는다.
+    """
+
+    def __init__(self, axes, x, y, color=WHITE, opacity=0.3, **kwargs):
+        super().__init__(fill_color=color, fill_opacity=opacity, stroke_width=0, **kwargs)
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.cumulative = np.concatenate([[0.0], np.cumsum((self.y[1:] + self.y[:-1]) / 2 * np.diff(self.x))])
+        self.total = self.cumulative[-1]
+        self.value = 0.0
+
+        top = c2p_array(axes, self.x, self.y)
+        self._top = top
+        self._base = c2p_array(axes, self.x, 0.0)
+        nppc = self.n_points_per_cubic_curve
+        self._alphas = np.linspace(0, 1, nppc).reshape(1, nppc, 1)
+        # 고정 변: 왼쪽 세로변 + 곡선 꺾은선 (오른쪽 끝 세 변은 꼬리 자리에 매번 씀)
+        corners = np.vstack([self._base[:1], top])
+        self._fixed = self._segments(corners)
+        self._buffer = np.vstack([self._fixed, np.zeros((3 * nppc, 3))])
+        self._tail = len(self._fixed)   # 꼬리 세 변이 시작하는 위치
+        self.set_right(self.x[0])
+
+    def _segments(self, corners):
+        a, b = corners[:-1, None, :], corners[1:, None, :]
+        return (a + (b - a) * self._alphas).reshape(-1, 3)
+
+    def set_right(self, x):
+        """오른쪽 끝을 x로 옮기고 value를 그 지점까지의 적분으로 → self 반환"""
+        nppc = self.n_points_per_cubic_curve
+        x = min(max(x, self.x[0]), self.x[-1])
+        k = min(int(np.searchsorted(self.x, x, side="right")) - 1, len(self.x) - 2)
+        w = (x - self.x[k]) / (self.x[k + 1] - self.x[k])
+        y = self.y[k] + w * (self.y[k + 1] - self.y[k])
+        self.value = self.cumulative[k] + (x - self.x[k]) * (self.y[k] + y) / 2
+
+        head = self._top[k] + w * (self._top[k + 1] - self._top[k])
+        foot = self._base[k] + w * (self._base[k + 1] - self._base[k])
+        start = nppc * (k + 1)
+        # 지난 프레임 꼬리가 덮어쓴 고정 변 복원
+        if self._tail < start:
+            self._buffer[self._tail:start] = self._fixed[self._tail:start]
+        self._buffer[start:start + 3 * nppc] = self._segments(
+            np.array([self._top[k], head, foot, self._base[0]]))
+        self._tail = start
+        self.points = self._buffer[:start + 3 * nppc]
+        return self
+
+
+def c2p_array(axes, x, y):
+    """선형 축의 c2p를 배열 전체에 한 번에 적용 → (n, 3) 점 배열"""
+    origin = axes.c2p(0, 0)
+    ex, ey = axes.c2p(1, 0) - origin, axes.c2p(0, 1) - origin
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    return origin + x[:, None] * ex + y[:, None] * ey
+
+
+# ═══════════ 숫자 라벨 ═══════════
+
+class NumericLabel(VGroup):
+    """prefix + 숫자 + suffix 형태의 TeX 라벨 (값이 바뀌어도 LaTeX를 다시 부르지 않음)
+
+    prefix·suffix와 숫자 글리프(-, 0~9, .)는 처음 한 번만 컴파일해 두고,
+    set_value는 캐시된 글리프 점 배열을 복사해 자리에 배치하기만 한다.
+    always_redraw(lambda: MathTex(f"v = {x:.1f}")) 대신
+    label.add_updater(lambda m: m.set_value(x).next_to(...))로 쓴다.
+    숫자를 놓을 펜 위치는 보이지 않는 기준점(anchor)에서 읽으므로 부모 그룹 이동이나
+    .animate로 옮겨도 따라가지만, 생성 후 scale은 지원하지 않는다.
+    """
+
+    NUMBER_TEMPLATE = "-0123456789.0"
+
+    def __init__(self, prefix="", value=0.0, decimals=1, suffix="", max_chars=8,
+                 int_if_whole=False, font_size=DEFAULT_FONT_SIZE, color=WHITE, **kwargs):
+        super().__init__(**kwargs)
+        self.decimals = decimals
+        self.int_if_whole = int_if_whole
+        self.value = value
+
+        # prefix·숫자 템플릿·suffix를 한 문자열로 컴파일해 간격과 기준선을 그대로 얻는다
+        scale = font_size / DEFAULT_FONT_SIZE
+        full = " ".join(part for part in (prefix, self.NUMBER_TEMPLATE, suffix) if part)
+        glyphs = [g * scale for g in load_glyphs(full)]
+        n_pre = len(load_glyphs(prefix)) if prefix else 0
+        n_num = len(self.NUMBER_TEMPLATE)
+        pre, num, suf = glyphs[:n_pre], glyphs[n_pre:n_pre + n_num], glyphs[n_pre + n_num:]
+
+        lefts = [g[:, 0].min() for g in num]
+        digit_adv = (lefts[10] - lefts[1]) / 9
+        pens = [lefts[0]] + [lefts[1] + k * digit_adv for k in range(11)] + [lefts[12]]
+        chars = list(self.NUMBER_TEMPLATE[:12])
+        self._start = pens[0]
+        self._glyphs = {ch: num[i] - [pens[i], 0, 0] for i, ch in enumerate(chars)}
+        self._advance = {ch: pens[i + 1] - pens[i] for i, ch in enumerate(chars)}
+        self._advance.update({str(k): digit_adv for k in range(10)})
+        end_pen = lefts[12] + digit_adv
+        self._suffix_glyphs = [g - [end_pen, 0, 0] for g in suf]
+
+        # 숫자 시작 펜 위치를 표시하는 보이지 않는 점 (글리프 높이 가운데에 두어 경계 상자를 넓히지 않음)
+        y_mid = (min(g[:, 1].min() for g in num) + max(g[:, 1].max() for g in num)) / 2
+        self._anchor_offset = np.array([0.0, y_mid, 0.0])
+        self.anchor = VectorizedPoint([self._start, y_mid, 0.0])
+
+        self.prefix = VGroup(*[VMobject().set_points(g) for g in pre])
+        self.slots = VGroup(*[VMobject() for _ in range(max_chars)])
+        self.suffix = VGroup(*[VMobject() for _ in suf])
+        self.add(self.prefix, self.slots, self.suffix)
+        self.set_style(stroke_width=0, fill_opacity=1.0)
+        self.set_color(color)
+        self.add(self.anchor)
+        self.set_value(value)
+        self.center()
+
+    def set_value(self, value):
+        """값을 바꾸고 글리프를 다시 배치 → self 반환"""
+        if self.int_if_whole and value == int(value):
+            text = str(int(value))
+        else:
+            text = f"{value:.{self.decimals}f}"
+        if len(text) > len(self.slots):
+            raise ValueError(f"NumericLabel: '{text}' exceeds max_chars={len(self.slots)}")
+        pen = self.anchor.get_location() - self._anchor_offset
+        for slot, ch in zip_longest(self.slots, text):
+            if ch is None:
+                slot.points = np.zeros((0, 3))
+                continue
+            slot.points = self._glyphs[ch] + pen
+            pen = pen + [self._advance[ch], 0, 0]
+        for sub, g in zip(self.suffix, self._suffix_glyphs):
+            sub.points = g + pen
+        self.value = value
+        return self
+
+    def get_value(self):
+        return self.value
+
+
+# ═══════════ 막대 ═══════════
+
+class LiveBar(Rectangle):
+    """밑변을 고정하고 높이만 바뀌는 막대
+
+    always_redraw로 매 프레임 새 Rectangle을 만드는 대신, 처음 만든 막대의
+    꼭짓점 y좌표만 다시 쓴다.
+    """
+
+    def __init__(self, width=1.0, height=0.0, min_height=0.02, **kwargs):
+        self.min_height = min_height
+        self.bar_height = height
+        super().__init__(width=width, height=max(height, min_height), **kwargs)
+        y = self.points[:, 1]
+        self._frac = (y - y.min()) / (y.max() - y.min())
+
+    def set_bar_height(self, height, bottom=None):
+        """높이(와 밑변 y)를 바꿈 → self 반환"""
+        if bottom is None:
+            bottom = self.points[:, 1].min()
+        self.points[:, 1] = bottom + self._frac * max(height, self.min_height)
+        self.bar_height = height
+        return self
+
+    def animate_height(self, height, **kwargs):
+        """현재 높이 → height로 변하는 애니메이션"""
+        start = self.bar_height
+        return UpdateFromAlphaFunc(
+            self, lambda m, a: m.set_bar_height(interpolate(start, height, a)), **kwargs)
+
+
+class BarStack(VGroup):
+    """base_y 위로 차례로 쌓이는 LiveBar 묶음 (에너지 스택 막대)"""
+
+    def __init__(self, x, base_y, width, colors, heights=None, min_height=0.02,
+                 fill_opacity=0.7, **kwargs):
+        super().__init__(**kwargs)
+        self.base_y = base_y
+        for col in colors:
+            bar = LiveBar(width=width, min_height=min_height, color=col, fill_opacity=fill_opacity)
+            bar.move_to([x, base_y, 0], aligned_edge=DOWN)
+            self.add(bar)
+        self.set_heights(heights if heights is not None else [0] * len(colors))
+
+    def set_heights(self, heights):
+        """아래 막대부터 높이를 적용, 각 막대는 앞 막대들 높이의 합 위에 놓인다 → self 반환"""
+        bottom = self.base_y
+        for bar, h in zip(self.submobjects, heights):
+            bar.set_bar_height(h, bottom)
+            bottom += h
+        return self
+
+
+# ═══════════ 잔상 ═══════════
+
+class GhostTrail(VGroup):
+    """정해진 시각마다 남는 물체 잔상 (스트로보)
+
+    궤적을 알고 있으므로 잔상을 처음에 모두 만들어 위치에 두고 투명하게 숨겨 둔다.
+    reveal(t)는 t까지 지난 잔상의 불투명도만 올리므로 렌더 중 mobject가 새로 생기지 않고,
+    0.1초 간격처럼 촘촘한 스트로보도 프레임이 갈수록 느려지지 않는다.
+    """
+
+    def __init__(self, template, position_func, times, **kwargs):
+        super().__init__(**kwargs)
+        self.times = np.asarray(times, dtype=float)
+        self.positions = np.array([position_func(t) for t in self.times])
+        self._ghost_fill_opacity = template.get_fill_opacity()
+        self._ghost_stroke_opacity = template.get_stroke_opacity()
+        for pos in self.positions:
+            self.add(template.copy().move_to(pos))
+        self.set_fill(opacity=0).set_stroke(opacity=0)
+        self._n_shown = 0
+
+    def reveal(self, t):
+        """시각 t까지의 잔상만 보이게 함 (바뀐 잔상만 갱신) → self 반환"""
+        n = int(np.searchsorted(self.times, t + 1e-9, side="right"))
+        lo, hi = sorted((self._n_shown, n))
+        show = n > self._n_shown
+        for ghost in self.submobjects[lo:hi]:
+            ghost.set_fill(opacity=self._ghost_fill_opacity if show else 0)
+            ghost.set_stroke(opacity=self._ghost_stroke_opacity if show else 0)
+        self._n_shown = n
+        return self
+
+
+# ═══════════ 묶음 표식 ═══════════
+
+class MarkerCloud(VMobject):
+    """같은 모양의 표식 여러 개를 하위 경로로 담은 VMobject 하나
+
+    표식마다 mobject를 따로 두면 updater·렌더 비용이 개수만큼 늘어난다.
+    MarkerCloud는 템플릿 점 배열에 위치를 브로드캐스트로 더해 한 번에 다시 쓰므로
+    표식이 수십 개여도 mobject 하나를 그리는 비용에 가깝다. 색은 하나로 공유한다.
+    """
+
+    def __init__(self, template, positions, **kwargs):
+        super().__init__(**kwargs)
+        self.match_style(template)
+        self._shape = template.points - template.get_center()
+        self.set_positions(positions)
+
+    def set_positions(self, positions):
+        """(n, 3) 위치 배열로 표식 전체 이동 → self 반환"""
+        positions = np.asarray(positions, dtype=float)
+        self.points = (self._shape[None, :, :] + positions[:, None, :]).reshape(-1, 3)
+        return self
+
+
+class LineBundle(VMobject):
+    """선분 여러 개를 하위 경로로 담은 VMobject 하나 (v-t 직선 묶음 등)"""
+
+    def set_segments(self, starts, ends):
+        """(n, 3) 시작점·끝점 배열 → self 반환"""
+        nppc = self.n_points_per_cubic_curve
+        a = np.asarray(starts, dtype=float)[:, None, :]
+        b = np.asarray(ends, dtype=float)[:, None, :]
+        alphas = np.linspace(0, 1, nppc).reshape(1, nppc, 1)
+        self.points = (a + (b - a) * alphas).reshape(-1, 3)
+        return self
+
+
+# ═══════════ 경로 ═══════════
+
+class ArcLengthPath:
+    """VMobject 경로의 누적 호 길이 표
+
+    베지어 곡선마다 samples_per_curve개씩 점을 찍어 꺾은선과 누적 길이를 한 번 만들어 둔다.
+    매 프레임 조회는 이분 탐색 + 선형 보간이므로, point_from_proportion이나
+    MoveAlongPath처럼 곡선 길이를 다시 재지 않고 앵커가 수백 개인 경로도 빠르다.
+    """
+
+    def __init__(self, path, samples_per_curve=32):
+        nppc = path.n_points_per_cubic_curve
+        curves = path.points.reshape(-1, nppc, 3)
+        u = np.linspace(0, 1, samples_per_curve + 1)[1:]
+        # 3차 베른슈타인 기저 (표본 수, 4)
+        basis = np.stack([(1 - u) ** 3, 3 * u * (1 - u) ** 2, 3 * u**2 * (1 - u), u**3], axis=1)
+        samples = np.einsum("sk,ckd->csd", basis, curves).reshape(-1, 3)
+        self.points = np.vstack([curves[0, 0], samples])
+        self.cum = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(self.points, axis=0), axis=1))])
+        self.length = self.cum[-1]
+        self.start = self.points[0]
+
+    def _locate(self, s):
+        s = min(max(s, 0.0), self.length)
+        i = min(int(np.searchsorted(self.cum, s, side="right")) - 1, len(self.cum) - 2)
+        seg = self.cum[i + 1] - self.cum[i]
+        w = (s - self.cum[i]) / seg if seg > 0 else 0.0
+        return i, w
+
+    def point_at_length(self, s):
+        """시작점에서 경로를 따라 s만큼 간 점"""
+        i, w = self._locate(s)
+        return self.points[i] + w * (self.points[i + 1] - self.points[i])
+
+    def point_at(self, alpha):
+        """전체 길이의 alpha 비율 지점 (일정한 속력)"""
+        return self.point_at_length(alpha * self.length)
+
+    def points_until(self, s):
+        """시작점부터 s까지의 꺾은선 점들 (지나간 경로 그리기용)"""
+        i, w = self._locate(s)
+        head = self.points[i] + w * (self.points[i + 1] - self.points[i])
+        return np.vstack([self.points[:i + 1], head])
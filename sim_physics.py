@@ -0,0 +1,738 @@
+import heapq
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+
+# ═══════════ 프레임 시각 격자 ═══════════
+
+def frame_times(breaks, fps, real_per_sim=1.0):
+    """연속된 play 구간 경계(시뮬레이션 시각) → 실제로 렌더되는 프레임 시각 배열
+
+    구간마다 tracker.animate.set_value(b1)를 run_time=(b1 - b0) * real_per_sim,
+    rate_func=linear로 재생할 때 manim이 그리는 프레임의 시뮬레이션 시각과 같다.
+    """
+    dt = 1 / (fps * real_per_sim)
+    parts = [np.arange(b0, b1, dt) for b0, b1 in zip(breaks[:-1], breaks[1:])]
+    parts.append([breaks[-1]])
+    return np.unique(np.concatenate(parts))
+
+
+# ═══════════ 궤적 표 ═══════════
+
+class TrajectoryTable:
+    """여러 물체의 위치·속도·운동량을 프레임 시각 격자에서 한 번에 계산해 둔 표
+
+    x, v, p는 (물체 수, 프레임 수) 배열이다. updater는 매 프레임 물리 계산 없이
+    index(t)로 열 하나를 읽기만 한다.
+    """
+
+    def __init__(self, times, masses, x, v):
+        self.times = np.asarray(times, dtype=float)
+        self.masses = np.asarray(masses, dtype=float)
+        self.x = np.asarray(x, dtype=float)
+        self.v = np.asarray(v, dtype=float)
+        self.p = self.masses[:, None] * self.v
+        self.breaks = np.array([])
+        self.v_segments = self.v[:, :1]
+        self._last_t = None
+        self._last_i = 0
+
+    @classmethod
+    def from_piecewise(cls, times, masses, x0, breaks, velocities, scale_v=1.0):
+        """구간별 등속 운동 궤적
+
+        velocities[i]는 물체 i의 구간별 속도 (len(breaks) + 1개).
+        breaks[k] 시각에 velocities[i][k] → velocities[i][k + 1]로 바뀐다.
+        위치는 화면 좌표 (속도 × scale_v), 속도·운동량은 물리 단위.
+        """
+        times = np.asarray(times, dtype=float)
+        breaks = np.asarray(breaks, dtype=float)
+        v_seg = np.asarray(velocities, dtype=float)
+
+        edges = np.concatenate([[times[0]], breaks, [np.inf]])
+        dur = np.clip(times[None, :] - edges[:-1, None], 0, np.diff(edges)[:, None])
+        x = np.asarray(x0, dtype=float)[:, None] + scale_v * (v_seg @ dur)
+        v = v_seg[:, np.searchsorted(breaks, times, side="right")]
+
+        table = cls(times, masses, x, v)
+        table.breaks = breaks
+        table.v_segments = v_seg
+        return table
+
+    @classmethod
+    def from_constant_accel(cls, times, masses, forces, x0=0.0, v0=0.0):
+        """일정한 힘을 받는 물체 여러 개 (F, m 배열을 한 번에 브로드캐스트)
+
+        a = F/m, x = x0 + v0·t + a·t²/2. table.a에 물체별 가속도를 남긴다.
+        """
+        times = np.asarray(times, dtype=float)
+        masses, forces, x0, v0 = np.broadcast_arrays(*[
+            np.asarray(val, dtype=float) for val in (masses, forces, x0, v0)])
+        a = forces / masses
+        x = x0[:, None] + v0[:, None] * times + 0.5 * a[:, None] * times**2
+        v = v0[:, None] + a[:, None] * times
+        table = cls(times, masses, x, v)
+        table.a = a
+        return table
+
+    def index(self, t):
+        """t에 가장 가까운 프레임 인덱스 (같은 t의 연속 조회는 캐시)"""
+        if t == self._last_t:
+            return self._last_i
+        i = int(np.searchsorted(self.times, t))
+        if i == len(self.times) or (i > 0 and t - self.times[i - 1] < self.times[i] - t):
+            i -= 1
+        self._last_t, self._last_i = t, i
+        return i
+
+    def position(self, body, t):
+        return self.x[body, self.index(t)]
+
+    def velocity(self, body, t):
+        return self.v[body, self.index(t)]
+
+    def momentum(self, body, t):
+        return self.p[body, self.index(t)]
+
+    def bar_values(self, t):
+        """운동량 막대용 [p_1, ..., p_n, p_tot] (부동소수 오차는 반올림)"""
+        p = self.p[:, self.index(t)]
+        return [round(float(val), 6) for val in (*p, p.sum())]
+
+    def smooth_momentum(self, body, t, width=0.15):
+        """p-t 그래프용: 충돌 시각마다 시그모이드로 부드럽게 전환되는 운동량"""
+        p_seg = self.masses[body] * self.v_segments[body]
+        t = np.asarray(t, dtype=float)
+        s = 1 / (1 + np.exp(-(t[..., None] - self.breaks) / (width / 4)))
+        return p_seg[0] + s @ np.diff(p_seg)
+
+
+# ═══════════ 1차원 충돌 ═══════════
+
+def _collide(m1, m2, v1, v2, restitution):
+    """반발 계수 restitution인 1차원 충돌 후 속도 (v1', v2')"""
+    p = m1 * v1 + m2 * v2
+    return ((p + m2 * restitution * (v2 - v1)) / (m1 + m2),
+            (p + m1 * restitution * (v1 - v2)) / (m1 + m2))
+
+
+def collide_1d(masses, sizes, x0, v0, restitution=1.0, t_end=np.inf, scale_v=1.0,
+               max_events=10000, eps=1e-12):
+    """일직선 위 물체들의 충돌을 시간 순서대로 계산 → dict 반환
+
+    물체는 x0(중심, 화면 좌표) 순서로 놓여 있고 폭은 sizes, 속도는 v0(물리 단위)이며
+    화면에서는 속도 × scale_v로 움직인다. 이웃한 두 물체만 부딪힐 수 있으므로
+    이웃 쌍의 다음 접촉 시각을 우선순위 큐에 넣고, 충돌이 일어날 때마다 영향을 받은
+    쌍만 다시 계산한다 (버전 번호로 낡은 예약은 버림).
+
+    반환값의 breaks, velocities는 TrajectoryTable.from_piecewise에 그대로 넘길 수 있다.
+    같은 시각의 연쇄 충돌(뉴턴의 요람)은 하나의 break로 합친다.
+    """
+    masses = np.asarray(masses, dtype=float)
+    half = np.asarray(sizes, dtype=float) / 2
+    x = np.asarray(x0, dtype=float).copy()
+    v = np.asarray(v0, dtype=float).copy()
+    n = len(masses)
+    if np.any(np.diff(x) < 0):
+        raise ValueError("collide_1d: x0는 왼쪽부터 오른쪽 순서여야 한다")
+
+    t_now = np.zeros(n)          # 물체마다 x가 가리키는 시각
+    version = np.zeros(n, dtype=int)
+    queue = []
+
+    def schedule(i, t):
+        """쌍 (i, i+1)의 다음 접촉 시각을 큐에 넣음"""
+        if not 0 <= i < n - 1:
+            return
+        closing = (v[i] - v[i + 1]) * scale_v
+        if closing <= eps:
+            return
+        gap = (x[i + 1] + v[i + 1] * scale_v * (t - t_now[i + 1])) \
+            - (x[i] + v[i] * scale_v * (t - t_now[i])) - half[i] - half[i + 1]
+        t_hit = t + max(gap, 0.0) / closing
+        if t_hit <= t_end:
+            heapq.heappush(queue, (t_hit, i, version[i], version[i + 1]))
+
+    for i in range(n - 1):
+        schedule(i, 0.0)
+
+    events = []
+    while queue:
+        t, i, ver_i, ver_j = heapq.heappop(queue)
+        if ver_i != version[i] or ver_j != version[i + 1]:
+            continue
+        if len(events) >= max_events:
+            raise RuntimeError(f"collide_1d: 충돌이 {max_events}번을 넘음")
+        for k in (i, i + 1):
+            x[k] += v[k] * scale_v * (t - t_now[k])
+            t_now[k] = t
+            version[k] += 1
+        v[i], v[i + 1] = _collide(masses[i], masses[i + 1], v[i], v[i + 1], restitution)
+        events.append((t, i, v.copy()))
+        for k in (i - 1, i, i + 1):
+            schedule(k, t)
+
+    breaks, velocities = [], [np.asarray(v0, dtype=float)]
+    for t, _, v_after in events:
+        if breaks and np.isclose(t, breaks[-1], rtol=0, atol=1e-9):
+            velocities[-1] = v_after
+        else:
+            breaks.append(t)
+            velocities.append(v_after)
+    return {
+        "breaks": np.array(breaks),
+        "velocities": np.round(np.array(velocities).T, 12),   # 표시용 부동소수 오차 정리
+        "events": [(float(t), i, i + 1) for t, i, _ in events],
+    }
+
+
+# ═══════════ 2차원 원판 충돌 ═══════════
+
+class GasBox:
+    """직사각형 상자 안 원판 여러 개의 2차원 탄성 충돌 (균일 격자 공간 해시)
+
+    매 단계 원판을 한 변이 지름 이상인 격자 칸에 넣고, 같은 칸과 이웃 칸(절반 스텐실)의
+    후보 쌍만 겹침·접근 여부를 검사하므로 단계당 비용이 원판 수에 비례한다.
+    후보 쌍 생성, 충돌 판정, 충격량 적용이 모두 배열 연산이다.
+    run(times)은 프레임 시각마다 위치, 총 운동량, 운동에너지, 벽이 준 충격량을 기록해 둔다.
+    """
+
+    # 같은 칸 + 오른쪽·위·대각선 2칸: 이웃한 칸 쌍을 한 번씩만 본다
+    STENCIL = ((0, 0), (1, 0), (0, 1), (1, 1), (1, -1))
+
+    def __init__(self, bounds, radius, x0, v0, masses=1.0):
+        self.bounds = np.asarray(bounds, dtype=float)   # (x_min, x_max, y_min, y_max)
+        self.r = float(radius)
+        self.x = np.array(x0, dtype=float)
+        self.v = np.array(v0, dtype=float)
+        self.n = len(self.x)
+        self.m = np.broadcast_to(np.asarray(masses, dtype=float), (self.n,)).copy()
+        self.t = 0.0
+        self.wall_impulse = 0.0   # 벽이 받은 충격량 크기 누적 (압력 ∝ 단위 시간당 값)
+
+        self._lo = self.bounds[[0, 2]]
+        span = self.bounds[[1, 3]] - self._lo
+        self.grid_shape = np.maximum((span // (2 * self.r)).astype(int), 1)
+        self.cell_size = span / self.grid_shape       # 지름 이상
+        self._ids = np.arange(self.n)
+
+    def _candidate_pairs(self):
+        """공간 해시로 거리 검사 후보 (i, j) 쌍 배열"""
+        nx, ny = self.grid_shape
+        cell = np.clip(((self.x - self._lo) // self.cell_size).astype(int), 0, self.grid_shape - 1)
+        key = cell[:, 0] * ny + cell[:, 1]
+
+        # 칸 × 최대 수용 개수의 밀집 표 (빈 자리 -1)
+        order = np.argsort(key, kind="stable")
+        counts = np.bincount(key, minlength=nx * ny)
+        start = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        sorted_key = key[order]
+        table = np.full((nx * ny, counts.max()), -1)
+        table[sorted_key, self._ids - start[sorted_key]] = order
+
+        pairs_i, pairs_j = [], []
+        for dx, dy in self.STENCIL:
+            cx, cy = cell[:, 0] + dx, cell[:, 1] + dy
+            inside = (cx >= 0) & (cx < nx) & (cy >= 0) & (cy < ny)
+            cand = np.full((self.n, table.shape[1]), -1)
+            cand[inside] = table[cx[inside] * ny + cy[inside]]
+            if dx == 0 and dy == 0:
+                cand[cand <= self._ids[:, None]] = -1
+            i, k = np.nonzero(cand >= 0)
+            pairs_i.append(i)
+            pairs_j.append(cand[i, k])
+        return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+    def step(self, dt):
+        self.x += self.v * dt
+        self.t += dt
+
+        # ── 벽 반사 ──
+        hit = (((self.x < self._lo + self.r) & (self.v < 0))
+               | ((self.x > self.bounds[[1, 3]] - self.r) & (self.v > 0)))
+        self.wall_impulse += float(np.sum(2 * self.m[:, None] * np.abs(self.v) * hit))
+        self.v[hit] *= -1
+
+        # ── 원판끼리 충돌 ──
+        i, j = self._candidate_pairs()
+        d = self.x[j] - self.x[i]
+        dist2 = np.einsum("kd,kd->k", d, d)
+        close = dist2 < (2 * self.r) ** 2
+        i, j, d, dist2 = i[close], j[close], d[close], dist2[close]
+        normal = d / np.sqrt(np.maximum(dist2, 1e-18))[:, None]
+
+        # 한 원판이 여러 쌍에 걸리면 에너지가 새지 않도록 겹치지 않는 쌍끼리 묶어 차례로 처리
+        n_hits = 0
+        while len(i):
+            closing = np.einsum("kd,kd->k", self.v[j] - self.v[i], normal)
+            hit = closing < 0
+            i, j, normal, closing = i[hit], j[hit], normal[hit], closing[hit]
+            if not len(i):
+                break
+            first = np.full(self.n, len(i))
+            rank = np.arange(len(i))
+            np.minimum.at(first, i, rank)
+            np.minimum.at(first, j, rank)
+            now = (first[i] == rank) & (first[j] == rank)
+
+            # 충격량 J = 2·m_i·m_j/(m_i+m_j)·((v_j - v_i)·n)·n,  Δv_i = J/m_i,  Δv_j = -J/m_j
+            a, b = i[now], j[now]
+            ma, mb = self.m[a], self.m[b]
+            impulse = (2 * ma * mb / (ma + mb) * closing[now])[:, None] * normal[now]
+            self.v[a] += impulse / ma[:, None]
+            self.v[b] -= impulse / mb[:, None]
+            n_hits += len(a)
+            i, j, normal = i[~now], j[~now], normal[~now]
+        return n_hits
+
+    def momentum(self):
+        return self.m @ self.v
+
+    def kinetic(self):
+        return 0.5 * float(self.m @ np.einsum("kd,kd->k", self.v, self.v))
+
+    def run(self, times, substeps=3):
+        """프레임 시각마다 상태 기록 → self (positions, P, KE, wall 배열)"""
+        self.times = np.asarray(times, dtype=float)
+        k = len(self.times)
+        self.positions = np.empty((k, self.n, 2))
+        self.P = np.empty((k, 2))
+        self.KE = np.empty(k)
+        self.wall = np.empty(k)
+        for f, t_f in enumerate(self.times):
+            h = t_f - self.t
+            if h > 0:
+                for _ in range(substeps):
+                    self.step(h / substeps)
+            self.positions[f] = self.x
+            self.P[f] = self.momentum()
+            self.KE[f] = self.kinetic()
+            self.wall[f] = self.wall_impulse
+        return self
+
+    def index(self, t):
+        """t에 가장 가까운 기록 인덱스"""
+        i = int(np.searchsorted(self.times, t))
+        if i == len(self.times) or (i > 0 and t - self.times[i - 1] < self.times[i] - t):
+            i -= 1
+        return i
+
+
+# ═══════════ 용수철 충돌 모형 ═══════════
+
+class SpringContact:
+    """바닥과의 충돌을 용수철 접촉으로 본 모형 (u = τ/Δt를 0~1로 자름)
+
+    F(τ) = 12·I/Δt · u(1-u)²          (u = 1/3에서 최대)
+    v(τ) = v₀ · (1 - 6u² + 8u³ - 3u⁴)
+    deform(τ) = 6u² - 8u³ + 3u⁴        (0 → 1, 이후 1 유지)
+    J(τ) = I · deform(τ)              (누적 충격량, v = v₀ - J/m)
+
+    메서드는 배열을 받아 배열을 돌려주므로 표본 격자 전체를 한 번에 계산한다.
+    tau, F, v, deform, impulse는 충돌 구간 표본 격자에서 미리 계산해 둔 배열이다.
+    """
+
+    def __init__(self, impulse, v_impact, delta_t, n_samples=401):
+        self.I = impulse
+        self.v0 = v_impact
+        self.delta_t = delta_t
+        self.F_peak = 48 * impulse / (27 * delta_t)
+        self.F_avg = impulse / delta_t
+        self.t_peak = delta_t / 3
+
+        self.tau = np.linspace(0, delta_t, n_samples)
+        self.F = self.force(self.tau)
+        self.v = self.velocity(self.tau)
+        self.deform = self.deform_frac(self.tau)
+        self.impulse = self.I * self.deform
+
+    def _u(self, tau):
+        return np.clip(np.asarray(tau, dtype=float) / self.delta_t, 0.0, 1.0)
+
+    def force(self, tau):
+        u = self._u(tau)
+        return (12 * self.I / self.delta_t * u * (1 - u) ** 2)[()]
+
+    def deform_frac(self, tau):
+        u = self._u(tau)
+        return (6 * u**2 - 8 * u**3 + 3 * u**4)[()]
+
+    def velocity(self, tau):
+        return self.v0 * (1 - self.deform_frac(tau))
+
+    def impulse_at(self, tau):
+        return self.I * self.deform_frac(tau)
+
+
+# ═══════════ 힘 일정표 ═══════════
+
+class ForceSchedule:
+    """(t_start, t_end, F(t)) 구간들로 주어진 힘을 받는 물체의 1차원 운동
+
+    F(t)는 배열을 받아 배열(또는 상수)을 돌려주는 함수다. 구간 경계로 나눈 시간 격자에서
+    한 번 적분해 x, v, a, 누적 충격량 배열을 만들어 두고, 조회는 이분 탐색 보간(O(log n))으로 한다.
+    경계마다 따로 적분하므로 힘이 끊기는 곳에서도 v, 충격량은 정확하고,
+    위치는 사다리꼴 + 끝점 보정으로 F가 구간 안에서 1차 이하이면 정확하다.
+    t_end 이후 조회는 t_end 값으로 고정된다.
+    구간은 [t_start, t_end) 반열린 구간이라 이어 붙인 구간의 경계에서는 뒤 구간의 힘만 친다
+    (일정표 끝 t_end에 닿는 구간만 끝점 포함).
+    """
+
+    def __init__(self, mass, segments, t_end, x0=0.0, v0=0.0, dt=1e-3):
+        self.mass = float(mass)
+        self.t_end = float(t_end)
+        self.segments = [(float(a), float(b), f) for a, b, f in segments]
+        edges = np.unique(np.clip(
+            [0.0, t_end, *[e for a, b, _ in self.segments for e in (a, b)]], 0.0, t_end))
+
+        t_parts, f_parts = [], []
+        for a, b in zip(edges[:-1], edges[1:]):
+            t = np.linspace(a, b, max(int(np.ceil((b - a) / dt)), 1) + 1)
+            mid = (a + b) / 2
+            F = np.zeros_like(t)
+            for s, e, f in self.segments:
+                if s <= mid <= e:
+                    F = F + np.broadcast_to(np.asarray(f(t), dtype=float), t.shape)
+            t_parts.append(t)
+            f_parts.append(F)
+
+        J, x = [0.0], [float(x0)]
+        for t, F in zip(t_parts, f_parts):
+            h = np.diff(t)
+            J_seg = J[-1] + np.concatenate([[0.0], np.cumsum((F[1:] + F[:-1]) / 2 * h)])
+            v_seg = v0 + J_seg / self.mass
+            a_seg = F / self.mass
+            dx = (v_seg[1:] + v_seg[:-1]) / 2 * h - (a_seg[1:] - a_seg[:-1]) * h**2 / 12
+            J.extend(J_seg[1:])
+            x.extend(x[-1] + np.cumsum(dx))
+
+        # 경계의 겹치는 점: 시각은 한 번만, 힘은 오른쪽 구간 값 (force()의 반열린 구간과 같게)
+        self.t = np.concatenate([t_parts[0]] + [t[1:] for t in t_parts[1:]])
+        self.F = np.concatenate([F[:-1] for F in f_parts[:-1]] + [f_parts[-1]])
+        self.impulse = np.array(J)
+        self.a = self.F / self.mass
+        self.v = v0 + self.impulse / self.mass
+        self.x = np.array(x)
+
+    def force(self, t):
+        """t에서의 힘 (구간 함수 직접 계산, [a, b) — t_end에 닿는 구간만 끝점 포함)"""
+        t = np.asarray(t, dtype=float)
+        F = np.zeros_like(t)
+        for a, b, f in self.segments:
+            inside = (t >= a) & ((t < b) | ((t == b) & (b >= self.t_end)))
+            F = F + np.where(inside, f(t), 0.0)
+        return F[()]
+
+    def acceleration(self, t):
+        return self.force(t) / self.mass
+
+    def velocity(self, t):
+        return np.interp(t, self.t, self.v)
+
+    def position(self, t):
+        return np.interp(t, self.t, self.x)
+
+    def impulse_at(self, t):
+        return np.interp(t, self.t, self.impulse)
+
+
+# ═══════════ 서로 밀기 ═══════════
+
+class PushApart:
+    """나란히 붙은 물체들이 이웃끼리 서로 미는 상호작용 (작용·반작용)
+
+    접촉면 c(물체 c와 c+1 사이)는 durations[c] 동안 크기 forces[c]로 양쪽을 민다:
+    물체 c는 -F, 물체 c+1은 +F. 힘이 구간별 상수이므로 위치·속도는 해석적으로
+    계산하고, 배열 t를 주면 (물체 수, len(t)) 배열로 한꺼번에 돌려준다.
+    A가 B를, B가 C를 미는 여러 물체 묶음도 접촉면만 늘리면 된다.
+    """
+
+    def __init__(self, masses, forces, durations, x0=0.0):
+        self.masses = np.asarray(masses, dtype=float)
+        n = len(self.masses)
+        self.forces = np.broadcast_to(np.asarray(forces, dtype=float), (n - 1,)).copy()
+        self.durations = np.broadcast_to(np.asarray(durations, dtype=float), (n - 1,)).copy()
+        self.x0 = np.broadcast_to(np.asarray(x0, dtype=float), (n,)).copy()
+
+        # 접촉면 c가 물체 i에 주는 힘의 방향 (n, n-1)
+        sign = np.zeros((n, n - 1))
+        sign[np.arange(n - 1), np.arange(n - 1)] = -1.0
+        sign[np.arange(1, n), np.arange(n - 1)] = 1.0
+        self.pair_force = sign * self.forces            # 물체 i가 접촉면 c에서 받는 힘
+        self._coef = self.pair_force / self.masses[:, None]
+
+        self.t_push = float(self.durations.max())
+        self.accel = self._coef.sum(axis=1)               # 모든 접촉면이 밀고 있을 때의 가속도
+        self.v_final = self._coef @ self.durations
+
+        # 미는 동안 접촉면 양쪽이 서로 파고들면(v[c+1] < v[c]) 두 물체가 겹친다.
+        # 상대 속도는 밀기가 끝나는 시각들 사이에서 직선이므로 그 시각들에서만 확인하면 된다.
+        ends = np.unique(self.durations)
+        v = self.velocity(ends)
+        rel = v[1:] - v[:-1]
+        pushing = ends[None, :] <= self.durations[:, None]
+        bad = pushing & (rel < -1e-12 * max(float(np.abs(v).max()), 1.0))
+        if np.any(bad):
+            c, k = np.argwhere(bad)[0]
+            raise ValueError(f"PushApart: 접촉면 {c}의 두 물체가 t={ends[k]:g}에서 서로 다가간다 "
+                             f"(상대 속도 {rel[c, k]:.3g}) — 힘·시간을 다시 정할 것")
+
+    def _pushed(self, t):
+        """접촉면별로 지금까지 민 시간 min(t, T_c) → (n-1, len(t))"""
+        return np.minimum(np.atleast_1d(t)[None, :], self.durations[:, None])
+
+    @staticmethod
+    def _squeeze(values, t):
+        return values[:, 0] if np.ndim(t) == 0 else values
+
+    def force(self, t):
+        """물체별 알짜힘 (밀기가 끝난 접촉면은 0)"""
+        active = np.atleast_1d(t)[None, :] <= self.durations[:, None]
+        return self._squeeze(self.pair_force @ active, t)
+
+    def acceleration(self, t):
+        return self.force(t) / (self.masses[:, None] if np.ndim(t) else self.masses)
+
+    def velocity(self, t):
+        return self._squeeze(self._coef @ self._pushed(t), t)
+
+    def position(self, t):
+        """x0 + Σ a_c·τ(t - τ/2), τ = min(t, T_c) (가속 구간 + 등속 구간)"""
+        tau = self._pushed(t)
+        x = self.x0[:, None] + self._coef @ (tau * (np.atleast_1d(t)[None, :] - tau / 2))
+        return self._squeeze(x, t)
+
+    def table(self, times):
+        """프레임 시각 격자 → TrajectoryTable (table.force에 물체별 알짜힘, table.a에 밀 때 가속도)"""
+        times = np.asarray(times, dtype=float)
+        table = TrajectoryTable(times, self.masses, self.position(times), self.velocity(times))
+        table.force = self.force(times)
+        table.a = self.accel
+        return table
+
+
+# ═══════════ 위치에 따라 변하는 힘 ═══════════
+
+class WorkRun:
+    """위치에 따라 변하는 힘 F(x)를 받는 물체의 1차원 운동과 일-운동에너지 정리
+
+    m·x'' = F(x)를 solve_ivp(dense_output)로 한 번 적분한다 (x_stop에 닿으면 멈춤).
+    sample(times)는 프레임 사이를 substeps개로 나눈 격자에서 x, v를 한꺼번에 계산하고,
+    일 W는 그 격자 위 F(x)의 사다리꼴 누적 적분, K는 ½mv²로 둔다.
+    모든 프레임에서 W와 ΔK를 비교해 tol(최대 K 대비 비율)을 넘으면 ValueError를 낸다.
+    t_stop 이후 조회는 t_stop 상태로 고정된다.
+    force는 배열을 받아 배열을 돌려주는 함수다 (용수철: lambda x: -k * x).
+    """
+
+    def __init__(self, mass, force, x0=0.0, v0=0.0, x_stop=None, t_max=30.0,
+                 rtol=1e-10, atol=1e-10):
+        self.mass = float(mass)
+        self.force = force
+        self.x0 = float(x0)
+        self.v0 = float(v0)
+
+        def rhs(t, y):
+            return [y[1], float(self.force(np.asarray(y[0]))) / self.mass]
+
+        events = None
+        if x_stop is not None:
+            def reach(t, y):
+                return y[0] - x_stop
+            reach.terminal = True
+            events = [reach]
+        sol = solve_ivp(rhs, (0.0, t_max), [self.x0, self.v0], dense_output=True,
+                        events=events, rtol=rtol, atol=atol)
+        self.t_stop = float(sol.t[-1])
+        self._dense = sol.sol
+
+    def sample(self, times, substeps=16, tol=1e-4):
+        """프레임 시각 격자에서 x, v, F, W, K 배열 계산 + W = ΔK 검사 → self"""
+        self.t = np.asarray(times, dtype=float)
+        # 프레임 사이 세분 격자 (적분용), 프레임 점은 substeps 간격마다
+        fine = np.concatenate([
+            np.linspace(a, b, substeps, endpoint=False) for a, b in zip(self.t[:-1], self.t[1:])
+        ] + [self.t[-1:]])
+        x, v = self._dense(np.clip(fine, 0.0, self.t_stop))
+
+        F = np.asarray(self.force(x), dtype=float) * np.ones_like(x)
+        W = np.concatenate([[0.0], np.cumsum((F[1:] + F[:-1]) / 2 * np.diff(x))])
+        frame = np.arange(len(self.t)) * substeps
+
+        self.x, self.v, self.F, self.W = x[frame], v[frame], F[frame], W[frame]
+        self.K = 0.5 * self.mass * self.v**2
+        self.dK = self.K - 0.5 * self.mass * self.v0**2
+        self.max_error = float(np.max(np.abs(self.W - self.dK)))
+        scale = max(float(np.max(np.abs(self.K))), 1e-12)
+        if self.max_error > tol * scale:
+            raise ValueError(f"WorkRun: W와 ΔK 차이 {self.max_error:.3g}가 허용 오차를 넘음 "
+                             f"(substeps를 늘릴 것)")
+        return self
+
+    def position(self, t):
+        return np.interp(t, self.t, self.x)
+
+    def velocity(self, t):
+        return np.interp(t, self.t, self.v)
+
+    def work(self, t):
+        return np.interp(t, self.t, self.W)
+
+    def kinetic(self, t):
+        return np.interp(t, self.t, self.K)
+
+
+# ═══════════ 경로 위 미끄럼 운동 ═══════════
+
+class TrackRun:
+    """여러 조각으로 된 경로 위를 미끄러지는 물체 (운동 마찰·공기 저항 포함)
+
+    pieces는 [(길이, h(s), dh/ds(s)), ...]로, s는 각 조각 시작점부터 잰 경로 길이다.
+    곡면 경사도 h, dh/ds만 주면 된다 (배열을 받아 배열을 돌려주는 함수).
+
+    상태 [s, v, Q]를 solve_ivp(dense_output)로 한 번 적분한다.
+      a = -g·dh/ds - μ·g·cosθ·sign(v) - (k/m)·v|v|,   dQ/dt = (μ·m·g·cosθ + k·v²)·|v|
+    조각 경계, 멈춤(정지 마찰로 버티면 그대로 정지)에서 적분을 끊고 다시 시작하므로
+    경사가 꺾이는 곳에서도 정확하다. sample(times)로 프레임 시각 격자에 한 번 찍어 두면
+    위치·에너지·열 조회는 보간(O(log n))만 한다.
+
+    경로 끝은 wall=None이면 그대로 끝(그 자리에서 정지)이고, wall=e이면 반발 계수 e인
+    벽이다: v → -e·v로 튕기고 잃은 운동에너지 ½m·v²·(1-e²)는 열에 더한다 (breaks에 포함).
+    """
+
+    def __init__(self, mass, pieces, g=10.0, mu=0.0, drag=0.0, v0=0.0, t_max=30.0, wall=None,
+                 rtol=1e-9, atol=1e-9):
+        self.mass = float(mass)
+        self.g = float(g)
+        self.mu = float(mu)
+        self.drag = float(drag)
+        self.wall = None if wall is None else float(wall)
+        self.pieces = [(float(length), h, dh) for length, h, dh in pieces]
+        self.offsets = np.concatenate([[0.0], np.cumsum([p[0] for p in self.pieces])])
+        self.length = self.offsets[-1]
+        self.h0 = float(self.pieces[0][1](0.0))
+
+        # (t0, t1, 조각 번호, dense 해) 목록
+        self.spans = []
+        # 다음 조각으로 넘어간 시각
+        self.breaks = []
+        self.t_max = float(t_max)
+        self.t_stop = self.t_max
+
+        t, k, state = 0.0, 0, np.array([0.0, float(v0), 0.0])
+        while t < t_max:
+            heading = np.sign(state[1]) or np.sign(self._drive(k, state[0]))
+            if heading == 0 or (state[1] == 0 and self._holds(k, state[0])):
+                self.t_stop = t
+                break
+            length = self.pieces[k][0]
+            events = [
+                self._event(lambda t, y: y[0] - length, +1),
+                self._event(lambda t, y: y[0], -1),
+                self._event(lambda t, y: y[1] * heading, -1),
+            ]
+            sol = solve_ivp(lambda t, y: self._rhs(y, k, heading), (t, t_max), state,
+                            dense_output=True, events=events, rtol=rtol, atol=atol)
+            self.spans.append((t, sol.t[-1], k, sol.sol))
+            t, state = sol.t[-1], sol.y[:, -1].copy()
+            if sol.status != 1:
+                break
+            if len(sol.t_events[0]):
+                if k + 1 == len(self.pieces) and self.wall is not None:
+                    state[2] += 0.5 * self.mass * state[1] ** 2 * (1 - self.wall**2)
+                    state[1] *= -self.wall
+                    self.breaks.append(float(t))
+                    continue
+                if k + 1 == len(self.pieces):
+                    self.t_stop = t
+                    break
+                k, state[0] = k + 1, 0.0
+                self.breaks.append(float(t))
+            elif len(sol.t_events[1]):
+                if k == 0:
+                    self.t_stop = t
+                    break
+                k, state[0] = k - 1, self.pieces[k - 1][0]
+                self.breaks.append(float(t))
+            else:
+                state[1] = 0.0
+        self.final = (k, state)
+
+    @staticmethod
+    def _event(func, direction):
+        func.terminal = True
+        func.direction = direction
+        return func
+
+    def _drive(self, k, s):
+        return -self.g * float(self.pieces[k][2](s))
+
+    def _cos(self, k, s):
+        slope = np.asarray(self.pieces[k][2](s), dtype=float)
+        return np.sqrt(np.clip(1 - slope**2, 0.0, 1.0))
+
+    def _holds(self, k, s):
+        """정지 상태에서 정지 마찰이 경사 성분을 버티는지"""
+        return abs(self._drive(k, s)) <= self.mu * self.g * self._cos(k, s)
+
+    def _rhs(self, y, k, heading):
+        s, v, _ = y
+        friction = self.mu * self.g * self._cos(k, s)
+        a = self._drive(k, s) - friction * heading - self.drag / self.mass * v * abs(v)
+        heat = (self.mass * friction + self.drag * v * v) * abs(v)
+        return [v, a, heat]
+
+    def _state_at(self, times):
+        """시각 배열 → (경로 길이 s, 높이, 속도, 열) 배열"""
+        times = np.asarray(times, dtype=float)
+        s = np.empty_like(times)
+        h = np.empty_like(times)
+        v = np.zeros_like(times)
+        heat = np.empty_like(times)
+
+        k_end, end = self.final
+        s[:] = self.offsets[k_end] + end[0]
+        h[:] = self.pieces[k_end][1](end[0])
+        heat[:] = end[2]
+        for t0, t1, k, dense in self.spans:
+            mask = (times >= t0) & (times <= t1)
+            if not mask.any():
+                continue
+            y = dense(np.clip(times[mask], t0, t1))
+            s[mask] = self.offsets[k] + y[0]
+            h[mask] = self.pieces[k][1](y[0])
+            v[mask] = y[1]
+            heat[mask] = y[2]
+        # 정지 이후는 마지막 상태 유지 (완전 비탄성 벽처럼 정지 순간에 상태가 바뀌는 경우도)
+        done = times >= self.t_stop if self.t_stop < self.t_max else times > self.t_stop
+        s[done] = self.offsets[k_end] + end[0]
+        h[done] = self.pieces[k_end][1](end[0])
+        heat[done] = end[2]
+        v[done] = 0.0
+        return s, h, v, heat
+
+    def sample(self, times):
+        """프레임 시각 격자에서 s, h, v, PE, KE, 열 배열을 계산해 둠 → self"""
+        self.t = np.asarray(times, dtype=float)
+        self.s, self.h, self.v, self.heat = self._state_at(self.t)
+        self.pe = self.mass * self.g * self.h
+        self.ke = 0.5 * self.mass * self.v**2
+        return self
+
+    def distance(self, t):
+        return np.interp(t, self.t, self.s)
+
+    def height(self, t):
+        return np.interp(t, self.t, self.h)
+
+    def speed(self, t):
+        return np.interp(t, self.t, np.abs(self.v))
+
+    def potential(self, t):
+        return np.interp(t, self.t, self.pe)
+
+    def kinetic(self, t):
+        return np.interp(t, self.t, self.ke)
+
+    def heat_at(self, t):
+        return np.interp(t, self.t, self.heat)
@@ -0,0 +1,141 @@
+"""diagram_build 캐시 키·증분 빌드·내보내기 형식 테스트 (임시 도식 스크립트로)
+
+    python -m pytest -q test_diagram_build.py
+"""
+import importlib
+import itertools
+import sys
+
+import matplotlib
+import pytest
+from PIL import Image
+
+matplotlib.use("Agg")
+
+import diagram_build
+
+FIGURES = '''
+import matplotlib.pyplot as plt
+
+from diagram_build import FigureRegistry
+
+registry = FigureRegistry({"lines.linewidth": 2}, dpi=40)
+COLOR = "tab:blue"
+
+
+def draw_line(ax):
+    ax.plot([0, 1], [0, 1], color=COLOR)
+
+
+@registry.figure("demo_line")
+def line():
+    fig, ax = plt.subplots(figsize=(2, 2))
+    draw_line(ax)
+    return fig
+
+
+@registry.figure("demo_dot", "dot.png")
+def dot():
+    fig, ax = plt.subplots(figsize=(2, 2))
+    ax.scatter([0], [0])
+    return fig
+'''
+
+_counter = itertools.count()
+
+
+@pytest.fixture
+def figures(tmp_path, monkeypatch):
+    """임시 폴더에 도식 스크립트를 만들고 (고칠 부분을 바꿔) 등록부를 읽는 함수"""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    path = tmp_path / f"figs_{next(_counter)}.py"
+    path.write_text(FIGURES, encoding="utf-8")
+
+    def load(old=None, new=None):
+        if old is not None:
+            path.write_text(path.read_text(encoding="utf-8").replace(old, new), encoding="utf-8")
+        sys.modules.pop(path.stem, None)
+        return importlib.import_module(path.stem).registry
+
+    yield load
+    sys.modules.pop(path.stem, None)
+
+
+def keys(registry, variants=diagram_build.DEFAULT_VARIANTS):
+    return {fig_id: diagram_build.figure_key(registry, fig_id, variants) for fig_id in registry.figures}
+
+
+def test_figure_key_is_stable_across_imports(figures):
+    assert keys(figures()) == keys(figures())
+
+
+def test_figure_key_follows_helpers_and_constants(figures):
+    before = keys(figures())
+    recolored = keys(figures('COLOR = "tab:blue"', 'COLOR = "tab:red"'))
+    assert recolored["demo_line"] != before["demo_line"]
+    assert recolored["demo_dot"] == before["demo_dot"]
+    # 빌더가 부르는 보조 함수만 고쳐도 키가 바뀐다
+    thicker = keys(figures("color=COLOR)", "color=COLOR, lw=3)"))
+    assert thicker["demo_line"] != recolored["demo_line"]
+    assert thicker["demo_dot"] == before["demo_dot"]
+
+
+def test_figure_key_tracks_style_and_variants(figures):
+    registry = figures()
+    before = keys(registry)
+    assert keys(registry, ("png", "svg")) != before
+    registry.rc_params["lines.linewidth"] = 3
+    assert all(keys(registry)[fig_id] != key for fig_id, key in before.items())
+
+
+def test_plan_build_skips_unchanged_figures(figures, tmp_path):
+    registry = figures()
+    pairs = [(registry, fig_id) for fig_id in registry.figures]
+    out = tmp_path / "out"
+
+    todo, skipped, entries, stale = diagram_build.plan_build(pairs, out, {})
+    assert (todo, skipped, stale) == (["demo_line", "demo_dot"], [], [])
+    for fig_id in todo:
+        registry.build(fig_id, out)
+
+    assert diagram_build.plan_build(pairs, out, entries)[:2] == ([], ["demo_line", "demo_dot"])
+    assert diagram_build.plan_build(pairs, out, entries, force=True)[0] == ["demo_line", "demo_dot"]
+    (out / "dot.png").unlink()
+    assert diagram_build.plan_build(pairs, out, entries)[0] == ["demo_dot"]
+
+
+def test_plan_build_reports_unregistered_figures_of_the_same_script(figures, tmp_path):
+    registry = figures()
+    manifest = {"demo_old": {"files": ["old.png"], "key": "0"}, "other_fig": {"files": [], "key": "0"}}
+    stale = diagram_build.plan_build([(registry, "demo_line")], tmp_path, manifest)[3]
+    assert stale == ["demo_old"]
+
+
+@pytest.mark.parametrize("spec, expected", [("png", ("png", 1)), ("png@2x", ("png", 2)),
+                                            ("webp", ("webp", 1)), ("svg", ("svg", 1))])
+def test_parse_variant(spec, expected):
+    assert diagram_build.parse_variant(spec) == expected
+
+
+def test_parse_variant_rejects_scaled_vector():
+    with pytest.raises(ValueError):
+        diagram_build.parse_variant("svg@2x")
+
+
+def test_variant_filenames_keep_1x_name():
+    files = [diagram_build.variant_filename("dot.png", spec) for spec in diagram_build.SRCSET_VARIANTS]
+    assert files == ["dot.png", "dot@2x.png", "dot@3x.png", "dot.webp", "dot.svg"]
+
+
+def test_build_writes_every_variant_from_one_layout(figures, tmp_path):
+    registry = figures()
+    paths, _ = registry.build("demo_dot", tmp_path, variants=diagram_build.SRCSET_VARIANTS)
+    assert [path.name for path in paths] == registry.files("demo_dot", diagram_build.SRCSET_VARIANTS)
+    assert all(path.stat().st_size > 0 for path in paths)
+    assert not list(tmp_path.glob(".*.tmp"))
+
+    sizes = [Image.open(path).size for path in paths[:4]]
+    # 같은 경계 상자를 배율만 바꿔 래스터화 (반올림 1픽셀 허용), WebP는 1x와 같은 크기
+    for scale, (w, h) in zip((1, 2, 3), sizes):
+        assert abs(w - scale * sizes[0][0]) <= scale and abs(h - scale * sizes[0][1]) <= scale
+    assert sizes[3] == sizes[0]
@@ -0,0 +1,91 @@
+"""korean_font 저장 파일 처리 테스트 (글꼴 목록 검색은 가짜로 바꿔 둠)
+
+    python -m pytest -q test_korean_font.py
+"""
+import json
+from pathlib import Path
+
+import matplotlib
+import pytest
+
+import korean_font
+
+DEJAVU = str(Path(matplotlib.get_data_path()) / "fonts" / "ttf" / "DejaVuSans.ttf")
+
+
+@pytest.fixture
+def fonts(monkeypatch):
+    """_search 호출 횟수와 반환값, 설치 글꼴 목록을 조절하는 가짜 글꼴 환경"""
+    state = {"calls": 0, "result": None, "installed": ["/fonts/a.ttf"]}
+
+    def search():
+        state["calls"] += 1
+        return state["result"]
+
+    monkeypatch.setattr(korean_font, "_RESOLVED", {})
+    monkeypatch.setattr(korean_font, "_search", search)
+    monkeypatch.setattr(korean_font, "_system_fonts", lambda: list(state["installed"]))
+    monkeypatch.delenv("KOREAN_FONT", raising=False)
+    return state
+
+
+def resolve_fresh(cache_file):
+    """다른 프로세스처럼 메모리 캐시 없이 조회"""
+    korean_font._RESOLVED.clear()
+    return korean_font.resolve_korean_font(cache_file)
+
+
+def test_default_cache_is_outside_the_worktree():
+    here = Path(korean_font.__file__).resolve().parent
+    assert here not in Path(korean_font.DEFAULT_CACHE_FILE).resolve().parents
+
+
+def test_saved_font_is_reused_without_search(fonts, tmp_path):
+    cache = tmp_path / "font.json"
+    fonts["result"] = {"family": "DejaVu Sans", "path": DEJAVU}
+    assert korean_font.resolve_korean_font(cache) == fonts["result"]
+    assert resolve_fresh(cache) == fonts["result"]
+    assert fonts["calls"] == 1
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_missing_font_file_triggers_search(fonts, tmp_path):
+    cache = tmp_path / "font.json"
+    cache.write_text(json.dumps({"override": None, "font": {"family": "X", "path": str(tmp_path / "gone.ttf")}}))
+    assert resolve_fresh(cache) is None
+    assert fonts["calls"] == 1
+
+
+def test_saved_none_is_rechecked_when_fonts_change(fonts, tmp_path):
+    cache = tmp_path / "font.json"
+    assert korean_font.resolve_korean_font(cache) is None
+    assert resolve_fresh(cache) is None
+    assert fonts["calls"] == 1
+
+    # 한글 글꼴을 새로 설치 → 목록 지문이 달라져 다시 찾는다
+    fonts["installed"].append("/fonts/nanum.ttf")
+    fonts["result"] = {"family": "DejaVu Sans", "path": DEJAVU}
+    assert resolve_fresh(cache) == fonts["result"]
+    assert fonts["calls"] == 2
+    assert "fonts" not in json.loads(cache.read_text())
+
+
+def test_override_change_triggers_search(fonts, tmp_path, monkeypatch):
+    cache = tmp_path / "font.json"
+    korean_font.resolve_korean_font(cache)
+    monkeypatch.setenv("KOREAN_FONT", "NanumGothic")
+    resolve_fresh(cache)
+    assert fonts["calls"] == 2
+    assert json.loads(cache.read_text())["override"] == "NanumGothic"
+
+
+def test_refresh_ignores_saved_choice(fonts, tmp_path):
+    cache = tmp_path / "font.json"
+    korean_font.resolve_korean_font(cache)
+    korean_font.resolve_korean_font(cache, refresh=True)
+    assert fonts["calls"] == 2
+
+
+def test_matplotlib_rc_falls_back_to_dejavu(fonts, monkeypatch):
+    monkeypatch.setattr(korean_font, "korean_font_family", lambda: None)
+    assert korean_font.matplotlib_font_rc() == {"font.family": ["DejaVu Sans"]}
@@ -0,0 +1,154 @@
+"""phase_render 구간 나누기·캐시 키 테스트 (manim 없이, 임시 장면 모듈로)
+
+    python -m pytest -q test_phase_render.py
+"""
+import itertools
+import sys
+
+import pytest
+
+import phase_render
+
+SCENE = '''
+from helper_{n} import SPEED
+
+OFFSET = 1
+
+
+def shifted(x):
+    return x + OFFSET
+
+
+class Demo:
+    EXTRA = False
+    SIZE = 2
+
+    def construct(self):
+        self.intro()
+        self.clear_screen()
+        self.phase1()
+        self.clear_screen()
+        if self.EXTRA:
+            self.phase_extra()
+            self.clear_screen()
+        self.phase2()
+
+    def clear_screen(self):
+        pass
+
+    def intro(self):
+        return "intro"
+
+    def phase1(self):
+        return shifted(self.SIZE) * SPEED
+
+    def phase_extra(self):
+        return "extra"
+
+    def phase2(self):
+        return "phase2"
+'''
+
+_counter = itertools.count()
+
+
+@pytest.fixture
+def scene(tmp_path, monkeypatch):
+    """임시 폴더에 장면 모듈 + 보조 모듈 2단계(helper → base)를 만들고 읽는 함수"""
+    monkeypatch.setattr(phase_render, "quality_signature", lambda: "test")
+    n = next(_counter)
+    files = {
+        "scene": tmp_path / f"scene_{n}.py",
+        "helper": tmp_path / f"helper_{n}.py",
+        "base": tmp_path / f"base_{n}.py",
+    }
+    files["scene"].write_text(SCENE.format(n=n), encoding="utf-8")
+    files["helper"].write_text(f"from base_{n} import SCALE\n\nSPEED = 3 * SCALE\n", encoding="utf-8")
+    files["base"].write_text("SCALE = 1\n", encoding="utf-8")
+
+    def load(**edits):
+        for name, (old, new) in edits.items():
+            files[name].write_text(files[name].read_text(encoding="utf-8").replace(old, new),
+                                   encoding="utf-8")
+        for stem in (f"scene_{n}", f"helper_{n}", f"base_{n}"):
+            sys.modules.pop(stem, None)
+        return phase_render.load_scene(files["scene"], "Demo")
+
+    yield load
+    for stem in (f"scene_{n}", f"helper_{n}", f"base_{n}"):
+        sys.modules.pop(stem, None)
+
+
+def keys(scene_cls):
+    return [phase_render.phase_key(scene_cls, phase) for phase in phase_render.scene_phases(scene_cls)]
+
+
+def test_scene_phases_split_on_clear_screen(scene):
+    assert phase_render.scene_phases(scene()) == [["intro"], ["phase1"], ["phase2"]]
+
+
+def test_scene_phases_follow_constant_gates(scene):
+    demo = scene()
+    assert ["phase_extra"] in phase_render.scene_phases(demo, include_disabled=True)
+    demo.EXTRA = True
+    assert phase_render.scene_phases(demo) == [["intro"], ["phase1"], ["phase_extra"], ["phase2"]]
+
+
+def test_helper_modules_are_followed_transitively(scene):
+    files = phase_render._helper_module_files(scene())
+    assert [path.stem.split("_")[0] for path in files] == ["base", "helper"]
+
+
+def test_phase_key_ignores_edits_to_other_phases(scene):
+    before = keys(scene())
+    after = keys(scene(scene=('return "phase2"', 'return "phase2 edited"')))
+    assert after[:2] == before[:2]
+    assert after[2] != before[2]
+
+
+def test_phase_key_tracks_module_level_code(scene):
+    before = keys(scene())
+    after = keys(scene(scene=("OFFSET = 1", "OFFSET = 2")))
+    assert all(b != a for b, a in zip(before, after))
+
+
+def test_phase_key_tracks_class_constants_and_indirect_helpers(scene):
+    before = keys(scene())
+    assert keys(scene(scene=("SIZE = 2", "SIZE = 5")))[1] != before[1]
+    assert keys(scene(base=("SCALE = 1", "SCALE = 2")))[1] != before[1]
+
+
+def test_segment_prefix_keeps_quality_and_phase_apart(tmp_path):
+    low = phase_render.segment_prefix("Demo", "low_quality", ["phase1"])
+    high = phase_render.segment_prefix("Demo", "high_quality", ["phase1"])
+    other = phase_render.segment_prefix("Demo", "low_quality", ["phase2"])
+    assert len({low, high, other}) == 3
+
+    kept = [tmp_path / f"{high}.aaaa.mp4", tmp_path / f"{other}.bbbb.mp4"]
+    old, new = tmp_path / f"{low}.0000.mp4", tmp_path / f"{low}.1111.mp4"
+    for path in (*kept, old, new):
+        path.write_bytes(b"")
+    phase_render.remove_stale_segments(tmp_path, low, new)
+    assert sorted(tmp_path.iterdir()) == sorted([*kept, new])
+
+
+def test_overrides_set_class_constants(scene):
+    overrides = phase_render.parse_overrides(["EXTRA=True", "SIZE=5"])
+    assert overrides == {"EXTRA": True, "SIZE": 5}
+    demo = scene()
+    before = keys(demo)[1]
+    demo = phase_render.load_scene(sys.modules[demo.__module__].__file__, "Demo", overrides)
+    assert ["phase_extra"] in phase_render.scene_phases(demo)
+    assert keys(demo)[1] != before
+
+
+@pytest.mark.parametrize("item", ["EXTRA", "size=3"])
+def test_overrides_reject_malformed_items(item):
+    with pytest.raises(ValueError):
+        phase_render.parse_overrides([item])
+
+
+def test_overrides_reject_unknown_constants(scene):
+    demo = scene()
+    with pytest.raises(ValueError):
+        phase_render.load_scene(sys.modules[demo.__module__].__file__, "Demo", {"MISSING": 1})
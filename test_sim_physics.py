@@ -0,0 +1,237 @@
+"""sim_physics 회귀 테스트 (manim 없이 실행)
+
+    python -m pytest -q test_sim_physics.py
+"""
+import numpy as np
+import pytest
+
+from sim_physics import (ForceSchedule, GasBox, PushApart, SpringContact, TrackRun,
+                         TrajectoryTable, WorkRun, collide_1d, frame_times)
+
+
+# ═══════════ 프레임 시각 / 궤적 표 ═══════════
+
+def test_frame_times_covers_every_break():
+    times = frame_times([0, 1.0, 2.5], fps=10, real_per_sim=2.0)
+    assert times[0] == 0 and times[-1] == 2.5
+    assert 1.0 in times
+    assert np.allclose(np.diff(times), 0.05)
+
+
+def test_frame_times_single_break():
+    assert list(frame_times([0], fps=30)) == [0.0]
+
+
+def test_piecewise_table_positions_and_momentum():
+    times = np.linspace(0, 3, 31)
+    table = TrajectoryTable.from_piecewise(
+        times, masses=[1, 2], x0=[0.0, 5.0], breaks=[1.0], velocities=[[2, 0], [0, 1]], scale_v=0.5)
+    assert table.position(0, 1.0) == pytest.approx(1.0)
+    assert table.position(0, 3.0) == pytest.approx(1.0)
+    assert table.position(1, 3.0) == pytest.approx(6.0)
+    assert table.momentum(1, 2.0) == pytest.approx(2.0)
+    assert table.bar_values(0.5) == [2.0, 0.0, 2.0]
+
+
+def test_constant_accel_table():
+    times = np.linspace(0, 2, 21)
+    table = TrajectoryTable.from_constant_accel(times, masses=[1, 2], forces=2.0)
+    assert np.allclose(table.a, [2, 1])
+    assert table.position(0, 2.0) == pytest.approx(4.0)
+    assert table.velocity(1, 2.0) == pytest.approx(2.0)
+
+
+# ═══════════ 1차원 충돌 ═══════════
+
+@pytest.mark.parametrize("restitution", [1.0, 0.5, 0.0])
+def test_collide_1d_conserves_momentum(restitution):
+    masses = np.array([1.0, 2.0, 3.0])
+    history = collide_1d(masses, [0.5] * 3, [-4.0, 0.0, 2.0], [6.0, 0.0, 0.0], restitution)
+    p = masses @ history["velocities"]
+    assert np.allclose(p, p[0])
+    assert np.all(np.diff(history["breaks"]) > 0)
+
+
+def test_collide_1d_elastic_equal_masses_swap_velocities():
+    history = collide_1d([1, 1], [1.0, 1.0], [0.0, 3.0], [4.0, 0.0])
+    assert history["breaks"] == pytest.approx([0.5])
+    assert np.allclose(history["velocities"][:, -1], [0.0, 4.0])
+
+
+def test_collide_1d_elastic_conserves_energy():
+    masses = np.array([1.0, 2.0, 3.0])
+    history = collide_1d(masses, [0.5] * 3, [-4.0, 0.0, 2.0], [6.0, 0.0, 0.0])
+    ke = 0.5 * masses @ history["velocities"] ** 2
+    assert np.allclose(ke, ke[0])
+
+
+def test_collide_1d_respects_t_end():
+    history = collide_1d([1, 1], [1.0, 1.0], [0.0, 3.0], [4.0, 0.0], t_end=0.4)
+    assert len(history["breaks"]) == 0
+
+
+def test_collide_1d_rejects_unsorted_positions():
+    with pytest.raises(ValueError):
+        collide_1d([1, 1], [1, 1], [3.0, 0.0], [0.0, 1.0])
+
+
+# ═══════════ 용수철 충돌 모형 ═══════════
+
+def test_spring_contact_total_impulse_and_peak():
+    contact = SpringContact(impulse=6.0, v_impact=3.0, delta_t=0.2)
+    assert np.trapezoid(contact.F, contact.tau) == pytest.approx(6.0, rel=1e-4)
+    assert contact.force(contact.t_peak) == pytest.approx(contact.F_peak)
+    assert contact.velocity(0.2) == pytest.approx(0.0)
+    assert contact.impulse_at(1.0) == pytest.approx(6.0)
+
+
+# ═══════════ 힘 일정표 ═══════════
+
+def test_force_schedule_impulse_matches_velocity_change():
+    schedule = ForceSchedule(2.0, [(0.5, 1.5, lambda t: 4.0), (2.0, 3.0, lambda t: -2.0 * (t - 2.0))],
+                             t_end=4.0, v0=1.0)
+    assert schedule.impulse_at(1.5) == pytest.approx(4.0)
+    assert schedule.impulse_at(4.0) == pytest.approx(3.0)
+    assert schedule.velocity(4.0) == pytest.approx(1.0 + 3.0 / 2.0)
+    # 상수 힘 구간은 위치가 해석해와 같다
+    assert schedule.position(1.5) == pytest.approx(1.5 + 0.5 * 2.0 * 1.0**2)
+
+
+def test_force_schedule_shared_breakpoint_counts_one_segment():
+    # 이어 붙인 두 구간의 경계(t=1)에서 F1 + F2로 튀지 않는다
+    schedule = ForceSchedule(1.0, [(0.0, 1.0, lambda t: 2.0), (1.0, 2.0, lambda t: 5.0)], t_end=2.0)
+    assert schedule.force(1.0) == pytest.approx(5.0)
+    assert schedule.force(2.0) == pytest.approx(5.0)
+    assert schedule.F[np.searchsorted(schedule.t, 1.0)] == pytest.approx(5.0)
+    assert np.max(schedule.force(np.linspace(0, 2, 201))) == pytest.approx(5.0)
+    assert schedule.impulse_at(2.0) == pytest.approx(7.0)
+
+
+# ═══════════ 경로 위 미끄럼 ═══════════
+
+ANGLE = np.radians(30)
+
+
+def incline_run(mu=0.0, drag=0.0, flat=5.0, wall=None):
+    return TrackRun(2.0, [
+        (10.0, lambda s: 5.0 - s * np.sin(ANGLE), lambda s: -np.sin(ANGLE) + 0 * s),
+        (flat, lambda s: 0.0 * s, lambda s: 0.0 * s),
+    ], mu=mu, drag=drag, wall=wall)
+
+
+def test_track_run_frictionless_conserves_energy():
+    run = incline_run(flat=30.0)
+    # 벽이 없으면 경로 끝(t_stop)에서 멈추므로 그 직전까지
+    run.sample(np.union1d(np.linspace(0, run.t_stop, 200, endpoint=False), run.breaks))
+    assert run.breaks == pytest.approx([2.0])           # 10 m를 a = 5 m/s²로
+    assert run.speed(run.breaks[0]) == pytest.approx(10.0)
+    assert np.allclose(run.pe + run.ke, 100.0)
+    assert run.t_stop == pytest.approx(2.0 + 3.0)        # 수평면 30 m를 10 m/s로 끝까지
+
+
+def test_track_run_friction_heat_balances_energy():
+    run = incline_run(mu=0.1, drag=0.05, flat=100.0)
+    run.sample(np.linspace(0, run.t_stop, 400))
+    assert np.allclose(run.pe + run.ke + run.heat, 100.0, atol=1e-5)
+    assert run.t_stop < run.breaks[0] + 10.0
+    assert run.speed(run.t_stop) == pytest.approx(0.0, abs=1e-6)
+
+
+def test_track_run_stops_on_flat_under_friction():
+    run = incline_run(mu=0.2, flat=100.0)
+    v_bottom = np.sqrt(2 * 10 * (5.0 - 0.2 * np.cos(ANGLE) * 10.0))
+    # 수평면에서는 a = -μg로 감속해 멈춘다
+    assert run.t_stop - run.breaks[0] == pytest.approx(v_bottom / 2.0, rel=1e-6)
+
+
+@pytest.mark.parametrize("mu", [np.tan(ANGLE), 0.6, 1.0])
+def test_track_run_held_by_static_friction(mu):
+    run = incline_run(mu=mu)
+    assert run.t_stop == 0
+    assert run.breaks == []
+    run.sample(frame_times([0], 30))
+    assert run.speed(0) == 0 and run.heat_at(0) == 0
+
+
+def test_track_run_elastic_wall_bounces_back_up_the_incline():
+    run = incline_run(flat=5.0, wall=1.0)
+    t_bottom, t_wall, t_back = run.breaks[:3]
+    assert (t_wall - t_bottom, t_back - t_wall) == pytest.approx((0.5, 0.5))
+    run.sample(np.union1d(np.linspace(0, t_back + 2.0, 300), run.breaks))
+    assert np.allclose(run.pe + run.ke, 100.0)
+    assert run.speed(t_wall) == pytest.approx(10.0)
+    assert run.height(t_back + 2.0) == pytest.approx(5.0, abs=1e-6)   # 처음 높이까지 다시 올라감
+
+
+@pytest.mark.parametrize("wall", [0.0, 0.5])
+def test_track_run_wall_loss_goes_to_heat(wall):
+    run = incline_run(mu=0.1, flat=5.0, wall=wall)
+    run.sample(np.union1d(np.linspace(0, run.t_stop, 400), run.breaks))
+    assert np.allclose(run.pe + run.ke + run.heat, 100.0, atol=1e-5)
+    assert run.kinetic(run.t_stop) == 0
+
+
+def test_track_run_without_wall_stops_at_track_end():
+    run = incline_run(flat=5.0)
+    assert run.t_stop == pytest.approx(2.5)
+    assert run.breaks == pytest.approx([2.0])
+
+
+# ═══════════ 2차원 원판 충돌 ═══════════
+
+def test_gas_box_conserves_energy_and_counts_wall_impulse():
+    rng = np.random.default_rng(0)
+    grid = np.stack(np.meshgrid(np.linspace(-0.8, 0.8, 10), np.linspace(-0.8, 0.8, 10)), -1)
+    x0 = grid.reshape(-1, 2)
+    v0 = rng.normal(0.0, 1.0, x0.shape)
+    gas = GasBox((-1, 1, -1, 1), 0.05, x0, v0).run(np.linspace(0, 2, 41))
+    assert np.allclose(gas.KE, gas.KE[0])
+    assert gas.wall[-1] > 0
+    assert np.all(np.abs(gas.positions) <= 1.0 + 0.1)
+
+
+def test_gas_box_pair_collision_conserves_momentum():
+    # 벽에 닿기 전 정면 충돌 한 번 (같은 질량이면 속도 교환)
+    gas = GasBox((-10, 10, -10, 10), 0.5, [[-1.0, 0.0], [1.0, 0.0]], [[1.0, 0.0], [-1.0, 0.0]])
+    p0 = gas.momentum()
+    gas.run(np.linspace(0, 1.5, 151), substeps=1)
+    assert np.allclose(gas.P, p0)
+    assert np.allclose(gas.v, [[-1.0, 0.0], [1.0, 0.0]])
+
+
+# ═══════════ 서로 밀기 ═══════════
+
+def test_push_apart_two_bodies():
+    push = PushApart([1, 3], 3.0, 1.0)
+    assert np.allclose(push.accel, [-3, 1])
+    assert np.allclose(push.position(2.0), [-4.5, 1.5])
+    assert np.allclose(push.velocity(5.0), [-3, 1])
+
+
+def test_push_apart_chain_conserves_momentum():
+    masses = np.array([1.0, 2.0, 1.0])
+    push = PushApart(masses, [2.0, 1.0], [1.0, 0.5])
+    times = np.linspace(0, 2, 21)
+    assert np.allclose(masses @ push.velocity(times), 0.0)
+    assert np.allclose(push.force(times).sum(axis=0), 0.0)
+    table = push.table(times)
+    assert np.allclose(table.p.sum(axis=0), 0.0)
+    # 가운데 물체가 오른쪽 접촉면에 더 세게 밀려 왼쪽 물체를 파고드는 조합은 거부
+    with pytest.raises(ValueError):
+        PushApart([1, 1, 1], [1, 5], 1.0)
+
+
+# ═══════════ 일-운동에너지 ═══════════
+
+def test_work_run_work_equals_kinetic_change():
+    run = WorkRun(1.0, lambda x: 4.0 - x, x_stop=3.0)
+    run.sample(np.linspace(0, run.t_stop, 91))
+    assert run.max_error < 1e-4 * max(run.K)
+    assert run.position(run.t_stop) == pytest.approx(3.0)
+    assert run.work(run.t_stop) == pytest.approx(4.0 * 3.0 - 3.0**2 / 2, rel=1e-4)
+
+
+def test_work_run_spring_oscillation():
+    run = WorkRun(1.0, lambda x: -4.0 * x, x0=1.0, t_max=np.pi).sample(np.linspace(0, np.pi, 301))
+    assert run.position(np.pi) == pytest.approx(1.0, abs=1e-6)
+    assert run.velocity(np.pi / 4) == pytest.approx(-2.0, abs=1e-6)
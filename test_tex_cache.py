@@ -0,0 +1,30 @@
+"""tex_cache 미리 데우기 문자열 목록 테스트 (manim 필요)
+
+    python -m pytest -q test_tex_cache.py
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from tex_cache import format_values
+
+
+def label(v):
+    return f"v = {v:.1f}"
+
+
+def test_format_values_lists_every_step_once():
+    values = format_values(label, 0, 1, decimals=1)
+    assert values == sorted(label(k / 10) for k in range(11))
+
+
+def test_format_values_covers_label_strings_in_range():
+    # 격자에 맞지 않는 양 끝, 음수 쪽 "-0.0"까지 라벨이 실제로 만드는 문자열을 모두 포함
+    values = set(format_values(label, -0.37, 2.43, decimals=1))
+    xs = np.random.default_rng(0).uniform(-0.37, 2.43, 2000)
+    assert {label(x) for x in np.append(xs, [-0.37, -0.04, 2.43])} <= values
+
+
+def test_format_values_ignores_bound_order():
+    assert format_values(label, 3, -1, decimals=1) == format_values(label, -1, 3, decimals=1)
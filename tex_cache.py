@@ -0,0 +1,104 @@
+"""매 프레임 바뀌는 숫자 라벨용 MathTex 글리프 캐시
+
+always_redraw(lambda: MathTex(f"v = {x:.1f}"))는 새 문자열마다 LaTeX 컴파일과
+SVG 파싱을 거친다. cached_math_tex는 컴파일 결과의 글리프 경로(점 배열)를
+내용 해시로 media/tex_glyphs/에 저장해 두고, 이후 실행에서도 그대로 재사용한다.
+prewarm_tex는 트래커가 지나갈 문자열 전체를 렌더 전에 병렬로 컴파일해 둔다.
+"""
+import hashlib
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import *
+import numpy as np
+
+_GLYPHS = {}
+
+
+def _cache_dir():
+    return Path(config.media_dir) / "tex_glyphs"
+
+
+def _tex_key(tex, tex_template):
+    h = hashlib.sha256()
+    h.update(tex_template.body.encode())
+    h.update(b"\0")
+    h.update(tex.encode())
+    return h.hexdigest()[:24]
+
+
+def _compile_glyphs(tex, tex_template, path):
+    """MathTex 하나를 컴파일해 글리프 점 배열을 path(.npz)에 저장 → 배열 목록"""
+    mob = MathTex(tex, tex_template=tex_template)
+    glyphs = [np.array(m.points) for m in mob.family_members_with_points()]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staged = path.with_name(f".{path.stem}.{os.getpid()}.tmp")
+    with open(staged, "wb") as f:
+        np.savez(f, *glyphs)
+    os.replace(staged, path)
+    return glyphs
+
+
+def load_glyphs(tex):
+    """tex를 DEFAULT_FONT_SIZE로 컴파일한 글리프 점 배열 목록 (메모리 → 디스크 → LaTeX 순)"""
+    tex_template = config.tex_template
+    key = _tex_key(tex, tex_template)
+    glyphs = _GLYPHS.get(key)
+    if glyphs is not None:
+        return glyphs
+    path = _cache_dir() / f"{key}.npz"
+    if path.exists():
+        with np.load(path) as data:
+            glyphs = [data[f"arr_{i}"] for i in range(len(data.files))]
+    else:
+        glyphs = _compile_glyphs(tex, tex_template, path)
+    _GLYPHS[key] = glyphs
+    return glyphs
+
+
+def cached_math_tex(tex, font_size=DEFAULT_FONT_SIZE, color=WHITE):
+    """MathTex(tex, font_size=..., color=...)와 같은 모양의 VGroup (글리프 캐시 사용)"""
+    group = VGroup(*[
+        VMobject(stroke_width=0, fill_opacity=1.0).set_points(points.copy())
+        for points in load_glyphs(tex)
+    ])
+    group.scale(font_size / DEFAULT_FONT_SIZE, about_point=ORIGIN)
+    group.set_color(color)
+    return group
+
+
+def format_values(fmt, lo, hi, decimals):
+    """[lo, hi] 구간의 값을 소수 decimals자리로 표시할 때 나올 수 있는 문자열 전체
+
+    fmt는 값 → TeX 문자열 함수 (라벨과 같은 함수를 넘긴다).
+    """
+    scale = 10 ** decimals
+    lo, hi = min(lo, hi), max(lo, hi)
+    values = {fmt(k / scale) for k in range(math.floor(lo * scale), math.ceil(hi * scale) + 1)}
+    if lo < 0:
+        values.add(fmt(-0.0))
+    return sorted(values)
+
+
+def prewarm_tex(texs, jobs=None):
+    """캐시에 없는 문자열들을 프로세스 풀에서 한꺼번에 컴파일"""
+    tex_template = config.tex_template
+    cache_dir = _cache_dir()
+    missing = [
+        tex for tex in dict.fromkeys(texs)
+        if not (cache_dir / f"{_tex_key(tex, tex_template)}.npz").exists()
+    ]
+    jobs = min(jobs or os.cpu_count() or 1, len(missing))
+    if jobs <= 1:
+        for tex in missing:
+            load_glyphs(tex)
+        return len(missing)
+
+    paths = [cache_dir / f"{_tex_key(tex, tex_template)}.npz" for tex in missing]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        list(pool.map(_compile_glyphs, missing, [tex_template] * len(missing), paths))
+    return len(missing)
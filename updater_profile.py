@@ -0,0 +1,166 @@
+"""updater / always_redraw 별 프레임 시간 분석 (필요할 때만 켜는 계측)
+
+    python updater_profile.py 운동량보존.py MomentumConservation            # 장면 전체
+    python updater_profile.py 운동량보존.py MomentumConservation --phase 2  # 구간 하나
+    python updater_profile.py 운동량보존.py MomentumConservation --folded media/prof.folded
+
+profile_updaters()가 켜져 있는 동안 Mobject.add_updater로 붙는 모든 updater
+(always_redraw가 내부에서 붙이는 것 포함)를 시간 측정 래퍼로 감싼다.
+각 updater는 붙인 위치의 구간 메서드와 소스 줄로 묶어 집계하고, 렌더가 끝나면
+총 시간 순 표를 출력하거나 flamegraph.pl / speedscope가 읽는 folded 파일로 쓴다.
+"""
+import argparse
+import functools
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import manim
+from manim import Mobject, Scene, config, tempconfig
+
+from bench_render import HEADLESS_CONFIG
+from phase_render import QUALITY_FLAGS, load_scene, phase_scene
+
+_MANIM_DIR = str(Path(manim.__file__).resolve().parent)
+
+
+# ═══════════ 태그 ═══════════
+
+def _caller_tag():
+    """add_updater를 부른 곳 → (구간 메서드, "파일:줄", 종류)
+
+    구간 메서드는 construct가 직접 부른 장면 메서드, 소스 줄은 그 메서드와 같은 파일에서
+    가장 안쪽 호출 위치다 (TracedCurve처럼 보조 모듈 안에서 붙는 updater도 장면 줄로 묶인다).
+    """
+    frame = sys._getframe(2)
+    kind, phase, phase_file = "add_updater", "?", None
+    sites = []
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename.startswith(_MANIM_DIR) or code.co_filename == __file__:
+            if code.co_name == "always_redraw":
+                kind = "always_redraw"
+        else:
+            sites.append((code.co_filename, frame.f_lineno))
+            if isinstance(frame.f_locals.get("self"), Scene):
+                if code.co_name == "construct":
+                    break
+                phase, phase_file = code.co_name, code.co_filename
+        frame = frame.f_back
+    site = next((s for s in sites if s[0] == phase_file), sites[0] if sites else ("?", 0))
+    return phase, f"{Path(site[0]).name}:{site[1]}", kind
+
+
+# ═══════════ 집계 ═══════════
+
+class UpdaterProfile:
+    """태그별 [호출 수, 총 시간(s), 최대 시간(s)]"""
+
+    def __init__(self):
+        self.stats = {}
+        self.frames = 0
+
+    def wrap(self, func, tag):
+        entry = self.stats.setdefault(tag, [0, 0.0, 0.0])
+        clock = time.perf_counter
+
+        # functools.wraps가 __wrapped__를 남기므로 manim의 dt 인자 판별은 원래 함수 기준
+        @functools.wraps(func)
+        def timed(*args):
+            start = clock()
+            try:
+                return func(*args)
+            finally:
+                elapsed = clock() - start
+                entry[0] += 1
+                entry[1] += elapsed
+                if elapsed > entry[2]:
+                    entry[2] = elapsed
+
+        return timed
+
+    def ranked(self):
+        return sorted(self.stats.items(), key=lambda item: item[1][1], reverse=True)
+
+    def print_table(self, top=30):
+        total = sum(entry[1] for entry in self.stats.values()) or 1.0
+        frames = max(self.frames, 1)
+        print(f"{'#':>3} {'total ms':>9} {'%':>5} {'calls':>7} {'us/call':>8} {'max us':>8} "
+              f"{'ms/frame':>8}  {'phase':<32} {'site':<24} kind")
+        for rank, ((phase, site, kind), (calls, spent, worst)) in enumerate(self.ranked()[:top], 1):
+            print(f"{rank:>3} {spent * 1e3:>9.1f} {spent / total * 100:>5.1f} {calls:>7} "
+                  f"{spent / max(calls, 1) * 1e6:>8.1f} {worst * 1e6:>8.1f} "
+                  f"{spent / frames * 1e3:>8.3f}  {phase:<32} {site:<24} {kind}")
+        print(f"updater 합계 {total * 1e3:.1f} ms / {self.frames} frames "
+              f"= {total / frames * 1e3:.2f} ms/frame")
+
+    def write_folded(self, path, root):
+        """flame graph용 folded 형식 ("root;구간;줄(종류) 마이크로초")"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = [
+            f"{root};{phase};{site}({kind}) {round(spent * 1e6)}"
+            for (phase, site, kind), (_, spent, _) in self.ranked() if spent > 0
+        ]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
+
+
+@contextmanager
+def profile_updaters():
+    """with 블록 안에서 붙는 updater를 계측 → UpdaterProfile"""
+    profile = UpdaterProfile()
+    real_add, real_remove = Mobject.add_updater, Mobject.remove_updater
+
+    def add_updater(self, update_function, index=None, call_updater=False):
+        timed = profile.wrap(update_function, _caller_tag())
+        return real_add(self, timed, index=index, call_updater=call_updater)
+
+    def remove_updater(self, update_function):
+        # 감싸기 전 함수로 떼어도 래퍼가 같이 떨어지도록
+        self.updaters = [
+            f for f in self.updaters
+            if f is not update_function and getattr(f, "__wrapped__", None) is not update_function
+        ]
+        return self
+
+    Mobject.add_updater, Mobject.remove_updater = add_updater, remove_updater
+    try:
+        yield profile
+    finally:
+        Mobject.add_updater, Mobject.remove_updater = real_add, real_remove
+
+
+# ═══════════ 실행 ═══════════
+
+def profile_scene(scene_file, scene_name, phase=None, quality="low_quality"):
+    """장면(또는 구간 하나)을 영상 출력 없이 렌더하며 updater 계측 → UpdaterProfile"""
+    scene_cls = load_scene(scene_file, scene_name)
+    if phase is not None:
+        scene_cls = phase_scene(scene_cls, phase)
+    with tempconfig({"quality": quality, **HEADLESS_CONFIG}), profile_updaters() as profile:
+        scene = scene_cls()
+        scene.render()
+        profile.frames = round(scene.renderer.time * config.frame_rate)
+    return profile
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="updater별 프레임 시간 분석")
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("--phase", type=int, default=None, help="구간 번호 (phase_render.py --list 참고)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default="l")
+    parser.add_argument("--top", type=int, default=30)
+    parser.add_argument("--folded", default=None, help="flame graph용 folded 파일 경로")
+    args = parser.parse_args(argv)
+
+    profile = profile_scene(args.scene_file, args.scene_name, args.phase, QUALITY_FLAGS[args.quality])
+    profile.print_table(args.top)
+    if args.folded:
+        print(profile.write_folded(args.folded, args.scene_name))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,12 @@ from manim import FadeOut
 from manim import *
 import numpy as np
 
+from korean_font import use_korean_font_in_manim
+from sim_mobjects import LineBundle, MarkerCloud, c2p_array
+from sim_physics import TrajectoryTable, frame_times
+
+use_korean_font_in_manim()
+
 
 class NewtonsSecondLaw(Scene):
     # ── 폰트 크기 ──
@@ -13,6 +19,12 @@ class NewtonsSecondLaw(Scene):
     FONT_CALC = 36
     FONT_CALC_RESULT = 40
 
+    # ── 일괄 시행 (0이면 손으로 정한 3회 시행, n이면 n개 시행을 동시에:
+    #    python phase_render.py 가속도법칙.py NewtonsSecondLaw --set SWEEP_TRIALS=24) ──
+    SWEEP_TRIALS = 0
+    SWEEP_RANGES = {"force": (0.5, 3.0), "mass": (1.0, 3.0)}   # 바꾸는 양의 범위 (다른 쪽은 1)
+    SWEEP_VIEW = "lanes"   # "lanes": 레인 경주 + 산점도, "scatter": v-t 직선 묶음 + 산점도만
+
     def construct(self):
         self.intro()
         self.clear_screen()
@@ -52,6 +64,65 @@ class NewtonsSecondLaw(Scene):
 
         return track, tick_marks, tick_labels, pos_label, TRACK_START, TRACK_END
 
+    def _run_sweep(self, n_trials, vary, track, track_start, track_end, total_dist,
+                   axes_vt, axes_result, color):
+        """vary("force" 또는 "mass")를 SWEEP_RANGES 범위에서 n_trials개로 나눈 시행 전체를
+        한 번에 계산해 동시에 재생 → 남은 mobject VGroup (n_trials가 0이면 아무것도 안 하고 None)
+
+        궤적은 TrajectoryTable 하나에 브로드캐스트로 미리 계산하고, 레인 표식·v-t 직선·결과 점은
+        각각 VMobject 하나로 묶으므로 시행 수가 늘어도 updater는 두 개뿐이다.
+        """
+        if not n_trials:
+            return None
+        TOTAL_TIME = 4
+        RUN_TIME = 5
+        values = np.linspace(*self.SWEEP_RANGES[vary], n_trials)
+        forces, masses = (values, np.ones(n_trials)) if vary == "force" else (np.ones(n_trials), values)
+        n = n_trials
+        table = TrajectoryTable.from_constant_accel(
+            frame_times([0, TOTAL_TIME], config.frame_rate, RUN_TIME / TOTAL_TIME), masses, forces)
+        accel = table.a
+        t_tracker = ValueTracker(0)
+        sweep_mobs = VGroup()
+
+        # ── 레인 표식 (트랙 위로 시행마다 한 줄) ──
+        if self.SWEEP_VIEW == "lanes":
+            track_y = track.get_center()[1]
+            lane_gap = min(1.3 / n, 0.45)
+            lane_y = track_y + 0.15 + lane_gap * (np.arange(n) + 0.5)
+            size = 0.8 * lane_gap
+            span = track_end[0] - track_start[0]
+
+            def lane_positions():
+                x = table.x[:, table.index(t_tracker.get_value())]
+                px = track_start[0] + span * np.minimum(x / total_dist, 1.0)
+                return np.column_stack([px, lane_y, np.zeros(n)])
+
+            markers = MarkerCloud(Square(side_length=size, color=color, fill_opacity=0.8, stroke_width=0),
+                                  lane_positions())
+            markers.add_updater(lambda m: m.set_positions(lane_positions()))
+            self.play(FadeIn(markers), run_time=0.5)
+            sweep_mobs.add(markers)
+
+        # ── v-t 직선 묶음 ──
+        origin = np.tile(axes_vt.c2p(0, 0), (n, 1))
+        fan = LineBundle(color=color, stroke_width=2, stroke_opacity=0.7)
+        fan.add_updater(lambda m: m.set_segments(
+            origin, c2p_array(axes_vt, t_tracker.get_value(), accel * t_tracker.get_value())))
+        fan.set_segments(origin, origin)
+        self.add(fan)
+        sweep_mobs.add(fan)
+
+        self.play(t_tracker.animate.set_value(TOTAL_TIME), run_time=RUN_TIME, rate_func=linear)
+        for mob in sweep_mobs:
+            mob.clear_updaters()
+
+        # ── 결과 산점도 ──
+        dots = MarkerCloud(Dot(radius=0.06, color=RED), c2p_array(axes_result, values, accel))
+        self.play(FadeIn(dots), run_time=0.75)
+        sweep_mobs.add(dots)
+        return sweep_mobs
+
     # ═══════════ Phase 1: 인트로 ═══════════
     def intro(self):
         # ── 1. F = ma 수식 등장 ──
@@ -123,6 +194,9 @@ class NewtonsSecondLaw(Scene):
             {"F": 2, "a": 2, "color": GREEN,  "label": "2F"},
             {"F": 3, "a": 3, "color": ORANGE, "label": "3F"},
         ]
+        if self._run_sweep(self.SWEEP_TRIALS, "force", track, track_start, track_end, 24,
+                           axes_vt, axes_af, BLUE):
+            trials = []
 
         TOTAL_TIME = 4
         TOTAL_DIST = 24
@@ -263,6 +337,9 @@ class NewtonsSecondLaw(Scene):
             {"m": 2, "a": 0.5,   "color": GREEN,  "label": "2m"},
             {"m": 3, "a": 1/3,   "color": ORANGE, "label": "3m"},
         ]
+        if self._run_sweep(self.SWEEP_TRIALS, "mass", track, track_start, track_end, 8,
+                           axes_vt, axes_am, GREEN):
+            trials = []
 
         TOTAL_TIME = 4
         TOTAL_DIST = 8
@@ -5,12 +5,12 @@ Physics STEM Visualizer 스킬 기반 - 라이트 모드
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-import matplotlib.font_manager as fm
 import numpy as np
 
+from korean_font import korean_font_properties
+
 # 한글 폰트 설정
-font_path = '/usr/share/fonts/truetype/nanum/NanumGothic.ttf'
-font_prop = fm.FontProperties(fname=font_path)
+font_prop = korean_font_properties()
 
 # 색상 팔레트 (라이트 테마)
 COLORS = {
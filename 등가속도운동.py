@@ -1,6 +1,11 @@
 from manim import *
 import numpy as np
 
+from korean_font import use_korean_font_in_manim
+from sim_mobjects import GhostTrail, NumericLabel
+
+use_korean_font_in_manim()
+
 
 class UniformAccelerationMotion(Scene):
     # ── 물리 상수 ──
@@ -130,23 +135,19 @@ class UniformAccelerationMotion(Scene):
         self.play(FadeIn(ball), run_time=0.75)
         self.wait(0.45)
 
-        self.ghost_group = VGroup()
-        self.add(self.ghost_group)
-
         # ── 1. 속도 라벨 ──
         time_tracker = ValueTracker(0)
 
-        velocity_label = always_redraw(lambda: MathTex(
-            f"v = {self.V_INIT + self.ACCEL * time_tracker.get_value():.1f}\\,\\text{{m/s}}",
+        velocity_label = NumericLabel(
+            "v =", decimals=1, suffix="\\,\\text{m/s}",
             font_size=self.FONT_LABEL,
             color=BLUE
-        ).next_to(ball, UP, buff=0.1))
+        )
+        velocity_label.add_updater(lambda m: m.set_value(
+            self.V_INIT + self.ACCEL * time_tracker.get_value()
+        ).next_to(ball, UP, buff=0.1), call_updater=True)
         self.add(velocity_label)
 
-        time_tracker.last_int_t = 0
-
-        self.ghost_x_coords = [ball.get_center()[0]]
-
         # ── 2. 이동 updater ──
         track = self.track
         track_start = self.track_start
@@ -154,24 +155,24 @@ class UniformAccelerationMotion(Scene):
         v_init = self.V_INIT
         accel = self.ACCEL
         total_dist = self.TOTAL_DIST
-        ghost_group = self.ghost_group
-        ghost_x_coords = self.ghost_x_coords
 
-        def update_ball(m):
-            t = time_tracker.get_value()
+        def ball_pos(t):
             s = v_init * t + 0.5 * accel * t ** 2
             x_ratio = s / total_dist
             new_x = track_start[0] + (track_end[0] - track_start[0]) * x_ratio
-            m.move_to([new_x, track.get_center()[1] + OBJ_SIZE / 2 + 0.1, 0])
-            current_int_t = int(t)
+            return [new_x, track.get_center()[1] + OBJ_SIZE / 2 + 0.1, 0]
 
-            if current_int_t > time_tracker.last_int_t:
-                current_center = m.get_center()
-                ghost_base = Square(side_length=OBJ_SIZE, color=BLUE, fill_opacity=0.3, stroke_width=0)
-                ghost_base.move_to(current_center)
-                ghost_group.add(ghost_base)
-                ghost_x_coords.append(current_center[0])
-                time_tracker.last_int_t = current_int_t
+        def update_ball(m):
+            m.move_to(ball_pos(time_tracker.get_value()))
+
+        # ── 3. 1초마다 남는 잔상 (미리 배치, 지나간 시각만 보이게) ──
+        self.ghost_group = GhostTrail(
+            Square(side_length=OBJ_SIZE, color=BLUE, fill_opacity=0.3, stroke_width=0),
+            ball_pos, np.arange(1, self.TOTAL_TIME + 1),
+        )
+        self.ghost_group.add_updater(lambda m: m.reveal(time_tracker.get_value()))
+        self.add(self.ghost_group)
+        self.ghost_x_coords = [ball.get_center()[0], *self.ghost_group.positions[:, 0]]
 
         ball.add_updater(update_ball)
         self.play(
@@ -180,6 +181,7 @@ class UniformAccelerationMotion(Scene):
             rate_func=linear
         )
         ball.remove_updater(update_ball)
+        self.ghost_group.clear_updaters()
         self.wait(0.45)
 
     # ═══════════ Phase 4: 이동거리 표시 ═══════════
@@ -296,11 +298,14 @@ class UniformAccelerationMotion(Scene):
 
         tangent_line = always_redraw(get_tangent_line)
 
-        slope_text = always_redraw(lambda: MathTex(
-            f"v = {v_init + accel * t_tracker.get_value():.0f}\\,\\text{{m/s}}",
+        slope_text = NumericLabel(
+            "v =", decimals=0, suffix="\\,\\text{m/s}",
             font_size=self.FONT_SUBTITLE,
             color=ORANGE
-        ).next_to(axes_st, UP, buff=0.3))
+        )
+        slope_text.add_updater(lambda m: m.set_value(
+            v_init + accel * t_tracker.get_value()
+        ).next_to(axes_st, UP, buff=0.3), call_updater=True)
 
         self.play(
             FadeIn(moving_dot_st),
@@ -379,16 +384,17 @@ class UniformAccelerationMotion(Scene):
         area_fill = always_redraw(get_area)
 
         # ── 3. 면적 값 표시 ──
-        def get_area_value():
+        def update_area_value(m):
             t_val = t_integral.get_value()
             s_val = v_init * t_val + 0.5 * accel * t_val ** 2
-            return MathTex(
-                f"S = {s_val:.1f}\\,\\text{{m}}",
-                font_size=24,
-                color=BLUE
-            ).next_to(axes_vt, UP, buff=0.3)
+            m.set_value(s_val).next_to(axes_vt, UP, buff=0.3)
 
-        area_value_text = always_redraw(get_area_value)
+        area_value_text = NumericLabel(
+            "S =", decimals=1, suffix="\\,\\text{m}",
+            font_size=24,
+            color=BLUE
+        )
+        area_value_text.add_updater(update_area_value, call_updater=True)
 
         # ── 4. s-t 연동 점 ──
         moving_dot_st_area = always_redraw(lambda: Dot(
@@ -1,6 +1,11 @@
 from manim import *
 import numpy as np
 
+from korean_font import use_korean_font_in_manim
+from sim_mobjects import GhostTrail
+
+use_korean_font_in_manim()
+
 
 class UniformMotion(Scene):
     # ── 물리 상수 ──
@@ -131,9 +136,6 @@ class UniformMotion(Scene):
         self.play(FadeIn(ball), run_time=0.75)
         self.wait(0.45)
 
-        self.ghost_group = VGroup()
-        self.add(self.ghost_group)
-
         # ── 1. 속도 라벨 ──
         velocity_label = always_redraw(lambda: MathTex(
             "v = 5\\,\\text{m/s}",
@@ -143,33 +145,30 @@ class UniformMotion(Scene):
         self.add(velocity_label)
 
         time_tracker = ValueTracker(0)
-        time_tracker.last_int_t = 0
-
-        self.ghost_x_coords = [ball.get_center()[0]]
 
         # ── 2. 이동 updater ──
         track = self.track
         track_start = self.track_start
         track_end = self.track_end
         total_dist = self.TOTAL_DIST
-        ghost_group = self.ghost_group
-        ghost_x_coords = self.ghost_x_coords
 
-        def update_ball(m):
-            t = time_tracker.get_value()
+        def ball_pos(t):
             s = v * t
             x_ratio = s / total_dist
             new_x = track_start[0] + (track_end[0] - track_start[0]) * x_ratio
-            m.move_to([new_x, track.get_center()[1] + OBJ_SIZE / 2 + 0.1, 0])
-            current_int_t = int(t)
+            return [new_x, track.get_center()[1] + OBJ_SIZE / 2 + 0.1, 0]
+
+        def update_ball(m):
+            m.move_to(ball_pos(time_tracker.get_value()))
 
-            if current_int_t > time_tracker.last_int_t:
-                current_center = m.get_center()
-                ghost_base = Square(side_length=OBJ_SIZE, color=YELLOW, fill_opacity=0.3, stroke_width=0)
-                ghost_base.move_to(current_center)
-                ghost_group.add(ghost_base)
-                ghost_x_coords.append(current_center[0])
-                time_tracker.last_int_t = current_int_t
+        # ── 3. 1초마다 남는 잔상 (미리 배치, 지나간 시각만 보이게) ──
+        self.ghost_group = GhostTrail(
+            Square(side_length=OBJ_SIZE, color=YELLOW, fill_opacity=0.3, stroke_width=0),
+            ball_pos, np.arange(1, self.TOTAL_TIME + 1),
+        )
+        self.ghost_group.add_updater(lambda m: m.reveal(time_tracker.get_value()))
+        self.add(self.ghost_group)
+        self.ghost_x_coords = [ball.get_center()[0], *self.ghost_group.positions[:, 0]]
 
         ball.add_updater(update_ball)
         self.play(
@@ -178,6 +177,7 @@ class UniformMotion(Scene):
             rate_func=linear
         )
         ball.remove_updater(update_ball)
+        self.ghost_group.clear_updaters()
         self.wait(0.45)
 
     # ═══════════ Phase 4: 이동거리 표시 ═══════════
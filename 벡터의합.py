@@ -1,6 +1,10 @@
 from manim import *
 import numpy as np
 
+from korean_font import use_korean_font_in_manim
+
+use_korean_font_in_manim()
+
 
 class VectorAddition(Scene):
     # ── 폰트 크기 ──
@@ -1,6 +1,11 @@
 from manim import *
 import numpy as np
 
+from korean_font import use_korean_font_in_manim
+from sim_mobjects import ArcLengthPath, NumericLabel
+
+use_korean_font_in_manim()
+
 
 class DisplacementVsDistance(Scene):
     # ── 폰트 크기 ──
@@ -122,18 +127,48 @@ class DisplacementVsDistance(Scene):
         ]
         curved_path.set_points_smoothly(path_points)
 
-        # ── 4. 곡선 따라 점 이동 (MoveAlongPath) ──
+        # ── 4. 곡선 따라 점 이동 (호 길이 표로 일정한 속력) ──
+        table = ArcLengthPath(curved_path)
+        curved_length = table.length
+        s_tracker = ValueTracker(0)
+
         moving_dot = Dot(POINT_A, color=YELLOW, radius=0.15)
-        self.add(moving_dot)
-        self.play(
-            Create(curved_path),
-            MoveAlongPath(moving_dot, curved_path),
-            run_time=2.5,
-        )
-        self.wait(0.3)
+        moving_dot.add_updater(lambda m: m.move_to(table.point_at_length(s_tracker.get_value())))
+
+        trace = VMobject(color=ORANGE, stroke_width=5)
+        trace.add_updater(lambda m: m.set_points_as_corners(table.points_until(s_tracker.get_value())))
+
+        # 이동 중 실시간 이동거리 / 변위 크기
+        s_readout = NumericLabel("s =", decimals=1, font_size=24, color=ORANGE)
+        s_readout.add_updater(lambda m: m.set_value(s_tracker.get_value()).next_to(moving_dot, UP, buff=0.2))
+        d_readout = NumericLabel("|d| =", decimals=1, font_size=24, color=GREEN)
+        d_readout.add_updater(lambda m: m.set_value(
+            np.linalg.norm(moving_dot.get_center() - POINT_A)
+        ).next_to(dot_a, UP, buff=0.3))
+
+        # 화살표는 한 번만 만들고 매 프레임 끝점만 옮긴다 (길이가 거의 0이면 숨김)
+        displacement_live = Arrow(POINT_A, table.point_at_length(curved_length), color=GREEN, buff=0,
+                                  stroke_width=6, max_tip_length_to_length_ratio=0.08)
+
+        def follow_dot(m):
+            head = table.point_at_length(s_tracker.get_value())
+            if np.linalg.norm(head - POINT_A) < 0.05:
+                m.set_opacity(0)
+            else:
+                m.put_start_and_end_on(POINT_A, head).set_opacity(1)
+
+        displacement_live.add_updater(follow_dot, call_updater=True)
+
+        self.add(trace, displacement_live, moving_dot, s_readout, d_readout)
+        self.play(s_tracker.animate.set_value(curved_length), run_time=2.5, rate_func=linear)
+        for mob in (moving_dot, trace, s_readout, d_readout, displacement_live):
+            mob.clear_updaters()
+        # 꺾은선 흔적을 원래의 매끄러운 곡선으로 교체
+        self.remove(trace)
+        self.add(curved_path, moving_dot)
+        self.play(FadeOut(s_readout), FadeOut(d_readout), run_time=0.3)
 
         # ── 5. 이동거리 라벨 (곡선 최고점 위) ──
-        curved_length = curved_path.get_arc_length()
         distance_label = VGroup(
             Text("이동거리", font_size=self.FONT_LABEL, color=ORANGE),
             MathTex(f"= {curved_length:.1f}", font_size=28, color=ORANGE),
@@ -142,7 +177,7 @@ class DisplacementVsDistance(Scene):
 
         self.play(Write(distance_label))
 
-        # ── 6. 변위 화살표 ──
+        # ── 6. 변위 화살표 (이동 중 그린 화살표를 그대로 고정) ──
         displacement_arrow = Arrow(
             POINT_A, POINT_B, color=GREEN, buff=0,
             stroke_width=6, max_tip_length_to_length_ratio=0.08,
@@ -155,7 +190,8 @@ class DisplacementVsDistance(Scene):
         ).arrange(RIGHT, buff=0.1)
         displacement_label.next_to(displacement_arrow, DOWN, buff=0.3)
 
-        self.play(GrowArrow(displacement_arrow), run_time=1)
+        self.remove(displacement_live)
+        self.add(displacement_arrow)
         self.play(Write(displacement_label))
         self.wait(0.5)
 
@@ -1,8 +1,20 @@
 from manim import *
 import numpy as np
 
+from korean_font import use_korean_font_in_manim
+from sim_mobjects import BarStack, LiveBar, NumericLabel
+from sim_physics import TrackRun, frame_times
+
+use_korean_font_in_manim()
+
 
 class MechanicalEnergyConservation(Scene):
+    # ── 경사면 모형 (μ, 공기 저항 계수 k [kg/m], 수평면 끝 벽의 반발 계수, 재생 배속) ──
+    INCLINE_MU = 0.0
+    INCLINE_DRAG = 0.0
+    INCLINE_WALL_E = 1.0
+    INCLINE_REAL_PER_SIM = 1.5
+
     def construct(self):
         self.intro()
         self.clear_screen()
@@ -82,10 +94,9 @@ class MechanicalEnergyConservation(Scene):
             color=GRAY, stroke_width=1.5, dash_length=0.08,
         ))
 
-        h_val_label = always_redraw(lambda: MathTex(
-            f"h = {h_tracker.get_value():.1f}" + r"\,\text{m}",
-            font_size=20, color=WHITE,
-        ).next_to(h_line, RIGHT, buff=0.1))
+        h_val_label = NumericLabel("h =", decimals=1, suffix=r"\,\text{m}", font_size=20, color=WHITE)
+        h_val_label.add_updater(lambda m: m.set_value(h_tracker.get_value()).next_to(
+            h_line, RIGHT, buff=0.1), call_updater=True)
 
         # PE 바
         bar_x = 3.5
@@ -93,16 +104,14 @@ class MechanicalEnergyConservation(Scene):
         pe_max_height = 3.0
         h_max = 5.0
 
-        pe_bar = always_redraw(lambda: Rectangle(
-            width=0.8,
-            height=max(h_tracker.get_value() / h_max * pe_max_height, 0.02),
-            color=BLUE, fill_opacity=0.7,
-        ).move_to([bar_x, bar_base_y + max(h_tracker.get_value() / h_max * pe_max_height, 0.02) / 2, 0]))
+        pe_bar = LiveBar(width=0.8, color=BLUE, fill_opacity=0.7)
+        pe_bar.move_to([bar_x, bar_base_y, 0], aligned_edge=DOWN)
+        pe_bar.add_updater(lambda m: m.set_bar_height(
+            h_tracker.get_value() / h_max * pe_max_height, bar_base_y), call_updater=True)
 
-        pe_val = always_redraw(lambda: MathTex(
-            f"PE = {mass * g * h_tracker.get_value():.0f}" + r"\,\text{J}",
-            font_size=22, color=BLUE,
-        ).next_to(pe_bar, UP, buff=0.1))
+        pe_val = NumericLabel("PE =", decimals=0, suffix=r"\,\text{J}", font_size=22, color=BLUE)
+        pe_val.add_updater(lambda m: m.set_value(mass * g * h_tracker.get_value()).next_to(
+            pe_bar, UP, buff=0.1), call_updater=True)
 
         pe_label = Text("PE", font_size=20, color=BLUE).move_to([bar_x, ground_y - 0.3, 0])
 
@@ -187,15 +196,14 @@ class MechanicalEnergyConservation(Scene):
             color=GRAY, stroke_width=1.5, dash_length=0.08,
         ) if current_h(t_tracker.get_value()) > 0.1 else VMobject())
 
-        h_val = always_redraw(lambda: MathTex(
-            f"h={current_h(t_tracker.get_value()):.1f}" + r"\text{m}",
-            font_size=18, color=WHITE,
-        ).next_to([-1.8, ground_y + current_h(t_tracker.get_value()) * h_scale / 2, 0], RIGHT, buff=0.1))
+        h_val = NumericLabel("h=", decimals=1, suffix=r"\text{m}", font_size=18, color=WHITE)
+        h_val.add_updater(lambda m: m.set_value(current_h(t_tracker.get_value())).next_to(
+            [-1.8, ground_y + current_h(t_tracker.get_value()) * h_scale / 2, 0], RIGHT, buff=0.1),
+            call_updater=True)
 
-        v_val = always_redraw(lambda: MathTex(
-            f"v={current_v(t_tracker.get_value()):.1f}" + r"\text{m/s}",
-            font_size=18, color=BLUE,
-        ).next_to(obj, RIGHT, buff=0.3))
+        v_val = NumericLabel("v=", decimals=1, suffix=r"\text{m/s}", font_size=18, color=BLUE)
+        v_val.add_updater(lambda m: m.set_value(current_v(t_tracker.get_value())).next_to(
+            obj, RIGHT, buff=0.3), call_updater=True)
 
         self.play(FadeIn(obj), Create(h_dash), Write(h_val), Write(v_val))
 
@@ -204,24 +212,13 @@ class MechanicalEnergyConservation(Scene):
         bar_width = 1.2
         bar_total_height = 3.5
 
-        # PE 바 (하단부터)
-        pe_bar = always_redraw(lambda: Rectangle(
-            width=bar_width,
-            height=max(current_pe(t_tracker.get_value()) / total_E * bar_total_height, 0.02),
-            color=BLUE, fill_opacity=0.7,
-        ).move_to([bar_x, ground_y + max(current_pe(t_tracker.get_value()) / total_E * bar_total_height, 0.02) / 2, 0]))
-
-        # KE 바 (PE 위에 쌓기)
-        ke_bar = always_redraw(lambda: Rectangle(
-            width=bar_width,
-            height=max(current_ke(t_tracker.get_value()) / total_E * bar_total_height, 0.02),
-            color=ORANGE, fill_opacity=0.7,
-        ).move_to([
-            bar_x,
-            ground_y + current_pe(t_tracker.get_value()) / total_E * bar_total_height
-            + max(current_ke(t_tracker.get_value()) / total_E * bar_total_height, 0.02) / 2,
-            0
-        ]))
+        # PE 바 (하단부터) + KE 바 (PE 위에 쌓기)
+        energy_bars = BarStack(bar_x, ground_y, bar_width, [BLUE, ORANGE])
+        pe_bar, ke_bar = energy_bars
+        energy_bars.add_updater(lambda m: m.set_heights([
+            current_pe(t_tracker.get_value()) / total_E * bar_total_height,
+            current_ke(t_tracker.get_value()) / total_E * bar_total_height,
+        ]), call_updater=True)
 
         # 총 에너지 점선
         total_line = DashedLine(
@@ -232,21 +229,19 @@ class MechanicalEnergyConservation(Scene):
         total_label = MathTex(r"E_{total}=100\text{J}", font_size=18, color=YELLOW)
         total_label.next_to(total_line, UP, buff=0.1)
 
-        pe_text = always_redraw(lambda: MathTex(
-            f"PE={current_pe(t_tracker.get_value()):.0f}J",
-            font_size=16, color=BLUE,
-        ).move_to(pe_bar))
+        pe_text = NumericLabel("PE=", decimals=0, suffix="J", font_size=16, color=BLUE)
+        pe_text.add_updater(lambda m: m.set_value(current_pe(t_tracker.get_value())).move_to(pe_bar),
+                            call_updater=True)
 
-        ke_text = always_redraw(lambda: MathTex(
-            f"KE={current_ke(t_tracker.get_value()):.0f}J",
-            font_size=16, color=ORANGE,
-        ).move_to(ke_bar))
+        ke_text = NumericLabel("KE=", decimals=0, suffix="J", font_size=16, color=ORANGE)
+        ke_text.add_updater(lambda m: m.set_value(current_ke(t_tracker.get_value())).move_to(ke_bar),
+                            call_updater=True)
 
         bar_label_pe = Text("PE", font_size=16, color=BLUE).move_to([bar_x - 0.3, ground_y - 0.3, 0])
         bar_label_ke = Text("KE", font_size=16, color=ORANGE).move_to([bar_x + 0.3, ground_y - 0.3, 0])
 
         self.play(
-            FadeIn(pe_bar), FadeIn(ke_bar),
+            FadeIn(energy_bars),
             Create(total_line), Write(total_label),
             Write(pe_text), Write(ke_text),
             Write(bar_label_pe), Write(bar_label_ke),
@@ -293,9 +288,12 @@ class MechanicalEnergyConservation(Scene):
     # Phase 3: 경사면 에너지 전환
     # =========================================================
     def phase3_incline_energy(self):
+        mu, drag, wall_e = self.INCLINE_MU, self.INCLINE_DRAG, self.INCLINE_WALL_E
+        lossless = mu == 0 and drag == 0 and wall_e == 1
         title = VGroup(
             Text("경사면 에너지 전환:", font_size=28, color=WHITE),
-            Text("θ=30°, h=5m, 마찰 없음", font_size=24, color=WHITE),
+            Text("θ=30°, h=5m, 마찰 없음" if lossless else f"θ=30°, h=5m, μ={mu:g}",
+                 font_size=24, color=WHITE),
         ).arrange(RIGHT, buff=0.2).to_edge(UP)
         self.play(Write(title))
 
@@ -306,9 +304,6 @@ class MechanicalEnergyConservation(Scene):
         angle_deg = 30
         angle_rad = np.radians(angle_deg)
         slope_len = h0 / np.sin(angle_rad)  # 10 m
-        a_slope = g * np.sin(angle_rad)     # 5 m/s^2
-        v_final = np.sqrt(2 * g * h0)       # 10 m/s
-        t_slope = v_final / a_slope          # 2 s
         total_E = mass * g * h0             # 100 J
 
         # 경사면 그리기 (좌측)
@@ -325,13 +320,19 @@ class MechanicalEnergyConservation(Scene):
         )
 
         # 수평면
+        flat_width = 3.0
         flat_line = Line(
             incline_bottom_right,
-            [incline_bottom_right[0] + 3.0, incline_bottom_right[1], 0],
+            [incline_bottom_right[0] + flat_width, incline_bottom_right[1], 0],
             color=WHITE, stroke_width=2,
         )
 
-        self.play(Create(incline), Create(flat_line))
+        # 수평면 끝 벽 (물체 반 폭만큼 바깥, 물체 중심이 경로 끝에 닿을 때 맞닿음)
+        wall_x = flat_line.get_end()[0] + 0.175
+        wall = Line([wall_x, incline_base[1], 0], [wall_x, incline_base[1] + 0.8, 0],
+                    color=WHITE, stroke_width=4)
+
+        self.play(Create(incline), Create(flat_line), Create(wall))
 
         # 높이 표시
         h_arrow = DoubleArrow(
@@ -342,63 +343,51 @@ class MechanicalEnergyConservation(Scene):
         h_label = MathTex(r"h=5\text{m}", font_size=20, color=GRAY).next_to(h_arrow, LEFT, buff=0.1)
         self.play(Create(h_arrow), Write(h_label))
 
-        # ValueTracker: 경사면 위 거리 (0 ~ slope_len)
-        s_tracker = ValueTracker(0)
-
-        def current_s(val):
-            return min(val, slope_len)
-
-        def current_h_from_s(s):
-            if s >= slope_len:
-                return 0
-            return h0 - s * np.sin(angle_rad)
-
-        def current_v_from_s(s):
-            h = current_h_from_s(s)
-            return np.sqrt(max(2 * g * (h0 - h), 0))
+        # ── 운동 계산: 경사면 + 수평면을 한 번 적분해 프레임 시각에서 표로 ──
+        unit = incline_width / np.cos(angle_rad) / slope_len  # 화면 단위 / m
+        run = TrackRun(mass, [
+            (slope_len, lambda s: h0 - s * np.sin(angle_rad), lambda s: -np.sin(angle_rad)),
+            (flat_width / unit, lambda s: 0.0 * s, lambda s: 0.0 * s),
+        ], g=g, mu=mu, drag=drag, wall=wall_e)
+        # μ ≥ tanθ면 정지 마찰이 버텨 처음부터 멈춰 있다 (t_stop = 0) → 재생할 구간 없음
+        moving = run.t_stop > 0
+        t_bottom = run.breaks[0] if run.breaks else run.t_stop
+        # 경사면 → 수평면 → 벽에 튕겨 경사면 아래로 돌아올 때까지 (그 전에 멈추면 멈출 때까지)
+        marks = [b for b in run.breaks if b < run.t_stop][:3]
+        breaks = [0, *marks] if len(marks) == 3 else [0, *marks, run.t_stop]
+        if not moving:
+            breaks = [0]
+        run.sample(frame_times(breaks, config.frame_rate, self.INCLINE_REAL_PER_SIM))
+        t_tracker = ValueTracker(0)
 
         # 경사면 위 물체 위치
         slope_dir = np.array([np.cos(angle_rad), -np.sin(angle_rad), 0])  # 경사면 아래 방향
-        start_pos = np.array(incline_top) + slope_dir * 0.0
 
-        obj = always_redraw(lambda: Square(
-            side_length=0.35, color=BLUE, fill_opacity=0.8,
-        ).move_to(
-            np.array(incline_top) + slope_dir * min(s_tracker.get_value() / slope_len * incline_width / np.cos(angle_rad), incline_width / np.cos(angle_rad))
-            + np.array([0, 0.25, 0])
-            if s_tracker.get_value() < slope_len
-            else np.array(incline_bottom_right)
-            + np.array([(s_tracker.get_value() - slope_len) / slope_len * 3.0, 0.25, 0])
-        ))
+        def track_point(s):
+            if s < slope_len:
+                return np.array(incline_top) + slope_dir * s * unit
+            return np.array(incline_bottom_right) + RIGHT * (s - slope_len) * unit
+
+        obj = Square(side_length=0.35, color=BLUE, fill_opacity=0.8)
+        obj.add_updater(lambda m: m.move_to(
+            track_point(run.distance(t_tracker.get_value())) + UP * 0.25), call_updater=True)
 
         self.play(FadeIn(obj))
 
-        # 우측: 에너지 스택 바
+        # 우측: 에너지 스택 바 (PE / KE, 손실이 있으면 열 Q까지)
         bar_x = 4.5
         bar_width = 1.0
         bar_total_height = 3.0
         ground_y = incline_base[1]
+        scale = bar_total_height / total_E
+
+        def update_energy_bars(m):
+            t = t_tracker.get_value()
+            m.set_heights([run.potential(t) * scale, run.kinetic(t) * scale, run.heat_at(t) * scale])
 
-        pe_bar = always_redraw(lambda: Rectangle(
-            width=bar_width,
-            height=max(current_h_from_s(s_tracker.get_value()) / h0 * bar_total_height, 0.02),
-            color=BLUE, fill_opacity=0.7,
-        ).move_to([
-            bar_x,
-            ground_y + max(current_h_from_s(s_tracker.get_value()) / h0 * bar_total_height, 0.02) / 2,
-            0
-        ]))
-
-        ke_height_func = lambda: max((1 - current_h_from_s(s_tracker.get_value()) / h0) * bar_total_height, 0.02)
-        ke_bar = always_redraw(lambda: Rectangle(
-            width=bar_width,
-            height=ke_height_func(),
-            color=ORANGE, fill_opacity=0.7,
-        ).move_to([
-            bar_x,
-            ground_y + current_h_from_s(s_tracker.get_value()) / h0 * bar_total_height + ke_height_func() / 2,
-            0
-        ]))
+        energy_bars = BarStack(bar_x, ground_y, bar_width, [BLUE, ORANGE] if lossless else [BLUE, ORANGE, RED])
+        pe_bar, ke_bar = energy_bars[:2]
+        energy_bars.add_updater(update_energy_bars, call_updater=True)
 
         total_line = DashedLine(
             [bar_x - bar_width, ground_y + bar_total_height, 0],
@@ -407,42 +396,55 @@ class MechanicalEnergyConservation(Scene):
         )
         total_label = MathTex(r"E=100\text{J}", font_size=18, color=YELLOW).next_to(total_line, UP, buff=0.1)
 
-        pe_text = always_redraw(lambda: MathTex(
-            f"PE={mass * g * current_h_from_s(s_tracker.get_value()):.0f}",
-            font_size=16, color=BLUE,
-        ).move_to(pe_bar))
+        pe_text = NumericLabel("PE=", decimals=0, font_size=16, color=BLUE)
+        pe_text.add_updater(lambda m: m.set_value(
+            run.potential(t_tracker.get_value())).move_to(pe_bar), call_updater=True)
 
-        ke_text = always_redraw(lambda: MathTex(
-            f"KE={total_E - mass * g * current_h_from_s(s_tracker.get_value()):.0f}",
-            font_size=16, color=ORANGE,
-        ).move_to(ke_bar))
+        ke_text = NumericLabel("KE=", decimals=0, font_size=16, color=ORANGE)
+        ke_text.add_updater(lambda m: m.set_value(
+            run.kinetic(t_tracker.get_value())).move_to(ke_bar), call_updater=True)
 
-        self.play(
-            FadeIn(pe_bar), FadeIn(ke_bar),
-            Create(total_line), Write(total_label),
-            Write(pe_text), Write(ke_text),
-        )
-        self.wait(0.5)
+        bar_texts = [pe_text, ke_text]
+        if not lossless:
+            heat_text = NumericLabel("Q=", decimals=0, font_size=16, color=RED)
+            heat_text.add_updater(lambda m: m.set_value(
+                run.heat_at(t_tracker.get_value())).next_to(energy_bars[2], RIGHT, buff=0.1), call_updater=True)
+            bar_texts.append(heat_text)
 
-        # 경사면 내려가기
         self.play(
-            s_tracker.animate.set_value(slope_len),
-            run_time=3, rate_func=rate_functions.ease_in_quad,
+            FadeIn(energy_bars),
+            Create(total_line), Write(total_label),
+            *[Write(text) for text in bar_texts],
         )
         self.wait(0.5)
 
-        # 수평면 등속 이동
-        self.play(
-            s_tracker.animate.set_value(slope_len + 5),
-            run_time=2, rate_func=linear,
-        )
-        self.wait(0.5)
+        # 경사면 내려가기 → 수평면 이동 → 벽에서 튕겨 돌아오기 (프레임 시각 격자와 같은 구간, linear, 정지 시 생략)
+        for b0, b1 in zip(breaks[:-1], breaks[1:]):
+            self.play(
+                t_tracker.animate.set_value(b1),
+                run_time=(b1 - b0) * self.INCLINE_REAL_PER_SIM, rate_func=linear,
+            )
+            self.wait(0.5)
 
-        # 핵심: 같은 높이 → 같은 속도
-        key_msg = MathTex(
-            r"v = \sqrt{2gh} = 10\,\text{m/s}",
-            font_size=24, color=YELLOW,
-        ).to_edge(DOWN, buff=0.3)
+        # 핵심: 같은 높이 → 같은 속도 (손실이 있으면 바닥 속도와 열)
+        if not moving:
+            key_msg = MathTex(
+                rf"\mu \ge \tan{angle_deg}^\circ:\ "
+                r"v_{\text{bottom}} = 0\,\text{m/s},\quad Q = 0\,\text{J}",
+                font_size=24, color=YELLOW,
+            )
+        elif lossless:
+            key_msg = MathTex(
+                r"v = \sqrt{2gh} = 10\,\text{m/s}",
+                font_size=24, color=YELLOW,
+            )
+        else:
+            key_msg = MathTex(
+                rf"v_{{\text{{bottom}}}} = {run.speed(t_bottom):.1f}\,\text{{m/s}},\quad "
+                rf"Q = {run.heat_at(breaks[-1]):.0f}\,\text{{J}}",
+                font_size=24, color=YELLOW,
+            )
+        key_msg.to_edge(DOWN, buff=0.3)
         bg = BackgroundRectangle(key_msg, color=BLACK, fill_opacity=0.85, buff=0.2)
         self.play(FadeIn(bg), Write(key_msg))
         self.wait(2)
@@ -2,6 +2,13 @@ from manim import TransformMatchingTex
 from manim import *
 import numpy as np
 
+from korean_font import use_korean_font_in_manim
+from sim_mobjects import NumericLabel, SweptArea, TracedCurve, sampled_area, sampled_graph
+from sim_physics import SpringContact
+from tex_cache import cached_math_tex, format_values, prewarm_tex
+
+use_korean_font_in_manim()
+
 
 class ImpulseMomentum2(Scene):
     # ── 초기조건 ──
@@ -44,14 +51,20 @@ class ImpulseMomentum2(Scene):
         self.outro()
 
     def _make_experiment(self, label, delta_t, max_deform, floor_color):
-        """초기조건으로부터 실험에 필요한 모든 물리량을 한번에 계산"""
+        """초기조건으로부터 실험에 필요한 모든 물리량을 한번에 계산
+
+        contact는 F-t / v-t / 변형 / 누적 충격량 배열을 미리 계산해 둔 충돌 모형으로,
+        시뮬레이션과 비교 그래프가 다시 샘플링하지 않고 같이 쓴다.
+        """
+        contact = SpringContact(self.IMPULSE, self.V_IMPACT, delta_t)
         return dict(
             label=label,
             delta_t=delta_t,
             max_deform=max_deform,
             floor_color=floor_color,
-            F_peak=self._F_peak(delta_t),
-            F_avg=self._F_avg(delta_t),
+            contact=contact,
+            F_peak=contact.F_peak,
+            F_avg=contact.F_avg,
             t_coll_end=self.T_FALL + delta_t,
         )
 
@@ -59,38 +72,6 @@ class ImpulseMomentum2(Scene):
         self.play(*[FadeOut(m) for m in self.mobjects])
         self.wait(0.5)
 
-    # ── Spring collision model ──
-    # F(τ) = 12*I/Δt * u*(1-u)², u=τ/Δt  (peak at u=1/3)
-    # v(τ) = v₀*(1 - 6u² + 8u³ - 3u⁴)
-    # deform(τ) = 6u² - 8u³ + 3u⁴  (0→1, stays at 1)
-    def _f_spring(self, tau, dt):
-        if tau <= 0 or tau >= dt:
-            return 0.0
-        u = tau / dt
-        return 12 * self.IMPULSE / dt * u * (1 - u) ** 2
-
-    def _v_spring(self, tau, dt):
-        if tau <= 0:
-            return self.V_IMPACT
-        if tau >= dt:
-            return 0.0
-        u = tau / dt
-        return self.V_IMPACT * (1 - 6 * u**2 + 8 * u**3 - 3 * u**4)
-
-    def _deform_frac(self, tau, dt):
-        if tau <= 0:
-            return 0.0
-        if tau >= dt:
-            return 1.0
-        u = tau / dt
-        return 6 * u**2 - 8 * u**3 + 3 * u**4
-
-    def _F_peak(self, dt):
-        return 48 * self.IMPULSE / (27 * dt)
-
-    def _F_avg(self, dt):
-        return self.IMPULSE / dt
-
     def _make_deformed_floor(self, center_x, floor_y, width, height,
                              deform_frac, max_deform, color,
                              left_x=None, top_y=None, bot_y=None,
@@ -161,6 +142,7 @@ class ImpulseMomentum2(Scene):
         floor_color = exp["floor_color"]
         delta_t = exp["delta_t"]
         max_deform = exp["max_deform"]
+        contact = exp["contact"]
         F_peak = exp["F_peak"]
         F_avg = exp["F_avg"]
         t_coll_end = exp["t_coll_end"]
@@ -248,8 +230,13 @@ class ImpulseMomentum2(Scene):
         # ── 4. 자유낙하 + v 라벨 ──
         fall_dist = obj_start_y - obj_land_y
         v_tracker = ValueTracker(0)
-        v_label = always_redraw(lambda: MathTex(
-            rf"v = {v_tracker.get_value():.1f}", font_size=self.FONT_LABEL, color=GREEN,
+
+        def v_tex(v):
+            return rf"v = {v:.1f}"
+
+        prewarm_tex(format_values(v_tex, 0, self.V_IMPACT, decimals=1))
+        v_label = always_redraw(lambda: cached_math_tex(
+            v_tex(v_tracker.get_value()), font_size=self.FONT_LABEL, color=GREEN,
         ).next_to(ball, RIGHT, buff=0.15))
 
         vt_fall = vt_axes.plot(lambda t: self.G * t, x_range=[0, self.T_FALL],
@@ -294,7 +281,7 @@ class ImpulseMomentum2(Scene):
         fl_lx = floor_rect.get_left()[0]
 
         def get_def_floor():
-            df = self._deform_frac(coll_tracker.get_value(), delta_t)
+            df = contact.deform_frac(coll_tracker.get_value())
             return self._make_deformed_floor(
                 center_x=OBJ_X, floor_y=FLOOR_Y, width=fl_w, height=0.3,
                 deform_frac=df, max_deform=max_deform, color=floor_color,
@@ -304,7 +291,7 @@ class ImpulseMomentum2(Scene):
         def_floor = always_redraw(get_def_floor)
 
         def upd_ball(b):
-            d = self._deform_frac(coll_tracker.get_value(), delta_t) * max_deform
+            d = contact.deform_frac(coll_tracker.get_value()) * max_deform
             b.move_to([OBJ_X, obj_land_y - d, 0])
         def upd_bl(bl):
             bl.move_to(ball.get_center())
@@ -320,12 +307,10 @@ class ImpulseMomentum2(Scene):
         self.play(FadeIn(p_label), run_time=0.3)
 
         t0 = self.T_FALL
-        ft_pulse = ft_axes.plot(lambda t: self._f_spring(t - t0, delta_t),
-                                x_range=[t0, t_coll_end, 0.002], color=RED, stroke_width=3)
-        vt_coll = vt_axes.plot(lambda t: self._v_spring(t - t0, delta_t),
-                               x_range=[t0, t_coll_end, 0.002], color=YELLOW, stroke_width=3)
+        ft_pulse = sampled_graph(ft_axes, t0 + contact.tau, contact.F, color=RED, stroke_width=3)
+        vt_coll = sampled_graph(vt_axes, t0 + contact.tau, contact.v, color=YELLOW, stroke_width=3)
 
-        t_peak = t0 + delta_t / 3
+        t_peak = t0 + contact.t_peak
         ft_hd = DashedLine(ft_axes.c2p(0, F_peak), ft_axes.c2p(t_peak, F_peak),
                            color=GRAY, stroke_width=1.5, dash_length=0.08)
         ft_vdp = DashedLine(ft_axes.c2p(t_peak, 0), ft_axes.c2p(t_peak, F_peak),
@@ -368,8 +353,17 @@ class ImpulseMomentum2(Scene):
         self.play(Create(avg_line), Write(avg_txt), Write(avg_val), FadeIn(avg_rect), run_time=1.0)
         self.wait(0.5)
 
-        area_ft = ft_axes.get_area(ft_pulse, x_range=[t0, t_coll_end], color=RED, opacity=0.3)
-        self.play(FadeIn(area_ft))
+        # 충격량 넓이: 펄스와 같은 표본에서 누적 적분, 오른쪽 끝을 밀며 I 값 갱신
+        area_ft = SweptArea(ft_axes, t0 + contact.tau, contact.F, color=RED, opacity=0.3)
+        area_tracker = ValueTracker(t0)
+        area_ft.add_updater(lambda m: m.set_right(area_tracker.get_value()))
+        area_lbl = NumericLabel("I =", decimals=1, suffix=r"\text{ N·s}", font_size=24, color=RED)
+        area_lbl.next_to(ft_dotp, RIGHT, buff=0.2)
+        area_lbl.add_updater(lambda m: m.set_value(area_ft.value), call_updater=True)
+        self.add(area_ft, area_lbl)
+        self.play(area_tracker.animate.set_value(t_coll_end), run_time=1.0, rate_func=linear)
+        area_ft.clear_updaters()
+        area_lbl.clear_updaters()
         self.wait(0.5)
 
         # ── 8. 충격량 계산 ──
@@ -395,6 +389,7 @@ class ImpulseMomentum2(Scene):
         Fp_a, Fp_b = ea["F_peak"], eb["F_peak"]
         Fa_a, Fa_b = ea["F_avg"], eb["F_avg"]
         md_a, md_b = ea["max_deform"], eb["max_deform"]
+        ca, cb = ea["contact"], eb["contact"]
 
         # ── 1. 미니 셋업 (왼쪽 컬럼) ──
         mini_r = 0.25
@@ -430,12 +425,6 @@ class ImpulseMomentum2(Scene):
         x_txt = Text("충돌 시간", font_size=self.FONT_AXIS_LABEL, color=GRAY).next_to(comp_axes.x_axis, DR, buff=0.25)
         y_txt = Text("힘", font_size=self.FONT_AXIS_LABEL, color=GRAY).next_to(comp_axes.y_axis, UL, buff=0.2)
 
-        # ── 3. 정적 커브 (애니메이션 후 교체용) ──
-        curve_a_static = comp_axes.plot(lambda t: self._f_spring(t, dt_a),
-                                        x_range=[0, dt_a, 0.001], color=RED, stroke_width=3)
-        curve_b_static = comp_axes.plot(lambda t: self._f_spring(t, dt_b),
-                                        x_range=[0, dt_b, 0.001], color=TEAL, stroke_width=3)
-
         self.play(
             FadeIn(label_a), FadeIn(ball_a), FadeIn(floor_a),
             FadeIn(label_b), FadeIn(ball_b), FadeIn(floor_b),
@@ -464,7 +453,7 @@ class ImpulseMomentum2(Scene):
         flb_lx = floor_b.get_left()[0]
 
         def mk_def_floor_a():
-            df = self._deform_frac(coll_tracker.get_value(), dt_a)
+            df = ca.deform_frac(coll_tracker.get_value())
             return self._make_deformed_floor(
                 center_x=ax, floor_y=ay_fl_a, width=mini_fw, height=0.2,
                 deform_frac=df, max_deform=md_a, color=GRAY_BROWN,
@@ -472,7 +461,7 @@ class ImpulseMomentum2(Scene):
             )
 
         def mk_def_floor_b():
-            df = self._deform_frac(coll_tracker.get_value(), dt_b)
+            df = cb.deform_frac(coll_tracker.get_value())
             return self._make_deformed_floor(
                 center_x=ax, floor_y=ay_fl_b, width=mini_fw, height=0.2,
                 deform_frac=df, max_deform=md_b, color=TEAL,
@@ -483,10 +472,10 @@ class ImpulseMomentum2(Scene):
         def_floor_b = always_redraw(mk_def_floor_b)
 
         def upd_ball_a(b):
-            d = self._deform_frac(coll_tracker.get_value(), dt_a) * md_a
+            d = ca.deform_frac(coll_tracker.get_value()) * md_a
             b.move_to([ax, ay_top_a - d, 0])
         def upd_ball_b(b):
-            d = self._deform_frac(coll_tracker.get_value(), dt_b) * md_b
+            d = cb.deform_frac(coll_tracker.get_value()) * md_b
             b.move_to([ax, ay_top_b - d, 0])
 
         ball_a.add_updater(upd_ball_a)
@@ -495,21 +484,10 @@ class ImpulseMomentum2(Scene):
         self.play(FadeOut(floor_a), FadeIn(def_floor_a), FadeOut(floor_b), FadeIn(def_floor_b), run_time=0.05)
 
         # ── 6. 성장 커브 ──
-        def mk_grow_curve_a():
-            te = min(coll_tracker.get_value(), dt_a)
-            if te < 0.003:
-                return VGroup()
-            return comp_axes.plot(lambda s: self._f_spring(s, dt_a),
-                                 x_range=[0, te, 0.002], color=RED, stroke_width=3)
-        def mk_grow_curve_b():
-            te = min(coll_tracker.get_value(), dt_b)
-            if te < 0.003:
-                return VGroup()
-            return comp_axes.plot(lambda s: self._f_spring(s, dt_b),
-                                 x_range=[0, te, 0.002], color=TEAL, stroke_width=3)
-
-        grow_curve_a = always_redraw(mk_grow_curve_a)
-        grow_curve_b = always_redraw(mk_grow_curve_b)
+        grow_curve_a = TracedCurve(comp_axes, ca.force, coll_tracker, x_range=[0, dt_a],
+                                   dt=0.002, color=RED, stroke_width=3)
+        grow_curve_b = TracedCurve(comp_axes, cb.force, coll_tracker, x_range=[0, dt_b],
+                                   dt=0.002, color=TEAL, stroke_width=3)
         self.add(grow_curve_a, grow_curve_b)
 
         self.play(coll_tracker.animate.set_value(dt_b), run_time=2.5, rate_func=linear)
@@ -520,8 +498,8 @@ class ImpulseMomentum2(Scene):
         ball_b.clear_updaters()
         ball_a.move_to([ax, ay_top_a - md_a, 0])
         ball_b.move_to([ax, ay_top_b - md_b, 0])
-        self.remove(grow_curve_a, grow_curve_b)
-        self.add(curve_a_static, curve_b_static)
+        curve_a_static = grow_curve_a.freeze()
+        curve_b_static = grow_curve_b.freeze()
 
         # ── 8. 커브 라벨 ──
         curve_label_a = Text("A", font_size=self.FONT_LABEL, color=RED)
@@ -592,10 +570,8 @@ class ImpulseMomentum2(Scene):
         self.wait(0.5)
 
         # ── 13. 같은 충격량 — 넓이 비교 ──
-        area_a = comp_axes.get_area(curve_a_static, x_range=[0, dt_a],
-                                     color=RED, opacity=0.35)
-        area_b = comp_axes.get_area(curve_b_static, x_range=[0, dt_b],
-                                     color=TEAL, opacity=0.35)
+        area_a = sampled_area(comp_axes, ca.tau, ca.F, color=RED, opacity=0.35)
+        area_b = sampled_area(comp_axes, cb.tau, cb.F, color=TEAL, opacity=0.35)
 
         lbl_Sa = MathTex(r"S_A", font_size=24, color=RED)
         lbl_Sa.move_to(comp_axes.c2p(dt_a / 2, Fa_a * 0.5))
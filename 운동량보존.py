@@ -1,6 +1,12 @@
 from manim import *
 import numpy as np
 
+from korean_font import use_korean_font_in_manim
+from sim_mobjects import LiveBar, MarkerCloud, NumericLabel, TracedCurve
+from sim_physics import GasBox, TrajectoryTable, collide_1d, frame_times
+
+use_korean_font_in_manim()
+
 
 class MomentumConservation(Scene):
     # ── 폰트 크기 ──
@@ -24,6 +30,16 @@ class MomentumConservation(Scene):
     BAR_SCALE = 0.5
     BAR_WIDTH = 0.6
 
+    # ── 2차원 기체 모형 (확장 구간, GAS_PHASE = True일 때만 렌더:
+    #    python phase_render.py 운동량보존.py MomentumConservation --set GAS_PHASE=True) ──
+    GAS_PHASE = False
+    GAS_PARTICLES = 500
+    GAS_RADIUS = 0.05
+    GAS_MASS = 0.01
+    GAS_DRIFT = (0.6, 0.2)
+    GAS_SIM_TIME = 8.0
+    GAS_SEED = 7
+
     def construct(self):
         self.intro()
         self.clear_screen()
@@ -37,6 +53,9 @@ class MomentumConservation(Scene):
         self.clear_screen()
         self.phase5_inelastic_collision()
         self.clear_screen()
+        if self.GAS_PHASE:
+            self.phase6_gas_momentum()
+            self.clear_screen()
         self.summary()
         self.clear_screen()
         self.outro()
@@ -87,11 +106,11 @@ class MomentumConservation(Scene):
             bar_origin = RIGHT * 3.5 + DOWN * 2.5
         if bar_scale is None:
             bar_scale = self.BAR_SCALE
-        bars = VGroup()
-        for val, col in zip(values, colors):
-            h = max(abs(val) * bar_scale, 0.05)
-            bar = Rectangle(width=self.BAR_WIDTH, height=h, color=col, fill_opacity=0.7)
-            bars.add(bar)
+        bars = VGroup(*[
+            LiveBar(width=self.BAR_WIDTH, height=abs(val) * bar_scale, min_height=0.05,
+                    color=col, fill_opacity=0.7)
+            for val, col in zip(values, colors)
+        ])
         bars.arrange(RIGHT, buff=0.5, aligned_edge=DOWN)
         bars.move_to(bar_origin)
         bars.align_to(bar_origin + DOWN * 0.5, DOWN)
@@ -108,8 +127,7 @@ class MomentumConservation(Scene):
 
         val_labels = VGroup()
         for i, val in enumerate(values):
-            vl = MathTex(str(int(val)) if val == int(val) else f"{val:.1f}",
-                         font_size=24, color=WHITE)
+            vl = NumericLabel(value=val, decimals=1, int_if_whole=True, font_size=24, color=WHITE)
             vl.next_to(bars[i], UP, buff=0.05)
             val_labels.add(vl)
 
@@ -124,10 +142,6 @@ class MomentumConservation(Scene):
         mass = MathTex(mass_text, font_size=18, color=color).next_to(box, UP, buff=0.1)
         return {"box": box, "label": label, "mass": mass}
 
-    def _smooth_step(self, t, t0, width=0.15):
-        """시그모이드 기반 부드러운 전환"""
-        return 1 / (1 + np.exp(-(t - t0) / (width / 4)))
-
     def _collision_effect(self, point, box_a, box_b, extra_anims=None):
         """충돌 순간 효과: Flash + squash + 색 번쩍임"""
         anims = [Flash(point, color=YELLOW, flash_radius=0.5, line_length=0.3)]
@@ -140,10 +154,34 @@ class MomentumConservation(Scene):
             run_time=0.1, rate_func=there_and_back
         )
 
-    def _setup_object_updaters(self, obj_dict, pos_func, time_tracker, y_pos):
-        """물체, 라벨, 질량에 updater 부착"""
+    def _frame_times(self, breaks):
+        """REAL_PER_SIM 배속으로 breaks 구간을 재생할 때의 프레임 시각 격자"""
+        return frame_times(breaks, config.frame_rate, self.REAL_PER_SIM)
+
+    def _collision_traj(self, masses, sizes, x0, v0, restitution=1.0, scale_v=None, collisions=1):
+        """충돌 엔진으로 SIM_TOTAL까지의 궤적 표 생성 → (궤적 표, 충돌 시각 목록)
+
+        연출은 충돌 횟수를 전제로 짜여 있으므로, SIM_TOTAL 안의 충돌이 collisions번이
+        아니면 (초기 위치·속도·SIM_TOTAL 조정 필요) 바로 알린다.
+        """
+        if scale_v is None:
+            scale_v = self.SCALE_V
+        history = collide_1d(masses, sizes, x0, v0, restitution,
+                             t_end=self.SIM_TOTAL, scale_v=scale_v)
+        breaks = list(history["breaks"])
+        if len(breaks) != collisions:
+            raise ValueError(
+                f"SIM_TOTAL={self.SIM_TOTAL}s 안의 충돌이 {collisions}번이어야 하는데 "
+                f"{len(breaks)}번입니다 (충돌 시각 {breaks}) — 초기 위치·속도나 SIM_TOTAL을 조정하세요")
+        traj = TrajectoryTable.from_piecewise(
+            self._frame_times([0, *breaks, self.SIM_TOTAL]), masses=masses, x0=x0,
+            breaks=breaks, velocities=history["velocities"], scale_v=scale_v)
+        return traj, breaks
+
+    def _setup_object_updaters(self, obj_dict, traj, body, time_tracker, y_pos):
+        """물체, 라벨, 질량에 updater 부착 (위치는 궤적 표에서 조회)"""
         obj_dict["box"].add_updater(
-            lambda m, pf=pos_func: m.move_to([pf(time_tracker.get_value()), y_pos, 0]))
+            lambda m: m.move_to([traj.position(body, time_tracker.get_value()), y_pos, 0]))
         obj_dict["label"].add_updater(lambda m: m.move_to(obj_dict["box"]))
         obj_dict["mass"].add_updater(lambda m: m.next_to(obj_dict["box"], UP, buff=0.1))
 
@@ -155,18 +193,16 @@ class MomentumConservation(Scene):
             d["mass"].clear_updaters()
 
     def _update_bars(self, bar_data, new_values, colors):
-        """막대 차트를 새 값으로 Transform"""
+        """막대 높이와 값 라벨을 새 값으로 바꾸는 애니메이션 (기존 막대·라벨을 그대로 갱신)"""
         scale = bar_data.get("bar_scale", self.BAR_SCALE)
         anims = []
         for i, (val, col) in enumerate(zip(new_values, colors)):
-            h = max(abs(val) * scale, 0.05)
-            new_bar = Rectangle(width=self.BAR_WIDTH, height=h, color=col, fill_opacity=0.7)
-            new_bar.move_to(bar_data["bars"][i].get_bottom(), aligned_edge=DOWN)
-            anims.append(Transform(bar_data["bars"][i], new_bar))
-            val_str = str(int(val)) if val == int(val) else f"{val:.1f}"
-            new_vl = MathTex(val_str, font_size=24, color=WHITE)
-            new_vl.next_to(new_bar, UP, buff=0.05)
-            anims.append(Transform(bar_data["val_labels"][i], new_vl))
+            bar, vl = bar_data["bars"][i], bar_data["val_labels"][i]
+            bar.set_color(col)
+            anims.append(bar.animate_height(abs(val) * scale))
+            anims.append(UpdateFromAlphaFunc(
+                vl, lambda m, a, v0=vl.get_value(), v1=val, bar=bar:
+                m.set_value(v1 if a == 1 else interpolate(v0, v1, a)).next_to(bar, UP, buff=0.05)))
         return anims
 
     def _make_vel_arrow_and_label(self, box, velocity, color, arrow_scale=0.15):
@@ -391,27 +427,16 @@ class MomentumConservation(Scene):
         self.wait(0.3)
 
         # ── 6. 충돌 시뮬레이션 ──
-        V_A, V_B = 4.0, 0.0
-        V_A_AFTER, V_B_AFTER = 0.0, 4.0
         obj_size = self.OBJ_SIZE_SMALL
-
-        dist = (START_B_X - obj_size / 2) - (START_A_X + obj_size / 2)
-        collision_t = dist / (V_A * self.SCALE_V)
+        traj, breaks = self._collision_traj(
+            masses=[1, 1], sizes=[obj_size, obj_size],
+            x0=[START_A_X, START_B_X], v0=[4.0, 0.0])
+        collision_t = breaks[0]
         time_tracker = ValueTracker(0)
 
-        def pos_a(t):
-            if t <= collision_t:
-                return START_A_X + V_A * self.SCALE_V * t
-            return START_A_X + V_A * self.SCALE_V * collision_t + V_A_AFTER * self.SCALE_V * (t - collision_t)
-
-        def pos_b(t):
-            if t <= collision_t:
-                return START_B_X
-            return START_B_X + V_B_AFTER * self.SCALE_V * (t - collision_t)
-
         y_a = center_y + obj_size / 2 + 0.1
-        self._setup_object_updaters(obj_a, pos_a, time_tracker, y_a)
-        self._setup_object_updaters(obj_b, pos_b, time_tracker, y_a)
+        self._setup_object_updaters(obj_a, traj, 0, time_tracker, y_a)
+        self._setup_object_updaters(obj_b, traj, 1, time_tracker, y_a)
 
         vel_arrow_dyn = always_redraw(lambda: Arrow(
             start=obj_a["box"].get_right(), end=obj_a["box"].get_right() + RIGHT * 0.8,
@@ -436,25 +461,17 @@ class MomentumConservation(Scene):
 
         # p-t 그래프
         def p_a_func(t):
-            s = self._smooth_step(t, collision_t)
-            return 4 * (1 - s)
+            return traj.smooth_momentum(0, t)
 
         def p_b_func(t):
-            s = self._smooth_step(t, collision_t)
-            return 4 * s
-
-        pt_line_a = always_redraw(lambda: axes_pt.plot(
-            p_a_func, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=BLUE, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-        pt_line_b = always_redraw(lambda: axes_pt.plot(
-            p_b_func, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=RED, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-        pt_line_tot = always_redraw(lambda: axes_pt.plot(
-            lambda t: 4, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=YELLOW, stroke_width=3, stroke_opacity=0.7
-        ) if time_tracker.get_value() > 0.01 else VMobject())
+            return traj.smooth_momentum(1, t)
+
+        pt_line_a = TracedCurve(axes_pt, p_a_func, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                color=BLUE, stroke_width=3)
+        pt_line_b = TracedCurve(axes_pt, p_b_func, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                color=RED, stroke_width=3)
+        pt_line_tot = TracedCurve(axes_pt, lambda t: 4, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                  color=YELLOW, stroke_width=3, stroke_opacity=0.7)
         self.add(pt_line_a, pt_line_b, pt_line_tot)
 
         # 충돌 전 이동
@@ -464,7 +481,7 @@ class MomentumConservation(Scene):
 
         # 충돌 효과 + 막대 업데이트
         collision_point = obj_a["box"].get_right()
-        bar_anims = self._update_bars(bar_data, [0, 4, 4], [BLUE, RED, YELLOW])
+        bar_anims = self._update_bars(bar_data, traj.bar_values(collision_t), [BLUE, RED, YELLOW])
         self._collision_effect(collision_point, obj_a["box"], obj_b["box"], bar_anims)
 
         # 충돌 후
@@ -473,14 +490,12 @@ class MomentumConservation(Scene):
 
         # 정리
         self._clear_object_updaters(obj_a, obj_b)
-        self.remove(vel_arrow_dyn, vel_label_a_dyn, vel_arrow_b_dyn, vel_label_b_dyn,
-                    pt_line_a, pt_line_b, pt_line_tot)
-
-        # 정적 그래프
-        final_pt_a = axes_pt.plot(p_a_func, x_range=[0, self.SIM_TOTAL], color=BLUE, stroke_width=3)
-        final_pt_b = axes_pt.plot(p_b_func, x_range=[0, self.SIM_TOTAL], color=RED, stroke_width=3)
-        final_pt_tot = axes_pt.plot(lambda t: 4, x_range=[0, self.SIM_TOTAL],
-                                    color=YELLOW, stroke_width=3, stroke_opacity=0.7)
+        self.remove(vel_arrow_dyn, vel_label_a_dyn, vel_arrow_b_dyn, vel_label_b_dyn)
+
+        # 정적 그래프 (추적 곡선을 그대로 고정)
+        final_pt_a = pt_line_a.freeze()
+        final_pt_b = pt_line_b.freeze()
+        final_pt_tot = pt_line_tot.freeze()
         self.add(final_pt_a, final_pt_b, final_pt_tot)
 
         pt_lbl_a = Text("A의 운동량", font_size=self.FONT_LABEL, color=BLUE)
@@ -553,29 +568,19 @@ class MomentumConservation(Scene):
 
         # ── 6. 충돌 시뮬레이션 ──
         SCALE_V = 0.35
-        V_A, V_B = 6.0, 0.0
-        V_A_AFTER, V_B_AFTER = -2.0, 4.0
         obj_a_size = self.OBJ_SIZE_SMALL
         obj_b_size = self.OBJ_SIZE_MEDIUM
-
-        dist = (START_B_X - obj_b_size / 2) - (START_A_X + obj_a_size / 2)
-        collision_t = dist / (V_A * SCALE_V)
+        # 탄성 충돌: v_A 6 → -2, v_B 0 → 4
+        traj, breaks = self._collision_traj(
+            masses=[1, 2], sizes=[obj_a_size, obj_b_size],
+            x0=[START_A_X, START_B_X], v0=[6.0, 0.0], scale_v=SCALE_V)
+        collision_t = breaks[0]
         time_tracker = ValueTracker(0)
 
-        def pos_a(t):
-            if t <= collision_t:
-                return START_A_X + V_A * SCALE_V * t
-            return START_A_X + V_A * SCALE_V * collision_t + V_A_AFTER * SCALE_V * (t - collision_t)
-
-        def pos_b(t):
-            if t <= collision_t:
-                return START_B_X
-            return START_B_X + V_B_AFTER * SCALE_V * (t - collision_t)
-
         y_a = center_y + obj_a_size / 2 + 0.1
         y_b = center_y + obj_b_size / 2 + 0.1
-        self._setup_object_updaters(obj_a, pos_a, time_tracker, y_a)
-        self._setup_object_updaters(obj_b, pos_b, time_tracker, y_b)
+        self._setup_object_updaters(obj_a, traj, 0, time_tracker, y_a)
+        self._setup_object_updaters(obj_b, traj, 1, time_tracker, y_b)
 
         vel_arrow_a_dyn = always_redraw(lambda: (
             Arrow(
@@ -611,25 +616,17 @@ class MomentumConservation(Scene):
 
         # p-t 그래프
         def p_a_func(t):
-            s = self._smooth_step(t, collision_t)
-            return 6 * (1 - s) + (-2) * s
+            return traj.smooth_momentum(0, t)
 
         def p_b_func(t):
-            s = self._smooth_step(t, collision_t)
-            return 8 * s
-
-        pt_line_a = always_redraw(lambda: axes_pt.plot(
-            p_a_func, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=BLUE, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-        pt_line_b = always_redraw(lambda: axes_pt.plot(
-            p_b_func, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=RED, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-        pt_line_tot = always_redraw(lambda: axes_pt.plot(
-            lambda t: 6, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=YELLOW, stroke_width=3, stroke_opacity=0.7
-        ) if time_tracker.get_value() > 0.01 else VMobject())
+            return traj.smooth_momentum(1, t)
+
+        pt_line_a = TracedCurve(axes_pt, p_a_func, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                color=BLUE, stroke_width=3)
+        pt_line_b = TracedCurve(axes_pt, p_b_func, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                color=RED, stroke_width=3)
+        pt_line_tot = TracedCurve(axes_pt, lambda t: 6, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                  color=YELLOW, stroke_width=3, stroke_opacity=0.7)
         self.add(pt_line_a, pt_line_b, pt_line_tot)
 
         # 충돌 전
@@ -639,7 +636,7 @@ class MomentumConservation(Scene):
 
         # 충돌 효과 + 막대 업데이트
         collision_point = obj_a["box"].get_right()
-        bar_anims = self._update_bars(bar_data, [-2, 8, 6], [BLUE, RED, YELLOW])
+        bar_anims = self._update_bars(bar_data, traj.bar_values(collision_t), [BLUE, RED, YELLOW])
         self._collision_effect(collision_point, obj_a["box"], obj_b["box"], bar_anims)
 
         # 충돌 후
@@ -648,14 +645,12 @@ class MomentumConservation(Scene):
 
         # 정리
         self._clear_object_updaters(obj_a, obj_b)
-        self.remove(vel_arrow_a_dyn, vel_label_a_dyn, vel_arrow_b_dyn, vel_label_b_dyn,
-                    pt_line_a, pt_line_b, pt_line_tot)
-
-        # 정적 그래프
-        final_pt_a = axes_pt.plot(p_a_func, x_range=[0, self.SIM_TOTAL], color=BLUE, stroke_width=3)
-        final_pt_b = axes_pt.plot(p_b_func, x_range=[0, self.SIM_TOTAL], color=RED, stroke_width=3)
-        final_pt_tot = axes_pt.plot(lambda t: 6, x_range=[0, self.SIM_TOTAL],
-                                    color=YELLOW, stroke_width=3, stroke_opacity=0.7)
+        self.remove(vel_arrow_a_dyn, vel_label_a_dyn, vel_arrow_b_dyn, vel_label_b_dyn)
+
+        # 정적 그래프 (추적 곡선을 그대로 고정)
+        final_pt_a = pt_line_a.freeze()
+        final_pt_b = pt_line_b.freeze()
+        final_pt_tot = pt_line_tot.freeze()
         self.add(final_pt_a, final_pt_b, final_pt_tot)
 
         pt_lbl_a = Text("A의 운동량", font_size=self.FONT_LABEL, color=BLUE)
@@ -770,64 +765,21 @@ class MomentumConservation(Scene):
         # 초기: v_A=6, v_B=0, v_C=0
         # 1차(A→B): v_A'=-2, v_B'=4
         # 2차(B→C): v_B''=-0.8, v_C'=3.2
-        V_A_INIT = 6.0
-        V_A_AFTER1 = -2.0
-        V_B_AFTER1 = 4.0
-        V_B_AFTER2 = -0.8
-        V_C_AFTER2 = 3.2
-
-        # 1차 충돌 시간: A 오른쪽 → B 왼쪽
-        dist_ab = (START_B_X - obj_b_size / 2) - (START_A_X + obj_a_size / 2)
-        collision1_t = dist_ab / (V_A_INIT * SCALE_V)
-
-        # 2차 충돌 시간: B가 v=4로 이동, C 정지, B 오른쪽 → C 왼쪽
-        dist_bc = (START_C_X - obj_c_size / 2) - (START_B_X + obj_b_size / 2)
-        collision2_t = collision1_t + dist_bc / (V_B_AFTER1 * SCALE_V)
+        traj, breaks = self._collision_traj(
+            masses=[1, 2, 3], sizes=[obj_a_size, obj_b_size, obj_c_size],
+            x0=[START_A_X, START_B_X, START_C_X], v0=[6.0, 0.0, 0.0], scale_v=SCALE_V,
+            collisions=2)
+        collision1_t, collision2_t = breaks
+        v_final = traj.v_segments[:, -1]
 
         time_tracker = ValueTracker(0)
 
-        def pos_a(t):
-            if t <= collision1_t:
-                return START_A_X + V_A_INIT * SCALE_V * t
-            return START_A_X + V_A_INIT * SCALE_V * collision1_t + V_A_AFTER1 * SCALE_V * (t - collision1_t)
-
-        def pos_b(t):
-            if t <= collision1_t:
-                return START_B_X
-            if t <= collision2_t:
-                return START_B_X + V_B_AFTER1 * SCALE_V * (t - collision1_t)
-            return (START_B_X + V_B_AFTER1 * SCALE_V * (collision2_t - collision1_t)
-                    + V_B_AFTER2 * SCALE_V * (t - collision2_t))
-
-        def pos_c(t):
-            if t <= collision2_t:
-                return START_C_X
-            return START_C_X + V_C_AFTER2 * SCALE_V * (t - collision2_t)
-
-        # 현재 속도 함수 (화살표 표시용)
-        def vel_a(t):
-            if t < collision1_t:
-                return V_A_INIT
-            return V_A_AFTER1
-
-        def vel_b(t):
-            if t < collision1_t:
-                return 0.0
-            if t < collision2_t:
-                return V_B_AFTER1
-            return V_B_AFTER2
-
-        def vel_c(t):
-            if t < collision2_t:
-                return 0.0
-            return V_C_AFTER2
-
         y_a = center_y + obj_a_size / 2 + 0.1
         y_b = center_y + obj_b_size / 2 + 0.1
         y_c = center_y + obj_c_size / 2 + 0.1
-        self._setup_object_updaters(obj_a, pos_a, time_tracker, y_a)
-        self._setup_object_updaters(obj_b, pos_b, time_tracker, y_b)
-        self._setup_object_updaters(obj_c, pos_c, time_tracker, y_c)
+        self._setup_object_updaters(obj_a, traj, 0, time_tracker, y_a)
+        self._setup_object_updaters(obj_b, traj, 1, time_tracker, y_b)
+        self._setup_object_updaters(obj_c, traj, 2, time_tracker, y_c)
 
         # ── 7. 항상 표시되는 속도 화살표 + 라벨 (트랙 아래 표시) ──
         ARROW_SCALE = 0.13
@@ -855,11 +807,11 @@ class MomentumConservation(Scene):
             return VGroup(arrow, lbl)
 
         vel_display_a = always_redraw(
-            lambda: _make_vel_group(obj_a["box"], vel_a(time_tracker.get_value()), BLUE))
+            lambda: _make_vel_group(obj_a["box"], traj.velocity(0, time_tracker.get_value()), BLUE))
         vel_display_b = always_redraw(
-            lambda: _make_vel_group(obj_b["box"], vel_b(time_tracker.get_value()), RED))
+            lambda: _make_vel_group(obj_b["box"], traj.velocity(1, time_tracker.get_value()), RED))
         vel_display_c = always_redraw(
-            lambda: _make_vel_group(obj_c["box"], vel_c(time_tracker.get_value()), GREEN))
+            lambda: _make_vel_group(obj_c["box"], traj.velocity(2, time_tracker.get_value()), GREEN))
         self.add(vel_display_a, vel_display_b, vel_display_c)
 
         # ── 8. p-t 그래프 ──
@@ -869,40 +821,22 @@ class MomentumConservation(Scene):
         # total = 6
 
         def p_a_func(t):
-            s1 = self._smooth_step(t, collision1_t)
-            return V_A_INIT * (1 - s1) + V_A_AFTER1 * s1  # 6 → -2
+            return traj.smooth_momentum(0, t)  # 6 → -2
 
         def p_b_func(t):
-            s1 = self._smooth_step(t, collision1_t)
-            s2 = self._smooth_step(t, collision2_t)
-            # 0 → 8 (at c1) → -1.6 (at c2)
-            p_b_after1 = 2 * V_B_AFTER1  # = 8
-            p_b_after2 = 2 * V_B_AFTER2  # = -1.6
-            before = 0.0
-            mid = p_b_after1
-            after = p_b_after2
-            return before * (1 - s1) + mid * s1 * (1 - s2) + after * s2
+            return traj.smooth_momentum(1, t)  # 0 → 8 (at c1) → -1.6 (at c2)
 
         def p_c_func(t):
-            s2 = self._smooth_step(t, collision2_t)
-            return 3 * V_C_AFTER2 * s2  # 0 → 9.6
-
-        pt_line_a = always_redraw(lambda: axes_pt.plot(
-            p_a_func, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=BLUE, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-        pt_line_b = always_redraw(lambda: axes_pt.plot(
-            p_b_func, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=RED, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-        pt_line_c = always_redraw(lambda: axes_pt.plot(
-            p_c_func, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=GREEN, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-        pt_line_tot = always_redraw(lambda: axes_pt.plot(
-            lambda t: 6, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=YELLOW, stroke_width=3, stroke_opacity=0.7
-        ) if time_tracker.get_value() > 0.01 else VMobject())
+            return traj.smooth_momentum(2, t)  # 0 → 9.6
+
+        pt_line_a = TracedCurve(axes_pt, p_a_func, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                color=BLUE, stroke_width=3)
+        pt_line_b = TracedCurve(axes_pt, p_b_func, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                color=RED, stroke_width=3)
+        pt_line_c = TracedCurve(axes_pt, p_c_func, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                color=GREEN, stroke_width=3)
+        pt_line_tot = TracedCurve(axes_pt, lambda t: 6, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                  color=YELLOW, stroke_width=3, stroke_opacity=0.7)
         self.add(pt_line_a, pt_line_b, pt_line_c, pt_line_tot)
 
         # ── 9. 1차 충돌 (A→B) ──
@@ -910,7 +844,8 @@ class MomentumConservation(Scene):
                   run_time=collision1_t * self.REAL_PER_SIM, rate_func=linear)
 
         collision_point_1 = obj_a["box"].get_right()
-        bar_anims_1 = self._update_bars(bar_data, [-2, 8, 0, 6], [BLUE, RED, GREEN, YELLOW])
+        bar_anims_1 = self._update_bars(bar_data, traj.bar_values(collision1_t),
+                                        [BLUE, RED, GREEN, YELLOW])
         self._collision_effect(collision_point_1, obj_a["box"], obj_b["box"], bar_anims_1)
 
         # ── 10. B가 C로 이동 → 2차 충돌 ──
@@ -918,7 +853,8 @@ class MomentumConservation(Scene):
                   run_time=(collision2_t - collision1_t) * self.REAL_PER_SIM, rate_func=linear)
 
         collision_point_2 = obj_b["box"].get_right()
-        bar_anims_2 = self._update_bars(bar_data, [-2, -1.6, 9.6, 6], [BLUE, RED, GREEN, YELLOW])
+        bar_anims_2 = self._update_bars(bar_data, traj.bar_values(collision2_t),
+                                        [BLUE, RED, GREEN, YELLOW])
         self._collision_effect(collision_point_2, obj_b["box"], obj_c["box"], bar_anims_2)
 
         # ── 11. 충돌 후 이동 ──
@@ -927,21 +863,19 @@ class MomentumConservation(Scene):
 
         # 정리
         self._clear_object_updaters(obj_a, obj_b, obj_c)
-        self.remove(vel_display_a, vel_display_b, vel_display_c,
-                    pt_line_a, pt_line_b, pt_line_c, pt_line_tot)
-
-        # 정적 그래프
-        final_pt_a = axes_pt.plot(p_a_func, x_range=[0, self.SIM_TOTAL], color=BLUE, stroke_width=3)
-        final_pt_b = axes_pt.plot(p_b_func, x_range=[0, self.SIM_TOTAL], color=RED, stroke_width=3)
-        final_pt_c = axes_pt.plot(p_c_func, x_range=[0, self.SIM_TOTAL], color=GREEN, stroke_width=3)
-        final_pt_tot = axes_pt.plot(lambda t: 6, x_range=[0, self.SIM_TOTAL],
-                                    color=YELLOW, stroke_width=3, stroke_opacity=0.7)
+        self.remove(vel_display_a, vel_display_b, vel_display_c)
+
+        # 정적 그래프 (추적 곡선을 그대로 고정)
+        final_pt_a = pt_line_a.freeze()
+        final_pt_b = pt_line_b.freeze()
+        final_pt_c = pt_line_c.freeze()
+        final_pt_tot = pt_line_tot.freeze()
         self.add(final_pt_a, final_pt_b, final_pt_c, final_pt_tot)
 
         # 정적 속도 화살표 (최종 상태)
-        final_vel_a = _make_vel_group(obj_a["box"], V_A_AFTER1, BLUE)
-        final_vel_b = _make_vel_group(obj_b["box"], V_B_AFTER2, RED)
-        final_vel_c = _make_vel_group(obj_c["box"], V_C_AFTER2, GREEN)
+        final_vel_a = _make_vel_group(obj_a["box"], v_final[0], BLUE)
+        final_vel_b = _make_vel_group(obj_b["box"], v_final[1], RED)
+        final_vel_c = _make_vel_group(obj_c["box"], v_final[2], GREEN)
         self.add(final_vel_a, final_vel_b, final_vel_c)
 
         pt_lbl_a = Text("A의 운동량", font_size=self.FONT_LABEL, color=BLUE)
@@ -1015,26 +949,16 @@ class MomentumConservation(Scene):
         self.wait(0.3)
 
         # ── 6. 충돌 시뮬레이션 ──
-        V_BEFORE = 4.0
-        V_AFTER = 2.0
-
-        dist = (START_B_X - obj_size / 2) - (START_A_X + obj_size / 2)
-        collision_t = dist / (V_BEFORE * self.SCALE_V)
+        # 완전 비탄성 충돌 (반발 계수 0): 함께 v=2로 이동
+        traj, breaks = self._collision_traj(
+            masses=[1, 1], sizes=[obj_size, obj_size],
+            x0=[START_A_X, START_B_X], v0=[4.0, 0.0], restitution=0.0)
+        collision_t = breaks[0]
         time_tracker = ValueTracker(0)
 
-        def pos_a(t):
-            if t <= collision_t:
-                return START_A_X + V_BEFORE * self.SCALE_V * t
-            return START_A_X + V_BEFORE * self.SCALE_V * collision_t + V_AFTER * self.SCALE_V * (t - collision_t)
-
-        def pos_b(t):
-            if t <= collision_t:
-                return START_B_X
-            return START_B_X + V_AFTER * self.SCALE_V * (t - collision_t)
-
         y_pos = center_y + obj_size / 2 + 0.1
-        self._setup_object_updaters(obj_a, pos_a, time_tracker, y_pos)
-        self._setup_object_updaters(obj_b, pos_b, time_tracker, y_pos)
+        self._setup_object_updaters(obj_a, traj, 0, time_tracker, y_pos)
+        self._setup_object_updaters(obj_b, traj, 1, time_tracker, y_pos)
 
         vel_dyn = always_redraw(lambda: Arrow(
             start=obj_a["box"].get_right(), end=obj_a["box"].get_right() + RIGHT * 0.8,
@@ -1050,25 +974,17 @@ class MomentumConservation(Scene):
 
         # p-t 그래프
         def p_a_func(t):
-            s = self._smooth_step(t, collision_t)
-            return 4 * (1 - s) + 2 * s
+            return traj.smooth_momentum(0, t)
 
         def p_b_func(t):
-            s = self._smooth_step(t, collision_t)
-            return 2 * s
-
-        pt_line_a = always_redraw(lambda: axes_pt.plot(
-            p_a_func, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=BLUE, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-        pt_line_b = always_redraw(lambda: axes_pt.plot(
-            p_b_func, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=RED, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-        pt_line_tot = always_redraw(lambda: axes_pt.plot(
-            lambda t: 4, x_range=[0, min(max(time_tracker.get_value(), 0.02), self.SIM_TOTAL)],
-            color=YELLOW, stroke_width=3, stroke_opacity=0.7
-        ) if time_tracker.get_value() > 0.01 else VMobject())
+            return traj.smooth_momentum(1, t)
+
+        pt_line_a = TracedCurve(axes_pt, p_a_func, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                color=BLUE, stroke_width=3)
+        pt_line_b = TracedCurve(axes_pt, p_b_func, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                color=RED, stroke_width=3)
+        pt_line_tot = TracedCurve(axes_pt, lambda t: 4, time_tracker, x_range=[0, self.SIM_TOTAL],
+                                  color=YELLOW, stroke_width=3, stroke_opacity=0.7)
         self.add(pt_line_a, pt_line_b, pt_line_tot)
 
         # 충돌 전
@@ -1078,7 +994,7 @@ class MomentumConservation(Scene):
 
         # 충돌 효과 + 막대 업데이트
         collision_point = obj_a["box"].get_right()
-        bar_anims = self._update_bars(bar_data, [2, 2, 4], [BLUE, RED, YELLOW])
+        bar_anims = self._update_bars(bar_data, traj.bar_values(collision_t), [BLUE, RED, YELLOW])
         self._collision_effect(collision_point, obj_a["box"], obj_b["box"], bar_anims)
 
         # 합체 처리
@@ -1127,13 +1043,12 @@ class MomentumConservation(Scene):
         obj_b["label"].clear_updaters()
         merged_label.clear_updaters()
         merged_border.clear_updaters()
-        self.remove(merged_vel, merged_vel_label, vel_dyn, pt_line_a, pt_line_b, pt_line_tot)
+        self.remove(merged_vel, merged_vel_label, vel_dyn)
 
-        # 정적 그래프
-        final_pt_a = axes_pt.plot(p_a_func, x_range=[0, self.SIM_TOTAL], color=BLUE, stroke_width=3)
-        final_pt_b = axes_pt.plot(p_b_func, x_range=[0, self.SIM_TOTAL], color=RED, stroke_width=3)
-        final_pt_tot = axes_pt.plot(lambda t: 4, x_range=[0, self.SIM_TOTAL],
-                                    color=YELLOW, stroke_width=3, stroke_opacity=0.7)
+        # 정적 그래프 (추적 곡선을 그대로 고정)
+        final_pt_a = pt_line_a.freeze()
+        final_pt_b = pt_line_b.freeze()
+        final_pt_tot = pt_line_tot.freeze()
         self.add(final_pt_a, final_pt_b, final_pt_tot)
 
         pt_lbl_a = Text("A의 운동량", font_size=self.FONT_LABEL, color=BLUE)
@@ -1233,6 +1148,123 @@ class MomentumConservation(Scene):
         self.play(Write(key_msg), run_time=1.0)
         self.wait(2.0)
 
+    # ═══════════ Phase 6: 상자 속 기체 (2차원 다체 탄성 충돌) ═══════════
+
+    def phase6_gas_momentum(self):
+        # ── 1. 타이틀 ──
+        title = Text(f"확장: 상자 속 기체 분자 {self.GAS_PARTICLES}개 (2차원 탄성 충돌)",
+                     font_size=30, color=WHITE)
+        title.to_edge(UP)
+        self.play(Write(title))
+        self.wait(0.3)
+
+        # ── 2. 상자 ──
+        BOX = (-6.5, -0.5, -3.2, 2.4)
+        box_w, box_h = BOX[1] - BOX[0], BOX[3] - BOX[2]
+        box = Rectangle(width=box_w, height=box_h, color=WHITE, stroke_width=3)
+        box.move_to([(BOX[0] + BOX[1]) / 2, (BOX[2] + BOX[3]) / 2, 0])
+        self.play(Create(box), run_time=0.75)
+
+        # ── 3. 시뮬레이션 (프레임 시각마다 미리 계산) ──
+        # 격자 배치 + 작은 흔들림 (겹치지 않게), 속도는 정규분포 + 전체 흐름
+        n = self.GAS_PARTICLES
+        rng = np.random.default_rng(self.GAS_SEED)
+        nx = int(np.ceil(np.sqrt(n * box_w / box_h)))
+        ny = int(np.ceil(n / nx))
+        gx, gy = np.meshgrid(
+            BOX[0] + box_w * (np.arange(nx) + 0.5) / nx,
+            BOX[2] + box_h * (np.arange(ny) + 0.5) / ny,
+        )
+        gap = min(box_w / nx, box_h / ny) - 2 * self.GAS_RADIUS
+        x0 = np.column_stack([gx.ravel(), gy.ravel()])[:n]
+        x0 += rng.uniform(-0.25, 0.25, x0.shape) * max(gap, 0.0)
+        v0 = rng.normal(0.0, 1.0, (n, 2)) + self.GAS_DRIFT
+
+        gas = GasBox(BOX, self.GAS_RADIUS, x0, v0, masses=self.GAS_MASS)
+        gas.run(self._frame_times([0, self.GAS_SIM_TIME]))
+        time_tracker = ValueTracker(0)
+
+        def frame():
+            return gas.index(time_tracker.get_value())
+
+        # ── 4. 분자 (VMobject 하나) + 추적 분자 하나 ──
+        def disk_positions(i):
+            return np.column_stack([gas.positions[i], np.zeros(n)])
+
+        disks = MarkerCloud(Dot(radius=self.GAS_RADIUS, color=BLUE_B), disk_positions(0))
+        tracer = Dot([*gas.positions[0, 0], 0], radius=self.GAS_RADIUS * 1.6, color=YELLOW)
+        self.play(FadeIn(disks), FadeIn(tracer), run_time=0.75)
+
+        # ── 5. 총 운동량 벡터 ──
+        P_SCALE = 0.6
+        center = box.get_center()
+
+        def p_tip():
+            P = gas.P[frame()]
+            return center + P_SCALE * np.array([P[0], P[1], 0])
+
+        # 화살표는 한 번만 만들고 매 프레임 끝점만 옮긴다 (길이가 거의 0이면 숨김)
+        p_vec = Arrow(center, center + P_SCALE * np.array([*gas.P[0], 0]), color=YELLOW, buff=0,
+                      stroke_width=6, max_tip_length_to_length_ratio=0.2)
+
+        def follow_momentum(m):
+            tip = p_tip()
+            if np.linalg.norm(tip - center) < 0.05:
+                m.set_opacity(0)
+            else:
+                m.put_start_and_end_on(center, tip).set_opacity(1)
+
+        p_vec.add_updater(follow_momentum, call_updater=True)
+        p_vec_label = MathTex(r"\vec{P}_{tot}", font_size=24, color=YELLOW)
+        p_vec_label.add_updater(lambda m: m.move_to(p_tip() + UP * 0.3), call_updater=True)
+
+        # ── 6. 운동량 성분 · 운동에너지 막대 ──
+        P0, KE0 = gas.P[0], gas.KE[0]
+        bar_data = self._make_momentum_bars(
+            values=[P0[0], P0[1], KE0], colors=[BLUE, GREEN, ORANGE],
+            labels=["P_x", "P_y", "KE"], bar_scale=0.3)
+        bar_title = Text("운동량 · 운동에너지", font_size=self.FONT_LABEL, color=WHITE)
+        bar_title.move_to(bar_data["bar_title"])
+
+        wall_label = NumericLabel(r"J_{\text{wall}} =", decimals=1, font_size=24, color=RED)
+        wall_label.move_to(RIGHT * 3.5 + UP * 2.2)
+
+        def update_readout(m):
+            i = frame()
+            for bar, vl, val in zip(bar_data["bars"], bar_data["val_labels"], (*gas.P[i], gas.KE[i])):
+                bar.set_bar_height(abs(val) * bar_data["bar_scale"])
+                vl.set_value(val).next_to(bar, UP, buff=0.05)
+            wall_label.set_value(gas.wall[i])
+
+        self.play(
+            FadeIn(bar_data["bars"]), Write(bar_data["bar_labels"]),
+            Write(bar_title), Write(bar_data["val_labels"]),
+            FadeIn(p_vec), Write(p_vec_label), Write(wall_label),
+            run_time=0.75,
+        )
+
+        # ── 7. 재생 ──
+        disks.add_updater(lambda m: m.set_positions(disk_positions(frame())))
+        tracer.add_updater(lambda m: m.move_to([*gas.positions[frame(), 0], 0]))
+        bar_data["bars"].add_updater(update_readout)
+        self.play(
+            time_tracker.animate.set_value(self.GAS_SIM_TIME),
+            run_time=self.GAS_SIM_TIME * self.REAL_PER_SIM, rate_func=linear,
+        )
+        for mob in (disks, tracer, p_vec, p_vec_label, bar_data["bars"]):
+            mob.clear_updaters()
+        self.wait(0.5)
+
+        # ── 8. 핵심 메시지 ──
+        key_msg = VGroup(
+            Text("분자끼리 충돌: P, KE 보존", font_size=20, color=YELLOW),
+            Text("벽 충돌: 충격량만큼 P 변화 → 압력", font_size=20, color=RED),
+        ).arrange(DOWN, buff=0.15, aligned_edge=LEFT)
+        key_msg.move_to(RIGHT * 3.5 + UP * 1.2)
+        bg = BackgroundRectangle(key_msg, color=BLACK, fill_opacity=0.85, buff=0.15)
+        self.play(FadeIn(bg), Write(key_msg), run_time=1.0)
+        self.wait(2.0)
+
     # ═══════════ 정리 (Summary) ═══════════
 
     def summary(self):
@@ -1,6 +1,12 @@
 from manim import *
 import numpy as np
 
+from korean_font import use_korean_font_in_manim
+from sim_mobjects import NumericLabel, SweptArea, TracedCurve
+from sim_physics import WorkRun, frame_times
+
+use_korean_font_in_manim()
+
 
 class WorkAndKineticEnergy(Scene):
     def construct(self):
@@ -111,12 +117,20 @@ class WorkAndKineticEnergy(Scene):
         # 물리 파라미터
         mass = 2       # kg
         F_val = 4      # N
-        a_val = F_val / mass  # 2 m/s^2
         d_total = 5    # m (이동 거리)
-        t_total = np.sqrt(2 * d_total / a_val)  # sqrt(5) ≈ 2.24 s
-        v_final = a_val * t_total  # ≈ 4.47 m/s
         obj_size = 0.4
 
+        # 미는 힘 F(x) — 위치에 따라 변해도 된다 (예: 용수철 lambda x: -k * x, 줄어드는 힘 8 - 1.2 * x)
+        def force(x):
+            return np.full_like(np.asarray(x, dtype=float), F_val)
+
+        # 운동 계산: F(x)를 한 번 적분해 d_total에 닿는 시각까지, 프레임마다 x, v, W, K 표
+        # (W = ΔK를 모든 프레임에서 만들 때 검사)
+        RUN_TIME = 4
+        run = WorkRun(mass, force, x_stop=d_total)
+        t_total = run.t_stop  # sqrt(5) ≈ 2.24 s
+        run.sample(frame_times([0, t_total], config.frame_rate, RUN_TIME / t_total))
+
         # 타이틀
         title = VGroup(
             Text("수평면 위 물체 밀기:", font_size=24, color=WHITE),
@@ -192,61 +206,53 @@ class WorkAndKineticEnergy(Scene):
         f_label_mob = MathTex(r"F=4\text{N}", font_size=22, color=RED).next_to(f_arrow, UP, buff=0.1)
         self.play(GrowArrow(f_arrow), FadeIn(f_label_mob))
 
-        # ValueTracker 기반 시뮬레이션
+        # ValueTracker 기반 시뮬레이션 (위치·속도·일·운동에너지는 모두 표에서 조회)
         time_tracker = ValueTracker(0)
+        x_tracker = ValueTracker(0)
+        x_tracker.add_updater(lambda m: m.set_value(run.position(time_tracker.get_value())))
 
-        def pos_m(t):
-            return 0.5 * a_val * t**2
-
-        def vel(t):
-            return a_val * t
-
-        obj.add_updater(lambda m: m.move_to([m2x(min(pos_m(time_tracker.get_value()), d_total)), obj_y, 0]))
+        # 물체는 x_tracker(장면에 나중에 추가돼 갱신이 한 프레임 늦음) 대신 표를 직접 조회
+        obj.add_updater(lambda m: m.move_to([m2x(run.position(time_tracker.get_value())), obj_y, 0]))
         obj_label.add_updater(lambda m: m.move_to(obj))
         f_arrow.add_updater(lambda m: m.put_start_and_end_on(
             obj.get_right(), obj.get_right() + RIGHT * 1.0
         ))
         f_label_mob.add_updater(lambda m: m.next_to(f_arrow, UP, buff=0.1))
 
-        # 동적 그래프
-        fx_line = always_redraw(lambda: fx_axes.plot(
-            lambda x: F_val, x_range=[0, max(min(pos_m(time_tracker.get_value()), d_total), 0.02)],
-            color=RED, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
+        # 동적 그래프: F-x 곡선과 그 아래 넓이(일)가 물체 위치까지 자란다
+        fx_line = TracedCurve(fx_axes, force, x_tracker, x_range=[0, d_total], color=RED, stroke_width=3)
+        vt_line = TracedCurve(vt_axes, run.velocity, time_tracker, x_range=[0, t_total],
+                              color=BLUE, stroke_width=3)
 
-        vt_line = always_redraw(lambda: vt_axes.plot(
-            lambda t: vel(t), x_range=[0, max(min(time_tracker.get_value(), t_total), 0.02)],
-            color=BLUE, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
+        fx_x = np.linspace(0, d_total, 201)
+        area_fx = SweptArea(fx_axes, fx_x, force(fx_x), color=YELLOW, opacity=0.4)
+        area_fx.add_updater(lambda m: m.set_right(x_tracker.get_value()))
 
-        self.add(fx_line, vt_line)
+        w_live = NumericLabel("W =", decimals=1, int_if_whole=True, suffix=r"\,\text{J}",
+                              font_size=24, color=YELLOW)
+        w_live.move_to(fx_axes.c2p(d_total / 2, F_val / 2))
+        w_live.add_updater(lambda m: m.set_value(run.work(time_tracker.get_value())), call_updater=True)
+
+        k_live = NumericLabel(r"\tfrac{1}{2}mv^2 =", decimals=1, int_if_whole=True, suffix=r"\,\text{J}",
+                              font_size=24, color=BLUE)
+        k_live.move_to(vt_axes.c2p(1.0, 5.2))
+        k_live.add_updater(lambda m: m.set_value(run.kinetic(time_tracker.get_value())), call_updater=True)
+
+        self.add(x_tracker, area_fx, fx_line, vt_line, w_live, k_live)
 
         # 애니메이션
         self.play(
             time_tracker.animate.set_value(t_total),
-            run_time=4, rate_func=linear,
+            run_time=RUN_TIME, rate_func=linear,
         )
 
         # clear updaters
-        obj.clear_updaters()
-        obj_label.clear_updaters()
-        f_arrow.clear_updaters()
-        f_label_mob.clear_updaters()
-        self.remove(fx_line, vt_line)
+        for mob in (x_tracker, obj, obj_label, f_arrow, f_label_mob, area_fx, w_live, k_live):
+            mob.clear_updaters()
 
         # 정적 그래프
-        static_fx = fx_axes.plot(lambda x: F_val, x_range=[0, d_total], color=RED, stroke_width=3)
-        static_vt = vt_axes.plot(lambda t: vel(t), x_range=[0, t_total], color=BLUE, stroke_width=3)
-        self.add(static_fx, static_vt)
-        self.wait(0.5)
-
-        # F-x 면적 색칠
-        area_fx = Polygon(
-            fx_axes.c2p(0, 0), fx_axes.c2p(0, F_val),
-            fx_axes.c2p(d_total, F_val), fx_axes.c2p(d_total, 0),
-            color=YELLOW, fill_opacity=0.4, stroke_width=1,
-        )
-        self.play(FadeIn(area_fx))
+        fx_line.freeze()
+        vt_line.freeze()
         self.wait(0.5)
 
         # W = Fd 계산
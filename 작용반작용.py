@@ -1,31 +1,37 @@
 from manim import *
 import numpy as np
 
+from korean_font import use_korean_font_in_manim
+from sim_mobjects import TracedCurve
+from sim_physics import PushApart, frame_times
+
+use_korean_font_in_manim()
+
 
 class NewtonsThirdLaw(Scene):
+    PUSH_FORCE = 3.0        # 접촉면에서 서로 미는 힘 (N)
+    PUSH_TIME = 1.0         # 미는 시간 (s)
+    PUSH_REAL_PER_SIM = 2.5  # 시뮬레이션 1초당 실제 재생 시간
+    BODY_NAMES = ["A", "B", "C", "D"]
+    BODY_COLORS = [BLUE, RED, GREEN, ORANGE]
+
     def construct(self):
         self.intro()
-        self.play(*[FadeOut(m) for m in self.mobjects])
-        self.wait(0.5)
-
+        self.clear_screen()
         self.phase1_equal_mass()
-        self.play(*[FadeOut(m) for m in self.mobjects])
-        self.wait(0.5)
-
+        self.clear_screen()
         self.phase2_different_mass()
-        self.play(*[FadeOut(m) for m in self.mobjects])
-        self.wait(0.5)
-
+        self.clear_screen()
         self.phase3_examples()
-        self.play(*[FadeOut(m) for m in self.mobjects])
-        self.wait(0.5)
-
+        self.clear_screen()
         self.phase4_misconception()
+        self.clear_screen()
+        self.outro()
+
+    def clear_screen(self):
         self.play(*[FadeOut(m) for m in self.mobjects])
         self.wait(0.5)
 
-        self.outro()
-
     # =========================================================
     # Intro
     # =========================================================
@@ -57,238 +63,215 @@ class NewtonsThirdLaw(Scene):
         self.play(Write(title))
         self.wait(0.5)
 
-        # --- Track ---
-        track_start = LEFT * 6
-        track_end = RIGHT * 6
-        track = Line(track_start, track_end, color=WHITE, stroke_width=3)
-        track.shift(UP * 1.5)
+        self.run_push_experiment(
+            PushApart([1.0, 1.0], self.PUSH_FORCE, self.PUSH_TIME), ["m", "m"], obj_size=0.45,
+            conclusion="질량이 같으면 가속도도 같다",
+        )
 
-        tick_marks = VGroup()
-        tick_labels = VGroup()
-        for i in range(21):
-            val = i - 10
-            x_pos = track_start[0] + (track_end[0] - track_start[0]) * (i / 20)
-            tick = Line(UP * 0.1, DOWN * 0.1, color=WHITE, stroke_width=2)
-            tick.move_to([x_pos, track.get_center()[1], 0])
-            tick_marks.add(tick)
-            if i % 5 == 0:
-                label = Text(str(val), font_size=16, color=GRAY)
-                label.next_to(tick, DOWN, buff=0.15)
-                tick_labels.add(label)
+    # =========================================================
+    # Phase 2: 실험 B — 다른 질량 (m vs 3m) ★
+    # =========================================================
+    def phase2_different_mass(self):
+        title = Text("실험 B: 다른 질량 (m vs 3m)", font_size=36, color=WHITE)
+        title.to_edge(UP)
+        self.play(Write(title))
+        self.wait(0.5)
 
-        self.play(Create(track), run_time=0.75)
-        self.play(Create(tick_marks), Write(tick_labels), run_time=0.75)
+        question = Text("가벼운 A와 무거운 B, 누가 더 큰 힘을 받을까요?", font_size=26, color=YELLOW)
+        question.next_to(title, DOWN, buff=0.25)
+
+        self.run_push_experiment(
+            PushApart([1.0, 3.0], self.PUSH_FORCE, self.PUSH_TIME), ["m", "3m"], obj_size=0.4,
+            conclusion="힘은 같지만 가속도는 다르다!", question=question, surprise="힘의 크기는 동일!",
+        )
 
-        # --- 수식 정리 영역 (하단 좌) ---
+    # =========================================================
+    # 서로 밀기 실험 (PushApart 모형 → 트랙·v-t 그래프·수식 정리)
+    # =========================================================
+    def run_push_experiment(self, model, mass_texs, obj_size=0.45, conclusion="",
+                            question=None, surprise=None):
+        """PushApart 모형 하나로 트랙 위 물체, 힘 화살표, v-t 그래프, 수식 정리를 구성해 재생"""
+        n = len(model.masses)
+        names = self.BODY_NAMES[:n]
+        colors = self.BODY_COLORS[:n]
+        t_push = model.t_push
+        t_total = 2 * t_push
+
+        # ── 1. 트랙 ──
+        track = self._make_track()
+        self.play(Create(track[0]), run_time=0.75)
+        self.play(Create(track[1]), Write(track[2]), run_time=0.75)
+
+        # ── 2. 수식 정리 영역 (하단 좌) ──
         info_origin = DOWN * 1.2 + LEFT * 4.0
         info_title = Text("수식 정리", font_size=22, color=YELLOW)
         info_title.move_to(info_origin + UP * 1.3)
         self.play(Write(info_title), run_time=0.5)
 
-        # --- v-t graph (하단 우) ---
-        axes_vt = Axes(
-            x_range=[0, 2, 0.5], y_range=[-4, 4, 1],
-            x_length=4.5, y_length=3.5,
-            axis_config={"include_tip": False},
-            x_axis_config={"numbers_to_include": [0.5, 1.0, 1.5, 2.0]},
-            y_axis_config={"numbers_to_include": [-3, -1, 1, 3]},
-        )
-        axes_vt.to_corner(DR, buff=0.6)
+        # ── 3. v-t 그래프 (하단 우): 범위는 모형의 최종 속도에서 ──
+        axes_vt = self._push_axes(model, t_total)
         x_lab = Text("t (s)", font_size=18).next_to(axes_vt.x_axis, RIGHT, buff=0.15)
         y_lab = Text("v (m/s)", font_size=18).next_to(axes_vt.y_axis, UP, buff=0.15)
         self.play(Create(axes_vt), Write(x_lab), Write(y_lab), run_time=0.75)
         self.wait(0.3)
 
-        # --- 물체 배치 ---
-        obj_size = 0.45
-        center_y = track.get_center()[1]
-
-        box_a = Square(side_length=obj_size, color=BLUE, fill_opacity=0.8)
-        box_b = Square(side_length=obj_size, color=RED, fill_opacity=0.8)
-        label_a = Text("A", font_size=18, color=WHITE)
-        label_b = Text("B", font_size=18, color=WHITE)
-
-        # A와 B가 접촉한 상태로 배치
-        box_a.move_to([0 - obj_size / 2, center_y + obj_size / 2 + 0.1, 0])
-        box_b.move_to([0 + obj_size / 2, center_y + obj_size / 2 + 0.1, 0])
-        label_a.move_to(box_a)
-        label_b.move_to(box_b)
-
-        mass_a = MathTex("m", font_size=20, color=BLUE).next_to(box_a, UP, buff=0.1)
-        mass_b = MathTex("m", font_size=20, color=RED).next_to(box_b, UP, buff=0.1)
+        # ── 4. 물체 배치: 질량 m의 배수만큼 정사각형을 쌓고 접촉한 채로 나란히 ──
+        center_y = track[0].get_center()[1]
+        m_unit = model.masses.min()
+        boxes, labels, mass_labels = VGroup(), VGroup(), VGroup()
+        for k in range(n):
+            box = VGroup(*[
+                Square(side_length=obj_size, color=colors[k], fill_opacity=0.8)
+                for _ in range(max(int(round(model.masses[k] / m_unit)), 1))
+            ]).arrange(UP, buff=0)
+            box.move_to([(k - (n - 1) / 2) * obj_size, center_y + box.get_height() / 2 + 0.1, 0])
+            boxes.add(box)
+            labels.add(Text(names[k], font_size=round(obj_size * 40), color=WHITE).move_to(box))
+            mass_labels.add(MathTex(mass_texs[k], font_size=20, color=colors[k]).next_to(box, UP, buff=0.1))
 
         # 접촉면 표시
-        contact_line = DashedLine(
-            [0, center_y + obj_size + 0.15, 0],
-            [0, center_y + 0.05, 0],
-            color=YELLOW, stroke_width=2, dash_length=0.06
-        )
+        contact_lines = VGroup(*[
+            DashedLine(
+                [boxes[k].get_right()[0], center_y + max(boxes[k].get_height(), boxes[k + 1].get_height()) + 0.15, 0],
+                [boxes[k].get_right()[0], center_y + 0.05, 0],
+                color=YELLOW, stroke_width=2, dash_length=0.06
+            )
+            for k in range(n - 1)
+        ])
 
         self.play(
-            FadeIn(box_a), FadeIn(box_b), Write(label_a), Write(label_b),
-            Write(mass_a), Write(mass_b), Create(contact_line),
+            *[FadeIn(box) for box in boxes], *[Write(lbl) for lbl in labels],
+            *[Write(lbl) for lbl in mass_labels], Create(contact_lines),
             run_time=1.0
         )
         self.wait(0.3)
 
         # 접촉 상태의 시작 위치 기록
-        start_a_x = box_a.get_center()[0]
-        start_b_x = box_b.get_center()[0]
+        start_x = [box.get_center()[0] for box in boxes]
+
+        if question is not None:
+            self.play(Write(question), run_time=1.0)
+            self.wait(1.5)
+            self.play(FadeOut(question), run_time=0.5)
 
         # "서로 밀기!" 텍스트
         push_text = Text("서로 밀기!", font_size=32, color=YELLOW)
-        push_text.next_to(contact_line, UP, buff=0.4)
+        push_text.next_to(contact_lines, UP, buff=0.4)
         self.play(Write(push_text), run_time=0.5)
-        self.wait(0.5)
-        self.play(FadeOut(push_text), FadeOut(contact_line), run_time=0.3)
+        self.wait(0.5 if question is None else 0.3)
+        self.play(FadeOut(push_text), FadeOut(contact_lines), run_time=0.3)
 
-        # --- 운동 시뮬레이션 ---
-        accel = 3.0
-        force_time = 1.0
-        v_final = accel * force_time  # 3 m/s
+        # ── 5. 운동 시뮬레이션: 프레임 궤적·힘은 모형에서 한 번에 ──
         scale_factor = 0.5
-
+        table = model.table(frame_times([0, t_push, t_total], config.frame_rate, self.PUSH_REAL_PER_SIM))
         time_tracker = ValueTracker(0)
 
-        def pos_a(t):
-            if t <= force_time:
-                return -0.5 * accel * t ** 2
-            else:
-                s1 = 0.5 * accel * force_time ** 2
-                return -(s1 + v_final * (t - force_time))
-
-        def pos_b(t):
-            if t <= force_time:
-                return 0.5 * accel * t ** 2
-            else:
-                s1 = 0.5 * accel * force_time ** 2
-                return s1 + v_final * (t - force_time)
-
-        def update_box_a(m):
-            t = time_tracker.get_value()
-            x = start_a_x + pos_a(t) * scale_factor
-            m.move_to([x, center_y + obj_size / 2 + 0.1, 0])
-
-        def update_box_b(m):
-            t = time_tracker.get_value()
-            x = start_b_x + pos_b(t) * scale_factor
-            m.move_to([x, center_y + obj_size / 2 + 0.1, 0])
-
-        label_a.add_updater(lambda m: m.move_to(box_a))
-        label_b.add_updater(lambda m: m.move_to(box_b))
-        mass_a.add_updater(lambda m: m.next_to(box_a, UP, buff=0.1))
-        mass_b.add_updater(lambda m: m.next_to(box_b, UP, buff=0.1))
-
-        # 힘 화살표 (가속 구간에만)
-        force_arrow_a = always_redraw(lambda: Arrow(
-            start=box_a.get_left(),
-            end=box_a.get_left() + LEFT * 0.6,
-            color=BLUE, buff=0, stroke_width=4,
-            max_tip_length_to_length_ratio=0.3,
-        ) if time_tracker.get_value() <= force_time else VMobject())
-
-        force_arrow_b = always_redraw(lambda: Arrow(
-            start=box_b.get_right(),
-            end=box_b.get_right() + RIGHT * 0.6,
-            color=RED, buff=0, stroke_width=4,
-            max_tip_length_to_length_ratio=0.3,
-        ) if time_tracker.get_value() <= force_time else VMobject())
-
-        self.add(force_arrow_a, force_arrow_b)
+        def follow(k):
+            def update(m):
+                x = start_x[k] + table.position(k, time_tracker.get_value()) * scale_factor
+                m.move_to([x, center_y + m.get_height() / 2 + 0.1, 0])
+            return update
+
+        for k in range(n):
+            boxes[k].add_updater(follow(k))
+            labels[k].add_updater(lambda m, k=k: m.move_to(boxes[k]))
+            mass_labels[k].add_updater(lambda m, k=k: m.next_to(boxes[k], UP, buff=0.1))
+
+        # 힘 화살표: 알짜힘 방향·크기 비례 (밀고 있는 동안만, 크기가 같으면 길이도 같다)
+        f_ref = np.abs(table.force).max()
+
+        def force_arrow(k):
+            def draw():
+                F = table.force[k, table.index(time_tracker.get_value())]
+                if abs(F) < 1e-9:
+                    return VMobject()
+                side = boxes[k].get_right() if F > 0 else boxes[k].get_left()
+                return Arrow(
+                    start=side, end=side + RIGHT * 0.6 * F / f_ref,
+                    color=colors[k], buff=0, stroke_width=4,
+                    max_tip_length_to_length_ratio=0.3,
+                )
+            return always_redraw(draw)
+
+        force_arrows = [force_arrow(k) for k in range(n)]
+        self.add(*force_arrows)
 
         # v-t 그래프 라인
-        vt_line_a = always_redraw(lambda: axes_vt.plot(
-            lambda t: -(accel * t if t <= force_time else v_final),
-            x_range=[0, max(time_tracker.get_value(), 0.02)],
-            color=BLUE, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-
-        vt_line_b = always_redraw(lambda: axes_vt.plot(
-            lambda t: accel * t if t <= force_time else v_final,
-            x_range=[0, max(time_tracker.get_value(), 0.02)],
-            color=RED, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-
-        self.add(vt_line_a, vt_line_b)
-
-        box_a.add_updater(update_box_a)
-        box_b.add_updater(update_box_b)
-
-        # 수식 1: 힘 동일
-        info_eq1 = MathTex(r"F_A = F_B = 3\,\text{N}", font_size=24, color=WHITE)
+        vt_lines = [
+            TracedCurve(axes_vt, lambda t, k=k: model.velocity(t)[k], time_tracker,
+                        x_range=[0, t_total], color=colors[k], stroke_width=3)
+            for k in range(n)
+        ]
+        self.add(*vt_lines)
+
+        # 수식 1: 접촉면마다 주고받는 힘은 크기가 같다
+        info_eq1 = self._push_force_tex(model, names)
         info_eq1.move_to(info_origin + UP * 0.7)
         self.play(Write(info_eq1), run_time=0.5)
 
-        self.play(time_tracker.animate.set_value(1.0), run_time=2.5, rate_func=linear)
-
-        # 수식 2: 가속도 동일
-        info_eq2 = MathTex(r"a_A = a_B = 3\,\text{m/s}^2", font_size=24, color=WHITE)
-        info_eq2.move_to(info_origin + UP * 0.1)
-        self.play(Write(info_eq2), run_time=0.5)
-
-        self.play(time_tracker.animate.set_value(2.0), run_time=2.5, rate_func=linear)
-
-        box_a.clear_updaters()
-        box_b.clear_updaters()
-        label_a.clear_updaters()
-        label_b.clear_updaters()
-        mass_a.clear_updaters()
-        mass_b.clear_updaters()
-        self.remove(force_arrow_a, force_arrow_b, vt_line_a, vt_line_b)
-
-        # 최종 v-t 라인 (정적)
-        final_vt_a = axes_vt.plot(
-            lambda t: -(accel * t if t <= force_time else v_final),
-            x_range=[0, 2], color=BLUE, stroke_width=3
-        )
-        final_vt_b = axes_vt.plot(
-            lambda t: accel * t if t <= force_time else v_final,
-            x_range=[0, 2], color=RED, stroke_width=3
-        )
-        vt_label_a = Text("A", font_size=16, color=BLUE).next_to(axes_vt.c2p(2, -3), LEFT, buff=0.1)
-        vt_label_b = Text("B", font_size=16, color=RED).next_to(axes_vt.c2p(2, 3), LEFT, buff=0.1)
-        self.add(final_vt_a, final_vt_b)
-        self.play(Write(vt_label_a), Write(vt_label_b), run_time=0.5)
-
-        # v-t 점선 보조선: t=1 수직, v=±3 수평
-        dash_vert = DashedLine(
-            axes_vt.c2p(1, -4), axes_vt.c2p(1, 4),
-            color=GRAY, stroke_width=1.5, dash_length=0.08
-        )
-        dash_h_a = DashedLine(
-            axes_vt.c2p(0, -3), axes_vt.c2p(1, -3),
-            color=BLUE, stroke_width=1.5, dash_length=0.08, stroke_opacity=0.5
-        )
-        dash_h_b = DashedLine(
-            axes_vt.c2p(0, 3), axes_vt.c2p(1, 3),
-            color=RED, stroke_width=1.5, dash_length=0.08, stroke_opacity=0.5
-        )
-        t1_label = MathTex("t=1", font_size=14, color=GRAY).next_to(axes_vt.c2p(1, -4), DOWN, buff=0.1)
-        va_label = MathTex("v=-3", font_size=14, color=BLUE).next_to(axes_vt.c2p(0, -3), LEFT, buff=0.1)
-        vb_label = MathTex("v=3", font_size=14, color=RED).next_to(axes_vt.c2p(0, 3), LEFT, buff=0.1)
-
-        self.play(
-            Create(dash_vert), Create(dash_h_a), Create(dash_h_b),
-            Write(t1_label), Write(va_label), Write(vb_label),
-            run_time=0.75
-        )
+        self.play(time_tracker.animate.set_value(t_push),
+                  run_time=t_push * self.PUSH_REAL_PER_SIM, rate_func=linear)
+
+        # 수식 2: 가속도 = 알짜힘 / 질량
+        info_eq2 = self._push_accel_texs(model, names, mass_texs, colors)
+        for i, eq in enumerate(info_eq2):
+            eq.move_to(info_origin + UP * 0.1 + DOWN * 0.5 * i)
+            self.play(Write(eq), run_time=0.5)
+
+        self.play(time_tracker.animate.set_value(t_total),
+                  run_time=(t_total - t_push) * self.PUSH_REAL_PER_SIM, rate_func=linear)
+
+        for mob in (*boxes, *labels, *mass_labels, *vt_lines):
+            mob.clear_updaters()
+        self.remove(*force_arrows)
+
+        # 최종 v-t 라벨: 가속도가 모두 같으면 이름만, 다르면 가속도까지
+        same_accel = np.allclose(np.abs(model.accel), abs(model.accel[0]))
+        vt_labels = VGroup(*[
+            Text(names[k] if same_accel else f"{names[k]} (a={abs(model.accel[k]):g})",
+                 font_size=16 if same_accel else 14, color=colors[k])
+            .next_to(axes_vt.c2p(t_total, model.v_final[k]), LEFT, buff=0.1)
+            for k in range(n)
+        ])
+        self.play(*[Write(lbl) for lbl in vt_labels], run_time=0.5)
+
+        # v-t 점선 보조선: 밀기가 끝나는 t 수직, 최종 속도 수평
+        y_min, y_max = axes_vt.y_range[:2]
+        guides = [
+            DashedLine(axes_vt.c2p(t_push, y_min), axes_vt.c2p(t_push, y_max),
+                       color=GRAY, stroke_width=1.5, dash_length=0.08),
+            MathTex(f"t={t_push:g}", font_size=14, color=GRAY)
+                .next_to(axes_vt.c2p(t_push, y_min), DOWN, buff=0.1),
+        ]
+        for k in range(n):
+            v = model.v_final[k]
+            if abs(v) < 1e-9:
+                continue
+            guides.append(DashedLine(
+                axes_vt.c2p(0, v), axes_vt.c2p(t_push, v),
+                color=colors[k], stroke_width=1.5, dash_length=0.08, stroke_opacity=0.5
+            ))
+            guides.append(MathTex(f"v={v:g}", font_size=14, color=colors[k])
+                          .next_to(axes_vt.c2p(0, v), LEFT, buff=0.1))
+        self.play(*[Create(g) if isinstance(g, DashedLine) else Write(g) for g in guides],
+                  run_time=0.75)
 
         # 수식 3: 결론
-        info_eq3 = Text("질량이 같으면 가속도도 같다", font_size=20, color=YELLOW)
-        info_eq3.move_to(info_origin + DOWN * 0.5)
-        self.play(Write(info_eq3), run_time=0.75)
+        info_eq3 = Text(conclusion, font_size=20, color=YELLOW)
+        info_eq3.move_to(info_eq2[-1].get_center() + DOWN * 0.6)
+        if surprise is None:
+            self.play(Write(info_eq3), run_time=0.75)
+        else:
+            self.wait(0.5)
+            surprise_text = Text(surprise, font_size=28, color=YELLOW)
+            surprise_text.next_to(track[0], DOWN, buff=0.3)
+            self.play(Write(surprise_text), run_time=0.75)
+            self.wait(1.0)
+            self.play(FadeOut(surprise_text), Write(info_eq3), run_time=0.75)
         self.wait(2.0)
 
-    # =========================================================
-    # Phase 2: 실험 B — 다른 질량 (m vs 3m) ★
-    # =========================================================
-    def phase2_different_mass(self):
-        title = Text("실험 B: 다른 질량 (m vs 3m)", font_size=36, color=WHITE)
-        title.to_edge(UP)
-        self.play(Write(title))
-        self.wait(0.5)
-
-        # --- Track ---
+    def _make_track(self):
+        """-10 ~ 10 눈금 트랙 → VGroup(선, 눈금, 눈금 숫자)"""
         track_start = LEFT * 6
         track_end = RIGHT * 6
         track = Line(track_start, track_end, color=WHITE, stroke_width=3)
@@ -306,236 +289,48 @@ class NewtonsThirdLaw(Scene):
                 label = Text(str(val), font_size=16, color=GRAY)
                 label.next_to(tick, DOWN, buff=0.15)
                 tick_labels.add(label)
-
-        self.play(Create(track), run_time=0.75)
-        self.play(Create(tick_marks), Write(tick_labels), run_time=0.75)
-
-        # --- 수식 정리 영역 (하단 좌) ---
-        info_origin = DOWN * 1.2 + LEFT * 4.0
-        info_title = Text("수식 정리", font_size=22, color=YELLOW)
-        info_title.move_to(info_origin + UP * 1.3)
-        self.play(Write(info_title), run_time=0.5)
-
-        # --- v-t graph (하단 우) ---
+        return VGroup(track, tick_marks, tick_labels)
+
+    def _push_axes(self, model, t_total):
+        """최종 속도 범위를 정수 1칸 여유로 감싸는 v-t 축 (하단 우)"""
+        v_lo = int(np.floor(min(model.v_final.min(), 0))) - 1
+        v_hi = int(np.ceil(max(model.v_final.max(), 0))) + 1
+        ticks = [v for v in range(v_lo + 1, v_hi) if v != 0]
+        if len(ticks) > 4:
+            ticks = [v for v in ticks if v % 2]
         axes_vt = Axes(
-            x_range=[0, 2, 0.5], y_range=[-4, 2, 1],
+            x_range=[0, t_total, 0.5], y_range=[v_lo, v_hi, 1],
             x_length=4.5, y_length=3.5,
             axis_config={"include_tip": False},
-            x_axis_config={"numbers_to_include": [0.5, 1.0, 1.5, 2.0]},
-            y_axis_config={"numbers_to_include": [-3, -2, -1, 1]},
+            x_axis_config={"numbers_to_include": np.arange(0.5, t_total + 1e-9, 0.5)},
+            y_axis_config={"numbers_to_include": ticks},
         )
         axes_vt.to_corner(DR, buff=0.6)
-        x_lab = Text("t (s)", font_size=18).next_to(axes_vt.x_axis, RIGHT, buff=0.15)
-        y_lab = Text("v (m/s)", font_size=18).next_to(axes_vt.y_axis, UP, buff=0.15)
-        self.play(Create(axes_vt), Write(x_lab), Write(y_lab), run_time=0.75)
-        self.wait(0.3)
-
-        # --- 물체 배치 ---
-        obj_size = 0.4
-        center_y = track.get_center()[1]
-
-        box_a = Square(side_length=obj_size, color=BLUE, fill_opacity=0.8)
-        label_a = Text("A", font_size=16, color=WHITE)
-        mass_a_label = MathTex("m", font_size=20, color=BLUE)
-
-        box_b = VGroup(*[
-            Square(side_length=obj_size, color=RED, fill_opacity=0.8)
-            for _ in range(3)
-        ])
-        box_b.arrange(UP, buff=0)
-        label_b = Text("B", font_size=16, color=WHITE)
-        mass_b_label = MathTex("3m", font_size=20, color=RED)
-
-        # A와 B가 접촉한 상태로 배치
-        box_a.move_to([0 - obj_size / 2, center_y + obj_size / 2 + 0.1, 0])
-        box_b.move_to([0 + obj_size / 2, center_y + box_b.get_height() / 2 + 0.1, 0])
-        label_a.move_to(box_a)
-        label_b.move_to(box_b)
-        mass_a_label.next_to(box_a, UP, buff=0.1)
-        mass_b_label.next_to(box_b, UP, buff=0.1)
-
-        # 접촉면 표시
-        contact_y_top = center_y + box_b.get_height() + 0.15
-        contact_line = DashedLine(
-            [0, contact_y_top, 0],
-            [0, center_y + 0.05, 0],
-            color=YELLOW, stroke_width=2, dash_length=0.06
-        )
-
-        self.play(
-            FadeIn(box_a), FadeIn(box_b), Write(label_a), Write(label_b),
-            Write(mass_a_label), Write(mass_b_label), Create(contact_line),
-            run_time=1.0
-        )
-        self.wait(0.3)
-
-        # 접촉 상태의 시작 위치 기록
-        start_a_x = box_a.get_center()[0]
-        start_b_x = box_b.get_center()[0]
-
-        # 질문
-        question = Text("가벼운 A와 무거운 B, 누가 더 큰 힘을 받을까요?", font_size=26, color=YELLOW)
-        question.next_to(title, DOWN, buff=0.25)
-        self.play(Write(question), run_time=1.0)
-        self.wait(1.5)
-        self.play(FadeOut(question), run_time=0.5)
-
-        # "서로 밀기!"
-        push_text = Text("서로 밀기!", font_size=32, color=YELLOW)
-        push_text.next_to(contact_line, UP, buff=0.4)
-        self.play(Write(push_text), run_time=0.5)
-        self.wait(0.3)
-        self.play(FadeOut(push_text), FadeOut(contact_line), run_time=0.3)
-
-        # --- 운동 시뮬레이션 ---
-        a_A = 3.0
-        a_B = 1.0
-        force_time = 1.0
-        v_A = a_A * force_time  # 3
-        v_B = a_B * force_time  # 1
-        scale_factor = 0.5
-
-        time_tracker = ValueTracker(0)
-
-        def pos_a(t):
-            if t <= force_time:
-                return -0.5 * a_A * t ** 2
-            else:
-                s1 = 0.5 * a_A * force_time ** 2
-                return -(s1 + v_A * (t - force_time))
-
-        def pos_b(t):
-            if t <= force_time:
-                return 0.5 * a_B * t ** 2
-            else:
-                s1 = 0.5 * a_B * force_time ** 2
-                return s1 + v_B * (t - force_time)
-
-        def update_box_a(m):
-            t = time_tracker.get_value()
-            x = start_a_x + pos_a(t) * scale_factor
-            m.move_to([x, center_y + obj_size / 2 + 0.1, 0])
-
-        def update_box_b(m):
-            t = time_tracker.get_value()
-            x = start_b_x + pos_b(t) * scale_factor
-            bh = m.get_height()
-            m.move_to([x, center_y + bh / 2 + 0.1, 0])
-
-        label_a.add_updater(lambda m: m.move_to(box_a))
-        label_b.add_updater(lambda m: m.move_to(box_b))
-        mass_a_label.add_updater(lambda m: m.next_to(box_a, UP, buff=0.1))
-        mass_b_label.add_updater(lambda m: m.next_to(box_b, UP, buff=0.1))
-
-        # 힘 화살표 (같은 길이!)
-        force_arrow_a = always_redraw(lambda: Arrow(
-            start=box_a.get_left(),
-            end=box_a.get_left() + LEFT * 0.6,
-            color=BLUE, buff=0, stroke_width=4,
-            max_tip_length_to_length_ratio=0.3,
-        ) if time_tracker.get_value() <= force_time else VMobject())
-
-        force_arrow_b = always_redraw(lambda: Arrow(
-            start=box_b.get_right(),
-            end=box_b.get_right() + RIGHT * 0.6,
-            color=RED, buff=0, stroke_width=4,
-            max_tip_length_to_length_ratio=0.3,
-        ) if time_tracker.get_value() <= force_time else VMobject())
-
-        self.add(force_arrow_a, force_arrow_b)
-
-        # v-t 그래프 라인
-        vt_line_a = always_redraw(lambda: axes_vt.plot(
-            lambda t: -(a_A * t if t <= force_time else v_A),
-            x_range=[0, max(time_tracker.get_value(), 0.02)],
-            color=BLUE, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-
-        vt_line_b = always_redraw(lambda: axes_vt.plot(
-            lambda t: a_B * t if t <= force_time else v_B,
-            x_range=[0, max(time_tracker.get_value(), 0.02)],
-            color=RED, stroke_width=3
-        ) if time_tracker.get_value() > 0.01 else VMobject())
-
-        self.add(vt_line_a, vt_line_b)
-
-        box_a.add_updater(update_box_a)
-        box_b.add_updater(update_box_b)
-
-        # 수식 1: 힘 동일
-        info_eq1 = MathTex(r"F_A = F_B = 3\,\text{N}", font_size=24, color=WHITE)
-        info_eq1.move_to(info_origin + UP * 0.7)
-        self.play(Write(info_eq1), run_time=0.5)
-
-        self.play(time_tracker.animate.set_value(1.0), run_time=2.5, rate_func=linear)
-
-        # 수식 2: 가속도 다름
-        info_eq2a = MathTex(r"a_A = \frac{F}{m} = 3\,\text{m/s}^2", font_size=22, color=BLUE)
-        info_eq2a.move_to(info_origin + UP * 0.1)
-        info_eq2b = MathTex(r"a_B = \frac{F}{3m} = 1\,\text{m/s}^2", font_size=22, color=RED)
-        info_eq2b.move_to(info_origin + DOWN * 0.4)
-        self.play(Write(info_eq2a), run_time=0.5)
-        self.play(Write(info_eq2b), run_time=0.5)
-
-        self.play(time_tracker.animate.set_value(2.0), run_time=2.5, rate_func=linear)
-
-        box_a.clear_updaters()
-        box_b.clear_updaters()
-        label_a.clear_updaters()
-        label_b.clear_updaters()
-        mass_a_label.clear_updaters()
-        mass_b_label.clear_updaters()
-        self.remove(force_arrow_a, force_arrow_b, vt_line_a, vt_line_b)
-
-        # 최종 정적 그래프
-        final_vt_a = axes_vt.plot(
-            lambda t: -(a_A * t if t <= force_time else v_A),
-            x_range=[0, 2], color=BLUE, stroke_width=3
-        )
-        final_vt_b = axes_vt.plot(
-            lambda t: a_B * t if t <= force_time else v_B,
-            x_range=[0, 2], color=RED, stroke_width=3
-        )
-        vt_label_a = Text("A (a=3)", font_size=14, color=BLUE).next_to(axes_vt.c2p(2, -3), LEFT, buff=0.1)
-        vt_label_b = Text("B (a=1)", font_size=14, color=RED).next_to(axes_vt.c2p(2, 1), LEFT, buff=0.1)
-        self.add(final_vt_a, final_vt_b)
-        self.play(Write(vt_label_a), Write(vt_label_b), run_time=0.5)
-
-        # v-t 점선 보조선: t=1 수직, v=-3 / v=+1 수평
-        dash_vert = DashedLine(
-            axes_vt.c2p(1, -4), axes_vt.c2p(1, 2),
-            color=GRAY, stroke_width=1.5, dash_length=0.08
-        )
-        dash_h_a = DashedLine(
-            axes_vt.c2p(0, -3), axes_vt.c2p(1, -3),
-            color=BLUE, stroke_width=1.5, dash_length=0.08, stroke_opacity=0.5
-        )
-        dash_h_b = DashedLine(
-            axes_vt.c2p(0, 1), axes_vt.c2p(1, 1),
-            color=RED, stroke_width=1.5, dash_length=0.08, stroke_opacity=0.5
-        )
-        t1_label = MathTex("t=1", font_size=14, color=GRAY).next_to(axes_vt.c2p(1, -4), DOWN, buff=0.1)
-        va_label = MathTex("v=-3", font_size=14, color=BLUE).next_to(axes_vt.c2p(0, -3), LEFT, buff=0.1)
-        vb_label = MathTex("v=1", font_size=14, color=RED).next_to(axes_vt.c2p(0, 1), LEFT, buff=0.1)
-
-        self.play(
-            Create(dash_vert), Create(dash_h_a), Create(dash_h_b),
-            Write(t1_label), Write(va_label), Write(vb_label),
-            run_time=0.75
-        )
-        self.wait(0.5)
-
-        # 반전: 힘은 같다!
-        surprise = Text("힘의 크기는 동일!", font_size=28, color=YELLOW)
-        surprise.next_to(track, DOWN, buff=0.3)
-        self.play(Write(surprise), run_time=0.75)
-        self.wait(1.0)
-
-        # 수식 3: 결론
-        info_eq3 = Text("힘은 같지만 가속도는 다르다!", font_size=20, color=YELLOW)
-        info_eq3.move_to(info_origin + DOWN * 1.0)
-        self.play(FadeOut(surprise), Write(info_eq3), run_time=0.75)
-        self.wait(2.0)
+        return axes_vt
+
+    def _push_force_tex(self, model, names):
+        """접촉면마다 F = F' 한 줄 (두 물체면 F_A = F_B)"""
+        if len(names) == 2:
+            return MathTex(rf"F_{names[0]} = F_{names[1]} = {model.forces[0]:g}\,\text{{N}}",
+                           font_size=24, color=WHITE)
+        parts = [
+            rf"F_{{{a}{b}}} = F_{{{b}{a}}} = {F:g}\,\text{{N}}"
+            for a, b, F in zip(names[:-1], names[1:], model.forces)
+        ]
+        return MathTex(r",\quad ".join(parts), font_size=22, color=WHITE)
+
+    def _push_accel_texs(self, model, names, mass_texs, colors):
+        """물체별 a = F/m 수식 목록 (가속도 크기가 모두 같으면 한 줄)"""
+        accel = np.abs(model.accel)
+        if len(names) == 2 and np.allclose(accel, accel[0]):
+            return [MathTex(rf"a_{names[0]} = a_{names[1]} = {accel[0]:g}\,\text{{m/s}}^2",
+                            font_size=24, color=WHITE)]
+        numerator = "F" if len(names) == 2 else r"F_{\text{net}}"
+        return [
+            MathTex(rf"a_{name} = \frac{{{numerator}}}{{{m}}} = {a:g}\,\text{{m/s}}^2",
+                    font_size=22, color=color)
+            for name, m, a, color in zip(names, mass_texs, accel, colors)
+        ]
 
     # =========================================================
     # Phase 3: 일상 속 작용-반작용 예시
@@ -6,6 +6,13 @@ from manim import TransformMatchingTex
 from manim import *
 import numpy as np
 
+from korean_font import use_korean_font_in_manim
+from sim_mobjects import NumericLabel, SweptArea, TracedCurve, sampled_graph
+from sim_physics import ForceSchedule
+
+use_korean_font_in_manim()
+
+
 class ImpulseMomentum(Scene):
     def construct(self):
         
@@ -89,40 +96,16 @@ class ImpulseMomentum(Scene):
         mass = 2
         v0 = 1
         F_val = 4       # 절댓값으로 처리
-        a_val = F_val / mass  # 2 m/s^2
         t_accel_start = 2
         t_accel_end = 4
         t_end = 5
         obj_size = 0.5
 
-        # -- 위치 함수 --
-        def pos_func(t):
-            if t < t_accel_start:
-                return v0 * t # 2m
-            elif t <= t_accel_end:
-                dt = t - t_accel_start
-                return 2 + v0 * dt + 0.5 * a_val * dt ** 2 # 8m
-            else:
-                return pos_func(t_accel_end) + v_func(t_accel_end) * (t - t_accel_end)
-
-        # -- 속도 함수 --
-        def v_func(t):
-            if t < t_accel_start:
-                return v0
-            elif t <= t_accel_end:
-                dt = t - t_accel_start
-                return v0 + a_val * dt
-            else:
-                return v_func(t_accel_end)
-
-        # -- 힘 힘수 -- 
-        def f_func(t):
-            if t < t_accel_start:
-                return 0
-            elif t <= t_accel_end:
-                return F_val
-            else:
-                return 0
+        # -- 힘 일정표: 가속 구간에서만 F, 한 번 적분해 두고 위치·속도는 표에서 조회 --
+        schedule = ForceSchedule(mass, [(t_accel_start, t_accel_end, lambda t: F_val)], t_end, v0=v0)
+        pos_func = schedule.position   # 2m → 8m (가속 구간)
+        v_func = schedule.velocity
+        f_func = schedule.force
 
         # ── 트랙 (상단) ──
         track = NumberLine(
@@ -201,13 +184,11 @@ class ImpulseMomentum(Scene):
         self.wait(1)
 
         # -- v-t 그래프 애니메이션 --
-        vt_graph = always_redraw(lambda: 
-            vt_axis.plot(v_func, x_range=[0, time_tracker.get_value()], color=BLUE, stroke_width=3, use_smoothing=False)
-        )
+        vt_graph = TracedCurve(vt_axis, v_func, time_tracker, x_range=[0, t_end], color=BLUE, stroke_width=3)
 
         # -- f-t 그래프 애니메이션 --
         ft_graph = always_redraw(lambda:
-            ft_axis.plot(lambda t: F_val,
+            ft_axis.plot(f_func,
                 x_range=[t_accel_start, min(time_tracker.get_value(), t_accel_end)],
                 color=RED, stroke_width=3, use_smoothing=False)
             if time_tracker.get_value() > t_accel_start else VMobject()
@@ -233,11 +214,14 @@ class ImpulseMomentum(Scene):
         obj_label.clear_updaters()
         self.remove(force_arrow, force_arrow_label)
 
-        self.remove(vt_graph, ft_graph)
+        self.remove(ft_graph)
 
-        static_vt = vt_axis.plot(v_func, x_range=[0, t_end], color=BLUE, stroke_width=3, use_smoothing=False)
-        static_ft = ft_axis.plot(f_func, x_range=[t_accel_start, t_accel_end], color=RED, stroke_width=3, use_smoothing=False)
-        self.add(static_vt, static_ft)
+        static_vt = vt_graph.freeze()
+        # F-t 곡선과 넓이를 같은 표본에서 (넓이·충격량 값이 곡선과 정확히 일치)
+        ft_t = np.linspace(t_accel_start, t_accel_end, 201)
+        ft_F = f_func(ft_t)
+        static_ft = sampled_graph(ft_axis, ft_t, ft_F, color=RED, stroke_width=3)
+        self.add(static_ft)
         self.wait(0.5)
 
         # -- 점선 그리기 --
@@ -252,13 +236,14 @@ class ImpulseMomentum(Scene):
 
         x_end = ValueTracker(t_accel_start)
 
-        # -- f-t그래프 면적 --
-        area_ft = always_redraw(lambda:
-            ft_axis.get_area( static_ft,
-                x_range = [t_accel_start, x_end.get_value()],
-                color = RED,
-                opacity = 0.3
-        ))
+        # -- f-t그래프 면적 (누적 적분을 미리 계산, 오른쪽 끝만 이동) --
+        area_ft = SweptArea(ft_axis, ft_t, ft_F, color=RED, opacity=0.3)
+        area_ft.add_updater(lambda m: m.set_right(x_end.get_value()))
+
+        area_ft_label = NumericLabel("I =", decimals=1, int_if_whole=True, suffix=r"\,\text{N·s}",
+                                     font_size=30, color=WHITE)
+        area_ft_label.move_to(ft_axis.c2p((t_accel_start + t_accel_end) / 2, F_val / 2))
+        area_ft_label.add_updater(lambda m: m.set_value(area_ft.value), call_updater=True)
 
         # -- v-t그래프 위 움직이는 점 --
         vt_dot_static = Dot(vt_axis.c2p(t_accel_start, v_func(t_accel_start)), color=YELLOW)
@@ -268,12 +253,19 @@ class ImpulseMomentum(Scene):
             Dot(vt_axis.c2p(x_end.get_value(), v_func(x_end.get_value())), color=YELLOW)
             if x_end.get_value() <= t_accel_end else VMobject()
             )
-        vt_dot_label = always_redraw(
-            lambda: Text(f"v = {v_func(x_end.get_value()):.1f}", font_size=24, color=BLUE).next_to(vt_dot, RIGHT, buff=0.2).shift(UP * 0.3
-            ) if x_end.get_value() <= t_accel_end else VMobject())
+        def update_vt_dot_label(m):
+            visible = x_end.get_value() <= t_accel_end
+            m.set_fill(opacity=1 if visible else 0)
+            if visible:
+                m.set_value(v_func(x_end.get_value())).next_to(vt_dot, RIGHT, buff=0.2).shift(UP * 0.3)
+
+        vt_dot_label = NumericLabel("v =", decimals=1, font_size=24, color=BLUE)
+        vt_dot_label.add_updater(update_vt_dot_label, call_updater=True)
 
-        self.add(area_ft, vt_dot, vt_dot_label)
+        self.add(area_ft, area_ft_label, vt_dot, vt_dot_label)
         self.play(x_end.animate.set_value(t_accel_end), run_time=2, rate_func=linear)
+        area_ft.clear_updaters()
+        area_ft_label.clear_updaters()
         self.wait(0.5)
 
         계산식모음 = VGroup(
@@ -284,8 +276,6 @@ class ImpulseMomentum(Scene):
         ).set_color(YELLOW).arrange(DOWN, buff=0.2, aligned_edge=LEFT)
         계산식모음.move_to(vt_axis.c2p(0.5, 5)).shift(RIGHT * 1.5)
 
-        area_ft_label = MathTex(r"I = 8\,\text{N·s}", font_size=30, color=WHITE).move_to(area_ft.get_center())
-        self.play(Write(area_ft_label))
         self.play(Write(계산식모음))
         self.wait(1)
 
@@ -302,7 +292,6 @@ class ImpulseMomentum(Scene):
         mass = 2
         v0 = 4
         F_val = 4       # 절댓값으로 처리
-        a_val = F_val / mass  # 2 m/s^2
         t_brake = 2
         t_stop = 4
         t_end = 5
@@ -372,33 +361,13 @@ class ImpulseMomentum(Scene):
         self.play(Create(vt_axis), Write(vt_x_label), Write(vt_y_label))
         self.wait(1)
 
-        # ── 위치 함수 ──
-        def pos_func(t):
-            if t <= t_brake:
-                return v0 * t
-            elif t <= t_stop:
-                dt = t - t_brake
-                return 8 + v0 * dt - 0.5 * a_val * dt ** 2
-            else:
-                return 12
-
-        # ── 속도 함수 ──
-        def v_func(t):
-            if t <= t_brake:
-                return v0
-            elif t <= t_stop:
-                return v0 - a_val * (t - t_brake)
-            else:
-                return 0
-
-        # ── 힘 함수 ──
+        # ── 힘 일정표: 마찰 구간에서 운동 반대 방향 F (8m → 12m에서 정지) ──
+        schedule = ForceSchedule(mass, [(t_brake, t_stop, lambda t: -F_val)], t_end, v0=v0)
+        pos_func = schedule.position
+        v_func = schedule.velocity
+
         def f_func(t):
-            if t <= t_brake:
-                return 0
-            elif t < t_stop:
-                return F_val
-            else:
-                return 0
+            return np.abs(schedule.force(t))
 
         # updater 연결하기
 
@@ -408,13 +377,12 @@ class ImpulseMomentum(Scene):
 
 
         # ── 물체의 운동 애니메이션 ──
-        vt_graph = always_redraw(lambda: vt_axis.plot(v_func,
-        x_range=[0, max(time_tracker.get_value(), 0.01)], color=BLUE, stroke_width=3, use_smoothing=False))
+        vt_graph = TracedCurve(vt_axis, v_func, time_tracker, x_range=[0, t_end], color=BLUE, stroke_width=3)
 
         # F-t 그래프 그리기
         ft_graph = always_redraw(lambda:
             ft_axis.plot(
-                lambda t: F_val,
+                f_func,
                 x_range=[t_brake, time_tracker.get_value()], color=RED, stroke_width=3)
                 if time_tracker.get_value() > t_brake else VMobject()
             )
@@ -439,11 +407,13 @@ class ImpulseMomentum(Scene):
         obj.clear_updaters()
         obj_label.clear_updaters()
         self.remove(force_arrow, force_arrow_label)
-        self.remove(vt_graph, ft_graph)
+        self.remove(ft_graph)
 
-        static_vt = vt_axis.plot(v_func, x_range=[0, t_end], color=BLUE, stroke_width=3, use_smoothing=False)
-        static_ft = ft_axis.plot(f_func, x_range=[t_brake+0.01, t_stop-0.01], color=RED, stroke_width=3, use_smoothing=False)
-        self.add(static_vt, static_ft)
+        static_vt = vt_graph.freeze()
+        ft_t = np.linspace(t_brake, t_stop, 201)
+        ft_F = f_func(ft_t)
+        static_ft = sampled_graph(ft_axis, ft_t, ft_F, color=RED, stroke_width=3)
+        self.add(static_ft)
         self.wait(1)
 
         # 점선 그리기
@@ -456,10 +426,14 @@ class ImpulseMomentum(Scene):
 
         x_end = ValueTracker(t_brake)
 
-        # F-t그래프 면적 그리기
-        area_ft = always_redraw(lambda: ft_axis.get_area(
-            static_ft, x_range=[t_brake, x_end.get_value()], color=RED, opacity=0.3
-        ) if x_end.get_value() > t_brake else VMobject() )
+        # F-t그래프 면적 그리기 (누적 적분을 미리 계산, 오른쪽 끝만 이동)
+        area_ft = SweptArea(ft_axis, ft_t, ft_F, color=RED, opacity=0.3)
+        area_ft.add_updater(lambda m: m.set_right(x_end.get_value()))
+
+        area_ft_label = NumericLabel("I =", decimals=1, int_if_whole=True, suffix=r"[N \cdot s]",
+                                     font_size=30, color=WHITE)
+        area_ft_label.move_to(ft_axis.c2p((t_brake + t_stop) / 2, F_val / 2))
+        area_ft_label.add_updater(lambda m: m.set_value(area_ft.value), call_updater=True)
 
         # 정적 점 먼저 등장시키기
         vt_dot_static = Dot(vt_axis.c2p(t_brake, v_func(t_brake)), color=YELLOW)
@@ -470,12 +444,19 @@ class ImpulseMomentum(Scene):
             lambda: Dot(vt_axis.c2p(x_end.get_value(), v_func(x_end.get_value())), color=YELLOW)
         if x_end.get_value() > t_brake else VMobject())
 
-        vt_dot_label = always_redraw(
-            lambda: Text(f"v = {v_func(x_end.get_value()):.1f}", font_size=24, color=BLUE).next_to(vt_dot, RIGHT, buff=0.2).shift(UP * 0.3
-            ) if x_end.get_value() > t_brake else VMobject())
+        def update_vt_dot_label(m):
+            visible = x_end.get_value() > t_brake
+            m.set_fill(opacity=1 if visible else 0)
+            if visible:
+                m.set_value(v_func(x_end.get_value())).next_to(vt_dot, RIGHT, buff=0.2).shift(UP * 0.3)
+
+        vt_dot_label = NumericLabel("v =", decimals=1, font_size=24, color=BLUE)
+        vt_dot_label.add_updater(update_vt_dot_label, call_updater=True)
 
-        self.add(area_ft, vt_dot, vt_dot_label)
+        self.add(area_ft, area_ft_label, vt_dot, vt_dot_label)
         self.play(x_end.animate.set_value(t_stop), run_time = 2, rate_func=linear)
+        area_ft.clear_updaters()
+        area_ft_label.clear_updaters()
         self.wait(1)
 
 
@@ -486,9 +467,6 @@ class ImpulseMomentum(Scene):
             MathTex(r"I = |\Delta p| = 8[N \cdot s]", font_size=24)
         ).set_color(YELLOW).arrange(DOWN, buff=0.2, aligned_edge=LEFT).move_to(vt_axis.c2p(4, 4)).shift(RIGHT * 1)
 
-        # 면적 계산식 라벨링
-        area_ft_label = MathTex(r"I = 8[N \cdot s] ", font_size=30, color=WHITE).move_to(area_ft.get_center())
-        self.play(Write(area_ft_label))
         self.play(Write(계산식모음))
         self.wait(1)
 